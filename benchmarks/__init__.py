@@ -0,0 +1 @@
+"""tkviews performance benchmarks"""
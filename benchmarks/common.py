@@ -0,0 +1,158 @@
+"""Benchmarks helpers"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from json import dump
+from os.path import join
+from statistics import median
+from time import perf_counter
+from tkinter import Misc, Tk, TkVersion
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tkviews import __version__
+from tkviews.core import BatchTkapp
+from tkviews.headless import FakeTk
+
+Scenario = Callable[[int], Dict[str, str]]
+
+
+class TclCallCounter:
+    """Tcl interpreter proxy that counts calls"""
+
+    def __init__(self, tkapp: Any):
+        self._tkapp = tkapp
+        self.count: int = 0
+
+    def call(self, *args):
+        self.count += 1
+        return self._tkapp.call(*args)
+
+    def eval(self, script: str):
+        self.count += 1
+        return self._tkapp.eval(script)
+
+    def getvar(self, *args):
+        self.count += 1
+        return self._tkapp.getvar(*args)
+
+    def setvar(self, *args):
+        self.count += 1
+        return self._tkapp.setvar(*args)
+
+    def globalgetvar(self, *args):
+        self.count += 1
+        return self._tkapp.globalgetvar(*args)
+
+    def globalsetvar(self, *args):
+        self.count += 1
+        return self._tkapp.globalsetvar(*args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._tkapp, name)
+
+
+def write_views(folder: str, views: Dict[str, str]):
+    """Writes views sources to folder"""
+    for name, source in views.items():
+        with open(join(folder, f'{name}.xml'), 'w', encoding = 'utf-8') as view_file:
+            view_file.write(source)
+
+
+def measure_peak_memory(run: Callable[[], Any]) -> int:
+    """Returns peak memory in bytes allocated by python during run"""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_memory_per_run(run: Callable[[int], Any], count: int) -> Tuple[float, float]:
+    """
+    Calls run count times with run index. Returns mean peak memory in bytes allocated by python during one run
+    and memory in bytes retained after all runs divided by count
+    """
+    peaks = 0
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run(index)
+            peaks += tracemalloc.get_traced_memory()[1] - current
+        retained = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return peaks / count, retained / count
+
+
+def timed(run: Callable[[], Any]) -> float:
+    """Returns run duration in milliseconds"""
+    start = perf_counter()
+    run()
+    return (perf_counter() - start) * 1000
+
+
+def summarize(durations: List[float]) -> dict:
+    """Returns min, median and max of durations"""
+    return {'min_ms': min(durations), 'median_ms': median(durations), 'max_ms': max(durations)}
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Returns nearest rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def get_environment() -> dict:
+    """Returns versions used for benchmark"""
+    return {'python': sys.version.split()[0], 'tk': TkVersion, 'tkviews': __version__}
+
+
+def create_root(headless: bool = False, batching: bool = False) -> Tuple[Tk, TclCallCounter]:
+    """Creates tkinter root, in-memory one for headless run, with Tcl calls counter"""
+    root = FakeTk() if headless else Tk()
+    root.withdraw()
+    counter = TclCallCounter(root.tk)
+    root.tk = BatchTkapp(counter) if batching else counter
+    return root, counter
+
+
+def flush_batch(widget: Misc):
+    """Executes collected Tcl commands if batching is used"""
+    if isinstance(widget.tk, BatchTkapp):
+        widget.tk.flush()
+
+
+def create_parser(description: str, scenarios: Dict[str, Any], size: int) -> ArgumentParser:
+    """Returns common benchmark arguments parser"""
+    parser = ArgumentParser(description = description)
+    parser.add_argument('scenarios', nargs = '*', help = f'scenarios to run: {", ".join(scenarios)}. All by default')
+    parser.add_argument('--size', type = int, default = size, help = 'scenario size')
+    parser.add_argument('--output', help = 'json file for results, stdout by default')
+    parser.add_argument('--headless', action = 'store_true', help = 'use in-memory tkinter backend without display')
+    parser.add_argument('--batching', action = 'store_true', help = 'collect widgets options changes to batches')
+    return parser
+
+
+def get_scenarios(parser: ArgumentParser, args: Namespace, scenarios: Dict[str, Any]) -> List[str]:
+    """Returns names of scenarios to run"""
+    unknown = [name for name in args.scenarios if name not in scenarios]
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(unknown)}')
+    return args.scenarios if args.scenarios else list(scenarios)
+
+
+def write_results(results: Dict[str, dict], output: Optional[str] = None, **parameters):
+    """Writes results as json"""
+    report = {'environment': get_environment(), 'parameters': parameters, 'scenarios': results}
+    if output:
+        with open(output, 'w', encoding = 'utf-8') as output_file:
+            dump(report, output_file, indent = 2)
+    else:
+        dump(report, sys.stdout, indent = 2)
+        sys.stdout.write('\n')
@@ -0,0 +1,163 @@
+"""
+Rendering benchmarks.
+Renders synthetic views and reports wall time, Tcl calls count and peak memory per scenario.
+
+Run with display, for example under Xvfb:
+    xvfb-run python -m benchmarks.render --size 1000 --output render.json
+or with in-memory tkinter backend to compare Tcl calls without display:
+    python -m benchmarks.render --headless
+"""
+
+from tempfile import TemporaryDirectory
+from tkinter import Tk
+from typing import Dict
+
+from injectool import add_singleton, use_container
+from pyviews.core.rendering import Node, NodeGlobals
+from pyviews.rendering.pipeline import render_view
+
+from benchmarks.common import Scenario, TclCallCounter, create_parser, create_root, get_scenarios, \
+    measure_peak_memory, summarize, timed, write_results, write_views
+from tkviews.app import register_dependencies
+from tkviews.core import TkRenderingContext, get_expression_cache, get_views_cache
+
+_NAMESPACES = 'xmlns="tkinter" xmlns:tkv="tkviews" xmlns:call="tkviews.call" ' \
+              'xmlns:import="tkviews.import_global" import:args="tkviews.call_args"'
+
+
+def wide(size: int) -> Dict[str, str]:
+    """Frame with size labels"""
+    labels = '\n'.join(f'<Label text="label {i}" call:pack="{{args()}}"/>' for i in range(size))
+    return {'root': f'<Frame {_NAMESPACES}>\n{labels}\n</Frame>'}
+
+
+def deep(size: int) -> Dict[str, str]:
+    """size nested frames"""
+    opening = '\n'.join('<Frame call:pack="{args()}">' for _ in range(size))
+    closing = '\n'.join('</Frame>' for _ in range(size))
+    return {'root': f'<tkv:Container {_NAMESPACES}>\n{opening}\n<Label text="leaf"/>\n{closing}\n</tkv:Container>'}
+
+
+def for_list(size: int) -> Dict[str, str]:
+    """For with size items"""
+    return {
+        'root': f'''<Frame {_NAMESPACES}>
+    <tkv:For items="{{list(range({size}))}}">
+        <Label text="{{f'item {{item}}'}}" call:pack="{{args()}}"/>
+    </tkv:For>
+</Frame>'''
+    }
+
+
+def styles(size: int) -> Dict[str, str]:
+    """size labels with styles applied"""
+    items = '\n'.join(
+        f'<tkv:Style name="style_{i}" foreground="black" background="white" call:pack="{{args()}}"/>'
+        for i in range(10)
+    )
+    labels = '\n'.join(f'<Label styles:_="style_{i % 10}" text="label {i}"/>' for i in range(size))
+    return {
+        'styles': f'<tkv:Container {_NAMESPACES}>\n{items}\n</tkv:Container>',
+        'root': f'''<Frame {_NAMESPACES} xmlns:styles="tkviews.apply_styles">
+    <tkv:StylesView name="styles"/>
+    {labels}
+</Frame>'''
+    }
+
+
+def canvas(size: int) -> Dict[str, str]:
+    """Canvas with size rectangles"""
+    return {
+        'root': f'''<Canvas {_NAMESPACES} xmlns:canvas="tkviews.canvas">
+    <tkv:For items="{{list(range({size}))}}">
+        <canvas:Rectangle place="{{[item % 100, item // 100, item % 100 + 5, item // 100 + 5]}}" fill="black"/>
+    </tkv:For>
+</Canvas>'''
+    }
+
+
+def listbox(size: int) -> Dict[str, str]:
+    """Listbox with size items"""
+    return {
+        'root': f'''<Listbox {_NAMESPACES}>
+    <tkv:For items="{{list(range({size}))}}">
+        <tkv:ListboxItem index="{{index}}" value="{{item}}"/>
+    </tkv:For>
+</Listbox>'''
+    }
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    'wide': wide,
+    'deep': deep,
+    'for': for_list,
+    'styles': styles,
+    'canvas': canvas,
+    'listbox': listbox
+}
+
+_DEEP_LIMIT = 50
+
+
+def run_scenario(scenario: Scenario, size: int, repeat: int, headless: bool = False, batching: bool = False) -> dict:
+    """Renders scenario views and returns measurements"""
+    with TemporaryDirectory() as views_folder:
+        write_views(views_folder, scenario(size))
+        with use_container():
+            register_dependencies()
+            add_singleton('views_folder', views_folder)
+            root, counter = create_root(headless, batching)
+            try:
+                return _measure(root, counter, repeat)
+            finally:
+                root.destroy()
+
+
+def _measure(root: Tk, counter: TclCallCounter, repeat: int) -> dict:
+    get_views_cache().clear()
+    get_expression_cache().clear()
+    cold = timed(lambda: _render(root).destroy())
+
+    durations, calls = [], []
+    for _ in range(repeat):
+        counter.count = 0
+        nodes = []
+        durations.append(timed(lambda rendered = nodes: rendered.append(_render(root))))
+        calls.append(counter.count)
+        nodes[0].destroy()
+
+    return {
+        'startup_ms': cold,
+        **summarize(durations),
+        'tcl_calls': max(calls),
+        'peak_memory_bytes': measure_peak_memory(lambda: _render(root).destroy())
+    }
+
+
+def _render(root: Tk) -> Node:
+    node = render_view('root', TkRenderingContext({'master': root, 'node_globals': NodeGlobals()}))
+    root.update_idletasks()
+    return node
+
+
+def main():
+    """Runs rendering benchmarks"""
+    parser = create_parser('tkviews rendering benchmarks', SCENARIOS, 1000)
+    parser.add_argument('--repeat', type = int, default = 5, help = 'count of measured runs')
+    args = parser.parse_args()
+    results = {}
+    for name in get_scenarios(parser, args, SCENARIOS):
+        size = min(args.size, _DEEP_LIMIT) if name == 'deep' else args.size
+        results[name] = {'size': size, **run_scenario(SCENARIOS[name], size, args.repeat, args.headless, args.batching)}
+    write_results(
+        results,
+        args.output,
+        size = args.size,
+        repeat = args.repeat,
+        headless = args.headless,
+        batching = args.batching
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Update throughput benchmarks.
+Changes bound model properties, two ways bound variables, canvas items and generates events,
+reports updates per second, latency percentiles, Tcl calls and memory per update.
+Updates are applied synchronously, so latency is time from model or variable change to Tk option applied.
+
+Run with display, for example under Xvfb:
+    xvfb-run python -m benchmarks.updates --size 100 --updates 10000 --output updates.json
+or with in-memory tkinter backend to compare Tcl calls without display:
+    python -m benchmarks.updates --headless
+"""
+
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from injectool import add_singleton, use_container
+from pyviews.core.binding import BindableEntity
+from pyviews.core.rendering import Node, NodeGlobals
+from pyviews.rendering.pipeline import render_view
+
+from benchmarks.common import TclCallCounter, create_parser, create_root, flush_batch, get_scenarios, \
+    measure_memory_per_run, percentile, write_results, write_views
+from tkviews.app import register_dependencies
+from tkviews.core import TkRenderingContext
+
+_NAMESPACES = 'xmlns="tkinter" xmlns:tkv="tkviews" xmlns:bind="tkviews.bind"'
+
+
+class Model(BindableEntity):
+    """Bindable model with values v0, v1, ..."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        for index in range(size):
+            setattr(self, f'v{index}', 0)
+        self.text = ''
+        self.number = 0.0
+        self.fill = 'black'
+        self.clicks = 0
+
+    def click(self, _):
+        """Event handler"""
+        self.clicks += 1
+
+
+class Updates(NamedTuple):
+    """Scenario view and update function"""
+    view: str
+    update: Callable[[Node, Model, int], None]
+
+
+def oneway(size: int) -> Updates:
+    """size labels bound to model values, every update changes one value"""
+    labels = '\n'.join(f'<Label text="{{vm.v{i}}}"/>' for i in range(size))
+    return Updates(
+        f'<Frame {_NAMESPACES}>\n{labels}\n</Frame>',
+        lambda node, model, index: setattr(model, f'v{index % size}', index)
+    )
+
+
+def _set_model(name: str, convert: Callable[[int], Any]) -> Callable[[Node, Model, int], None]:
+    return lambda node, model, index: setattr(model, name, convert(index))
+
+
+def _set_variable(variable_key: str) -> Callable[[Node, Model, int], None]:
+
+    def _update(node: Node, _: Model, index: int):
+        widget = node.children[0].instance
+        widget.setvar(str(widget.cget(variable_key)), str(index))
+
+    return _update
+
+
+def entry_model(_: int) -> Updates:
+    """Entry two ways bound to model, model is changed"""
+    return Updates(f'<Frame {_NAMESPACES}><Entry textvariable="{{{{vm.text}}}}"/></Frame>', _set_model('text', str))
+
+
+def entry_widget(_: int) -> Updates:
+    """Entry two ways bound to model, variable is changed as by user input"""
+    return Updates(
+        f'<Frame {_NAMESPACES}><Entry textvariable="{{{{vm.text}}}}"/></Frame>', _set_variable('textvariable')
+    )
+
+
+def scale_model(_: int) -> Updates:
+    """Scale two ways bound to model, model is changed"""
+    return Updates(
+        f'<Frame {_NAMESPACES}><Scale from_="0" to="1000000" variable="{{{{vm.number}}}}"/></Frame>',
+        _set_model('number', float)
+    )
+
+
+def spinbox_model(_: int) -> Updates:
+    """Spinbox two ways bound to model, model is changed"""
+    return Updates(
+        f'<Frame {_NAMESPACES}><Spinbox from_="0" to="1000000" textvariable="{{{{vm.text}}}}"/></Frame>',
+        _set_model('text', str)
+    )
+
+
+def canvas_storm(size: int) -> Updates:
+    """size canvas rectangles bound to one model value, every update reconfigures all items"""
+    return Updates(
+        f'''<Canvas {_NAMESPACES} xmlns:canvas="tkviews.canvas">
+    <tkv:For items="{{list(range({size}))}}">
+        <canvas:Rectangle place="{{[item, item, item + 5, item + 5]}}" fill="{{vm.fill}}"/>
+    </tkv:For>
+</Canvas>''',
+        lambda node, model, index: setattr(model, 'fill', 'black' if index % 2 else 'white')
+    )
+
+
+def events(_: int) -> Updates:
+    """Events generated for button with bound handler"""
+    return Updates(
+        f'<Frame {_NAMESPACES}><Button bind:Button-1="{{vm.click}}"/></Frame>',
+        lambda node, model, index: node.children[0].instance.event_generate('<Button-1>')
+    )
+
+
+SCENARIOS: Dict[str, Callable[[int], Updates]] = {
+    'oneway': oneway,
+    'entry_model': entry_model,
+    'entry_widget': entry_widget,
+    'scale_model': scale_model,
+    'spinbox_model': spinbox_model,
+    'canvas_storm': canvas_storm,
+    'events': events
+}
+
+
+def run_scenario(
+    scenario: Callable[[int], Updates], size: int, count: int, headless: bool = False, batching: bool = False
+) -> dict:
+    """Renders scenario view and measures updates"""
+    updates = scenario(size)
+    with TemporaryDirectory() as views_folder:
+        write_views(views_folder, {'root': updates.view})
+        with use_container():
+            register_dependencies()
+            add_singleton('views_folder', views_folder)
+            root, counter = create_root(headless, batching)
+            try:
+                model = Model(size)
+                context = TkRenderingContext({'master': root, 'node_globals': NodeGlobals({'vm': model})})
+                node = render_view('root', context)
+                node.instance.pack()
+                root.update()
+                return _measure(node, model, _flushed(updates.update), counter, count)
+            finally:
+                root.destroy()
+
+
+def _flushed(update: Callable[[Node, Model, int], None]) -> Callable[[Node, Model, int], None]:
+
+    def _update(node: Node, model: Model, index: int):
+        update(node, model, index)
+        flush_batch(node.instance)
+
+    return _update
+
+
+def _measure(node: Node, model: Model, update: Callable[[Node, Model, int], None], counter: TclCallCounter,
+             count: int) -> dict:
+    for index in range(min(count, 100)):
+        update(node, model, index)
+
+    latencies: List[float] = []
+    counter.count = 0
+    start = perf_counter()
+    for index in range(count):
+        update_start = perf_counter()
+        update(node, model, index)
+        latencies.append((perf_counter() - update_start) * 1000)
+    duration = perf_counter() - start
+    tcl_calls = counter.count
+
+    peak_bytes, retained_bytes = measure_memory_per_run(lambda index: update(node, model, index), count)
+
+    return {
+        'updates': count,
+        'updates_per_second': count / duration,
+        'latency_p50_ms': percentile(latencies, 50),
+        'latency_p90_ms': percentile(latencies, 90),
+        'latency_p99_ms': percentile(latencies, 99),
+        'latency_max_ms': max(latencies),
+        'tcl_calls_per_update': tcl_calls / count,
+        'peak_bytes_per_update': peak_bytes,
+        'retained_bytes_per_update': retained_bytes
+    }
+
+
+def main():
+    """Runs update benchmarks"""
+    parser = create_parser('tkviews update throughput benchmarks', SCENARIOS, 100)
+    parser.add_argument('--updates', type = int, default = 10000, help = 'count of updates')
+    args = parser.parse_args()
+    results = {}
+    for name in get_scenarios(parser, args, SCENARIOS):
+        measurements = run_scenario(SCENARIOS[name], args.size, args.updates, args.headless, args.batching)
+        results[name] = {'size': args.size, **measurements}
+    write_results(
+        results,
+        args.output,
+        size = args.size,
+        updates = args.updates,
+        headless = args.headless,
+        batching = args.batching
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ from injectool import use_container
 from pytest import fixture
 from pyviews.binding.config import use_binding
 
+from tkviews.core.expression import use_cached_expressions
 from tkviews.widgets import use_variables_binding
 
 
@@ -19,4 +20,5 @@ def container_fixture(request):
 @fixture
 def binder_fixture(container_fixture):
     use_binding()
+    use_cached_expressions()
     use_variables_binding()
@@ -0,0 +1,5 @@
+"""tkviews command line tools"""
+
+from tkviews.compiler import main
+
+main()
@@ -1,6 +1,6 @@
 """tkinter application entry point"""
 
-from typing import Optional, cast
+from typing import Callable, Optional, Tuple, cast
 
 from injectool import add_singleton
 from pyviews.binding.config import use_binding
@@ -13,7 +13,12 @@ from pyviews.rendering.pipeline import RenderingPipeline, render_view, use_pipel
 from pyviews.rendering.config import use_rendering
 
 from tkviews.canvas import get_canvas_pipeline
+from tkviews.core.dispatcher import get_dispatcher
+from tkviews.core.eventloop import run_tk
+from tkviews.core.expression import use_cached_expressions
 from tkviews.core.rendering import TkRenderingContext, get_tk_child_context
+from tkviews.core.views import render_tk_view
+from tkviews.diagnostics.watchdog import use_watchdog
 from tkviews.listbox import get_listboxitem_pipeline
 from tkviews.styles import get_style_pipeline, get_styles_view_pipeline
 from tkviews.widgets import Root, get_root_pipeline, get_widget_pipeline, use_variables_binding
@@ -24,6 +29,7 @@ def register_dependencies():
     """Registers all dependencies needed for application"""
     use_rendering()
     use_binding()
+    use_cached_expressions()
     use_variables_binding()
     use_tkviews_pipelines()
 
@@ -31,9 +37,10 @@ def register_dependencies():
 def use_tkviews_pipelines():
     """Adds rendering pipelines for tkviews"""
     add_singleton(get_child_context, get_tk_child_context)
+    add_singleton(render_view, render_tk_view)
     use_pipeline(get_root_pipeline(), 'tkviews.Root')
-    use_pipeline(get_widget_pipeline(), 'tkinter')
-    use_pipeline(get_widget_pipeline(), 'tkinter.ttk')
+    use_pipeline(get_widget_pipeline(fused = True), 'tkinter')
+    use_pipeline(get_widget_pipeline(fused = True), 'tkinter.ttk')
     use_pipeline(get_presenter_pipeline(), 'tkviews.PresenterNode')
 
     use_pipeline(get_container_pipeline(), 'tkviews.Container')
@@ -50,9 +57,53 @@ def use_tkviews_pipelines():
     use_pipeline(RenderingPipeline(pipes = [run_code]), 'tkviews.Code')
 
 
-def launch(root_view: str, view_globals: Optional[dict] = None):
-    """Runs application. Widgets are created from passed xml_files"""
+def launch(root_view: str, view_globals: Optional[dict] = None, stall_threshold: Optional[float] = None):
+    """
+    Runs application. Widgets are created from passed xml_files.
+    If stall_threshold is passed, main loop stalls longer than threshold in milliseconds are logged.
+    Dispatcher registered by use_dispatcher is started, background threads can queue callables to it
+    """
+    root, stop = _start(root_view, view_globals, stall_threshold)
+    try:
+        root.instance.mainloop()
+    finally:
+        stop()
+
+
+async def launch_async(
+    root_view: str,
+    view_globals: Optional[dict] = None,
+    stall_threshold: Optional[float] = None,
+    max_interval: float = 10
+):
+    """
+    Runs application in running asyncio event loop until root widget is destroyed.
+    Tkinter events are processed by coroutine, idle checks are done at most every max_interval milliseconds
+    """
+    root, stop = _start(root_view, view_globals, stall_threshold)
+    try:
+        await run_tk(root.instance, max_interval)
+    finally:
+        stop()
+
+
+def _start(
+    root_view: str,
+    view_globals: Optional[dict],
+    stall_threshold: Optional[float]
+) -> Tuple[Root, Callable[[], None]]:
     root_view = 'root' if root_view is None else root_view
     rendering_context = TkRenderingContext({'node_globals': NodeGlobals(view_globals)} if view_globals else {})
     root: Root = cast(Root, render_view(root_view, rendering_context))
-    root.instance.mainloop()
+    dispatcher = get_dispatcher()
+    if dispatcher is not None:
+        dispatcher.start(root.instance)
+    watchdog = use_watchdog(root.instance, stall_threshold) if stall_threshold is not None else None
+
+    def stop():
+        if dispatcher is not None:
+            dispatcher.stop()
+        if watchdog is not None:
+            watchdog.stop()
+
+    return root, stop
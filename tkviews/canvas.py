@@ -10,6 +10,7 @@ from pyviews.core.xml import XmlNode
 from pyviews.pipes import apply_attributes
 from pyviews.rendering.pipeline import RenderingPipeline, get_type
 
+from tkviews.core.batch import run_deferred
 from tkviews.core.rendering import TkRenderingContext
 
 
@@ -43,7 +44,9 @@ class CanvasItemNode(Node, ABC):
     def config(self, **options):
         """Calls itemconfig of canvas"""
         if self.item_id is not None:
-            self._canvas.itemconfig(self.item_id, **options)
+            run_deferred(
+                self._canvas, self._canvas.itemconfig, self.item_id, view_info = self.xml_node.view_info, **options
+            )
 
     def destroy(self):
         """Removes element from canvas"""
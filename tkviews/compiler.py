@@ -0,0 +1,112 @@
+"""Compiles xml views to python modules"""
+
+from argparse import ArgumentParser
+from importlib.util import MAGIC_NUMBER
+from marshal import dumps
+from os import makedirs, walk
+from os.path import dirname, join, relpath, splitext
+from typing import Iterator, List, Optional, Tuple
+
+from pyviews.core.expression import ExpressionError, is_expression, parse_expression
+from pyviews.core.xml import XmlNode, parse
+
+from tkviews.core.views import COMPILED_FOLDER, get_compiled_path
+
+CompiledSource = Tuple[str, str, str, bytes]
+
+
+def compile_views(views_folder: str, view_ext: str = 'xml') -> List[str]:
+    """Compiles all views from views folder and returns paths to compiled modules"""
+    compiled_paths = []
+    for view_name in _find_views(views_folder, view_ext):
+        xml_path = join(views_folder, f'{view_name}.{view_ext}')
+        compiled_path = get_compiled_path(views_folder, view_name)
+        makedirs(dirname(compiled_path), exist_ok = True)
+        with open(compiled_path, 'w', encoding = 'utf-8') as compiled_file:
+            compiled_file.write(compile_view(xml_path, view_name))
+        compiled_paths.append(compiled_path)
+    return compiled_paths
+
+
+def _find_views(views_folder: str, view_ext: str) -> Iterator[str]:
+    for folder, folders, files in walk(views_folder):
+        folders[:] = [name for name in folders if name != COMPILED_FOLDER and not name.startswith('.')]
+        for file_name in files:
+            name, ext = splitext(file_name)
+            if ext == f'.{view_ext}':
+                yield relpath(join(folder, name), views_folder).replace('\\', '/')
+
+
+def compile_view(xml_path: str, view_name: str) -> str:
+    """Returns source of python module that contains parsed view and compiled expressions"""
+    with open(xml_path, 'rb') as xml_file:
+        root = parse(xml_file, view_name)
+    lines = [
+        f'"""Compiled "{view_name}" view. Generated by tkviews compiler, do not edit"""',
+        '# pylint: skip-file',
+        'from pyviews.core.error import ViewInfo',
+        'from pyviews.core.xml import XmlAttr, XmlNode',
+        '',
+        f'MAGIC = {MAGIC_NUMBER!r}',
+        'EXPRESSIONS = [',
+        *[f'    {expression!r},' for expression in _compile_expressions(root)],
+        ']',
+        ''
+    ]
+    root_variable = _add_nodes(root, lines, [0])
+    lines.append(f'ROOT = {root_variable}')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _add_nodes(xml_node: XmlNode, lines: List[str], counter: List[int]) -> str:
+    children = [_add_nodes(child, lines, counter) for child in xml_node.children]
+    attrs = [f'XmlAttr({attr.name!r}, {attr.value!r}, {attr.namespace!r})' for attr in xml_node.attrs]
+    view_info = f'ViewInfo({xml_node.view_info.view!r}, {xml_node.view_info.line!r})'
+    variable = f'node_{counter[0]}'
+    counter[0] += 1
+    lines.append(
+        f'{variable} = XmlNode({xml_node.namespace!r}, {xml_node.name!r}, {xml_node.text!r}, '
+        f'[{", ".join(children)}], [{", ".join(attrs)}], {view_info})'
+    )
+    return variable
+
+
+def _compile_expressions(root: XmlNode) -> List[CompiledSource]:
+    sources = {}
+    for xml_node in _iterate(root):
+        for attr in xml_node.attrs:
+            if attr.value and attr.value not in sources and is_expression(attr.value):
+                compiled = _compile_expression(attr.value)
+                if compiled:
+                    sources[attr.value] = compiled
+    return list(sources.values())
+
+
+def _iterate(xml_node: XmlNode) -> Iterator[XmlNode]:
+    yield xml_node
+    for child in xml_node.children:
+        yield from _iterate(child)
+
+
+def _compile_expression(source: str) -> Optional[CompiledSource]:
+    try:
+        binding_type, body = parse_expression(source)
+        code = compile(body if body.strip(' ') else 'None', '<string>', 'eval')
+    except (ExpressionError, SyntaxError):
+        return None
+    return source, binding_type, body, dumps(code)
+
+
+def main(args: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = ArgumentParser(prog = 'tkviews', description = 'tkviews command line tools')
+    commands = parser.add_subparsers(dest = 'command')
+    commands.required = True
+    compile_parser = commands.add_parser('compile', help = 'compiles xml views to python modules')
+    compile_parser.add_argument('views_folder', help = 'folder with views')
+    compile_parser.add_argument('--ext', default = 'xml', help = 'views files extension')
+
+    parsed = parser.parse_args(args)
+    for compiled_path in compile_views(parsed.views_folder, parsed.ext):
+        print(compiled_path)
@@ -0,0 +1,243 @@
+"""Containers that keep hidden content alive"""
+
+from collections import OrderedDict
+from functools import partial
+from tkinter import TclError, Widget
+from typing import Any, Hashable, Iterator, List, Optional, Tuple
+
+from pyviews.containers import If, View, render_if, render_view_content
+from pyviews.core.binding import Binding
+from pyviews.core.rendering import Node
+from pyviews.pipes import apply_attributes
+from pyviews.rendering.pipeline import RenderingPipeline
+
+from tkviews.core.rendering import TkRenderingContext
+from tkviews.widgets.node import WidgetNode
+
+
+class HiddenContent:
+    """Container content that is removed from screen with paused bindings"""
+
+    def __init__(self, nodes: List[Node]):
+        self.nodes: List[Node] = nodes
+        self.cost: int = sum(1 for _ in _iterate_nodes(nodes))
+        self._placements: List[Tuple[Widget, str, dict]] = []
+
+    def hide(self):
+        """Unmaps widgets and pauses bindings"""
+        for node in _iterate_nodes(self.nodes):
+            for binding in _get_bindings(node):
+                binding.destroy()
+        for widget_node in _get_top_widgets(self.nodes):
+            placement = _forget(widget_node.instance)
+            if placement:
+                self._placements.append(placement)
+
+    def show(self):
+        """Restores widgets and bindings"""
+        for widget, manager, info in reversed(self._placements):
+            _restore(widget, manager, info)
+        self._placements = []
+        for node in _iterate_nodes(self.nodes):
+            for binding in _get_bindings(node):
+                binding.bind()
+
+    def destroy(self):
+        """Destroys hidden nodes"""
+        for node in self.nodes:
+            node.destroy()
+        self.nodes = []
+
+
+def _iterate_nodes(nodes: List[Node]) -> Iterator[Node]:
+    for node in nodes:
+        yield node
+        yield from _iterate_nodes(node.children)
+
+
+def _get_bindings(node: Node) -> List[Binding]:
+    return node._bindings  # pylint: disable=protected-access
+
+
+def _get_top_widgets(nodes: List[Node]) -> Iterator[WidgetNode]:
+    for node in nodes:
+        if isinstance(node, WidgetNode):
+            yield node
+        else:
+            yield from _get_top_widgets(node.children)
+
+
+def _forget(widget: Widget) -> Optional[Tuple[Widget, str, dict]]:
+    manager = widget.winfo_manager()
+    if manager == 'pack':
+        info = widget.pack_info()
+        info.update(_get_pack_position(widget, info.get('in', widget.master)))
+        widget.pack_forget()
+    elif manager == 'grid':
+        info = {}
+        widget.grid_remove()
+    elif manager == 'place':
+        info = widget.place_info()
+        widget.place_forget()
+    else:
+        return None
+    return widget, manager, info
+
+
+def _get_pack_position(widget: Widget, master: Widget) -> dict:
+    """Returns next packed sibling as "before" or previous as "after" option"""
+    slaves = master.pack_slaves()
+    if widget not in slaves:
+        return {}
+    index = slaves.index(widget)
+    if index + 1 < len(slaves):
+        return {'before': slaves[index + 1]}
+    return {'after': slaves[index - 1]} if index > 0 else {}
+
+
+def _is_packed(widget: Widget) -> bool:
+    try:
+        return widget.winfo_manager() == 'pack'
+    except TclError:
+        return False
+
+
+def _restore(widget: Widget, manager: str, info: dict):
+    if manager == 'pack':
+        info = {key: value for key, value in info.items() if key not in ('before', 'after') or _is_packed(value)}
+        widget.pack(**info)
+    elif manager == 'grid':
+        widget.grid()
+    else:
+        widget.place(**info)
+
+
+class KeepAliveCache:
+    """Stores hidden content and destroys least recently used if count or cost is exceeded"""
+
+    def __init__(self, max_count: Optional[int] = None, max_cost: Optional[int] = None):
+        self._items: 'OrderedDict[Hashable, HiddenContent]' = OrderedDict()
+        self._max_count: Optional[int] = max_count
+        self._max_cost: Optional[int] = max_cost
+        self._cost: int = 0
+
+    @property
+    def count(self) -> int:
+        """Count of stored contents"""
+        return len(self._items)
+
+    @property
+    def cost(self) -> int:
+        """Estimated cost of stored contents"""
+        return self._cost
+
+    def store(self, key: Hashable, nodes: List[Node]):
+        """Hides and stores nodes"""
+        self._remove(key)
+        content = HiddenContent(nodes)
+        content.hide()
+        self._items[key] = content
+        self._cost += content.cost
+        self._evict()
+
+    def restore(self, key: Hashable) -> Optional[List[Node]]:
+        """Shows and returns stored nodes"""
+        content = self._items.pop(key, None)
+        if content is None:
+            return None
+        self._cost -= content.cost
+        content.show()
+        return content.nodes
+
+    def _remove(self, key: Hashable):
+        content = self._items.pop(key, None)
+        if content is not None:
+            self._cost -= content.cost
+            content.destroy()
+
+    def _evict(self):
+        while self._items and self._is_exceeded():
+            _, content = self._items.popitem(last = False)
+            self._cost -= content.cost
+            content.destroy()
+
+    def _is_exceeded(self) -> bool:
+        if self._max_count is not None and len(self._items) > self._max_count:
+            return True
+        return self._max_cost is not None and self._cost > self._max_cost
+
+    def clear(self):
+        """Destroys all stored contents"""
+        for content in self._items.values():
+            content.destroy()
+        self._items.clear()
+        self._cost = 0
+
+
+def get_keep_alive_view_pipeline(max_count: Optional[int] = None, max_cost: Optional[int] = None) -> RenderingPipeline:
+    """Returns setup for View that hides previous views instead of destroying"""
+    return RenderingPipeline(pipes=[
+        apply_attributes,
+        render_view_content,
+        partial(keep_views_alive, max_count = max_count, max_cost = max_cost)
+    ], name='keep alive view pipeline') # yapf: disable
+
+
+def keep_views_alive(
+    node: View, context: TkRenderingContext, max_count: Optional[int] = None, max_cost: Optional[int] = None
+):
+    """Subscribes to name change, hides previous view and shows kept alive or renders new view"""
+    cache = KeepAliveCache(max_count, max_cost)
+    node.observe('name', lambda _, old_name: _switch_view(node, context, cache, old_name))
+    _clear_on_destroy(node, cache)
+
+
+def _switch_view(node: View, context: TkRenderingContext, cache: KeepAliveCache, old_name: Optional[str]):
+    if node.children:
+        cache.store(old_name, list(node.children))
+        node.children.clear()
+    content = cache.restore(node.name)
+    if content is None:
+        render_view_content(node, context)
+    else:
+        node.add_children(content)
+
+
+def get_keep_alive_if_pipeline() -> RenderingPipeline:
+    """Returns setup for If that hides children instead of destroying"""
+    return RenderingPipeline(pipes=[
+        apply_attributes,
+        render_if,
+        keep_if_alive
+    ], name='keep alive if pipeline') # yapf: disable
+
+
+def keep_if_alive(node: If, context: TkRenderingContext):
+    """Subscribes to condition change and hides or shows children"""
+    cache = KeepAliveCache(max_count = 1)
+    node.observe('condition', lambda condition, old: _toggle_if(node, context, cache, condition, old))
+    _clear_on_destroy(node, cache)
+
+
+def _toggle_if(node: If, context: TkRenderingContext, cache: KeepAliveCache, condition: Any, old_condition: Any):
+    if bool(condition) == bool(old_condition):
+        return
+    if node.children:
+        cache.store(True, list(node.children))
+        node.children.clear()
+    if condition:
+        content = cache.restore(True)
+        if content is None:
+            render_if(node, context)
+        else:
+            node.add_children(content)
+
+
+def _clear_on_destroy(node: Node, cache: KeepAliveCache):
+    on_destroy = node.on_destroy
+
+    def _on_destroy(destroyed: Node):
+        cache.clear()
+        on_destroy(destroyed)
+
+    node.on_destroy = _on_destroy
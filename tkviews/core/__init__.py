@@ -1,3 +1,11 @@
 """Core package"""
 
-from .rendering import TkRenderingContext, render_attribute
+from .batch import BatchError, BatchTkapp, run_deferred
+from .dispatcher import Dispatcher, DispatcherStats, get_dispatcher, use_dispatcher
+from .expression import CompiledExpression, PrecompiledExpression, ExpressionCache, compile_expression, \
+    get_expression_cache, get_binding_expression, use_cached_expressions
+from .jobs import JobRunner, JobOptions, job, get_job_runner, use_job_runner
+from .pipeline import FusedPipeline, add_pipe_condition
+from .rendering import TkRenderingContext, ChildGlobals, ChildrenRendering, render_attribute
+from .scheduling import UpdateScheduler, use_update_scheduler, immediate_updates
+from .views import ViewsCache, ViewsOptions, get_views_cache, render_tk_view, use_views_options
@@ -0,0 +1,208 @@
+"""Batched execution of Tcl commands"""
+
+import sys
+import tkinter
+from contextlib import contextmanager
+from tkinter import Misc
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from pyviews.core.error import PyViewsError, ViewInfo
+
+_NOT_DEFERRED = (bytes, bytearray)
+_GEOMETRY_COMMANDS = ('pack', 'grid', 'place')
+_WRITE_ONLY_SUBCOMMANDS = ('delete', 'insert')
+_SPECIAL = set(' \t\n\r\v\f{}[]$"\\;')
+_BATCH_PROC = 'tkviews_batch_run'
+_BATCH_PROC_BODY = '''
+set errors {}
+set index 0
+foreach command $commands {
+    if {[catch {uplevel #0 $command} error]} {
+        lappend errors $index $error
+    }
+    incr index
+}
+return $errors
+'''
+
+
+class BatchError(PyViewsError):
+    """Error of batched Tcl command"""
+
+
+class BatchTkapp:
+    """
+    Tcl interpreter proxy that collects deferred commands and executes them by one call.
+    Only commands which results are not used are collected: widget options and items options changes,
+    items deletion and insertion and geometry management. Other commands are called after collected ones.
+    Failed command doesn't stop other commands, its error is reported with view info
+    """
+
+    def __init__(self, tkapp: Any, max_size: int = 1000):
+        self.tkapp: Any = tkapp
+        self.max_size: int = max_size
+        self.deferring: int = 0
+        self.view_info: Optional[ViewInfo] = None
+        self._commands: List[Tuple[str, Optional[ViewInfo]]] = []
+        self._scheduled: bool = False
+        self._flush_command: str = f'tkviews_batch{id(self)}'
+        tkapp.createcommand(self._flush_command, self._flush_on_idle)
+        tkapp.call('proc', _BATCH_PROC, 'commands', _BATCH_PROC_BODY)
+
+    @property
+    def batch(self) -> 'BatchTkapp':
+        """Returns self, can be accessed through other interpreter proxies"""
+        return self
+
+    @property
+    def pending(self) -> int:
+        """Count of collected commands"""
+        return len(self._commands)
+
+    @contextmanager
+    def deferred(self, view_info: Optional[ViewInfo] = None) -> Iterator[None]:
+        """Write only commands called inside with block are collected"""
+        previous, self.view_info = self.view_info, view_info if view_info is not None else self.view_info
+        self.deferring += 1
+        try:
+            yield
+        finally:
+            self.deferring -= 1
+            self.view_info = previous
+
+    def call(self, *args) -> Any:
+        """Collects command if deferred or calls it"""
+        if self.deferring and self._defer(args):
+            return ''
+        self.flush()
+        return self.tkapp.call(*args)
+
+    def _defer(self, args: tuple) -> bool:
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        none_index = next((i for i, arg in enumerate(args) if arg is None), None)
+        if none_index is not None:
+            args = args[:none_index]
+        if not is_write_only(args) or any(isinstance(arg, _NOT_DEFERRED) for arg in args):
+            return False
+        self._commands.append((' '.join(quote(arg) for arg in args), self.view_info))
+        if len(self._commands) >= self.max_size:
+            self.flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            self.tkapp.call('after', 'idle', self._flush_command)
+        return True
+
+    def flush(self):
+        """Executes collected commands by one call and reports failed commands"""
+        if not self._commands:
+            return
+        commands, self._commands = self._commands, []
+        errors = self.tkapp.splitlist(self.tkapp.call(_BATCH_PROC, tuple(command for command, _ in commands)))
+        for index, message in zip(errors[::2], errors[1::2]):
+            command, view_info = commands[int(index)]
+            _report(_create_error(str(message), command, view_info))
+
+    def _flush_on_idle(self):
+        self._scheduled = False
+        self.flush()
+
+    def eval(self, script: str) -> Any:
+        """Evaluates script after collected commands"""
+        self.flush()
+        return self.tkapp.eval(script)
+
+    def getvar(self, *args) -> Any:
+        """Gets Tcl variable after collected commands are executed"""
+        self.flush()
+        return self.tkapp.getvar(*args)
+
+    def setvar(self, *args):
+        """Sets Tcl variable after collected commands are executed"""
+        self.flush()
+        return self.tkapp.setvar(*args)
+
+    def globalgetvar(self, *args) -> Any:
+        """Gets global Tcl variable after collected commands are executed"""
+        self.flush()
+        return self.tkapp.globalgetvar(*args)
+
+    def globalsetvar(self, *args):
+        """Sets global Tcl variable after collected commands are executed"""
+        self.flush()
+        return self.tkapp.globalsetvar(*args)
+
+    def __getattr__(self, name: str):
+        return getattr(self.tkapp, name)
+
+
+def _create_error(message: str, command: str, view_info: Optional[ViewInfo]) -> BatchError:
+    error = BatchError(message, view_info)
+    error.add_info('Command', command)
+    return error
+
+
+def _report(error: BatchError):
+    root = getattr(tkinter, '_default_root', None)
+    if root is None:
+        sys.excepthook(type(error), error, None)
+    else:
+        root.report_callback_exception(type(error), error, None)
+
+
+def is_write_only(args: tuple) -> bool:
+    """Returns true if command result is not used by tkinter"""
+    if len(args) < 2:
+        return False
+    command, subcommand = str(args[0]), str(args[1])
+    if command in _GEOMETRY_COMMANDS:
+        return subcommand in ('configure', 'forget') or subcommand.startswith('.')
+    if not command.startswith('.'):
+        return False
+    if subcommand == 'configure':
+        return _has_option_values(args[2:])
+    if subcommand == 'itemconfigure':
+        return _has_option_values(args[3:])
+    return subcommand in _WRITE_ONLY_SUBCOMMANDS
+
+
+def _has_option_values(options: tuple) -> bool:
+    return bool(options) and len(options) % 2 == 0
+
+
+def quote(value: Any) -> str:
+    """Returns value as Tcl word without substitutions. Booleans are passed as 1 and 0 like tkinter does"""
+    if isinstance(value, (tuple, list)):
+        value = ' '.join(quote(item) for item in value)
+    value = str(int(value)) if isinstance(value, bool) else str(value)
+    if not value:
+        return '{}'
+    if not any(char in _SPECIAL for char in value):
+        return value
+    if '\\' not in value and _braces_balanced(value):
+        return f'{{{value}}}'
+    return ''.join('\\n' if char == '\n' else f'\\{char}' if char in _SPECIAL else char for char in value)
+
+
+def _braces_balanced(value: str) -> bool:
+    depth = 0
+    for char in value:
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
+def run_deferred(widget: Misc, method: Callable, *args, view_info: Optional[ViewInfo] = None, **kwargs) -> Any:
+    """
+    Calls method. Write only Tcl commands are collected to batch if widget interpreter supports it,
+    view_info is used to report errors of collected commands
+    """
+    batch = getattr(getattr(widget, 'tk', None), 'batch', None)
+    if not isinstance(batch, BatchTkapp):
+        return method(*args, **kwargs)
+    with batch.deferred(view_info):
+        return method(*args, **kwargs)
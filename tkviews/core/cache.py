@@ -0,0 +1,53 @@
+"""Least recently used cache"""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+Key = TypeVar('Key', bound = Hashable)
+Value = TypeVar('Value')
+
+
+class LruCache(Generic[Key, Value]):
+    """Stores at most max_size values, least recently used value is removed first"""
+
+    def __init__(self, max_size: int):
+        self._items: 'OrderedDict[Key, Value]' = OrderedDict()
+        self._max_size: int = max_size
+
+    @property
+    def max_size(self) -> int:
+        """Maximum count of values"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._max_size = value
+        self._trim()
+
+    def get(self, key: Key) -> Optional[Value]:
+        """Returns value and marks it as recently used"""
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Key, value: Value):
+        """Stores value as recently used"""
+        self._items[key] = value
+        self._items.move_to_end(key)
+        self._trim()
+
+    def pop(self, key: Key) -> Optional[Value]:
+        """Removes value"""
+        return self._items.pop(key, None)
+
+    def _trim(self):
+        while len(self._items) > self._max_size:
+            self._items.popitem(last = False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self):
+        """Removes values"""
+        self._items.clear()
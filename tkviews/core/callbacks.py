@@ -0,0 +1,95 @@
+"""Hooks for widget commands and binding callbacks"""
+
+from functools import partial
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from injectool import In, inject
+from pyviews.binding.binder import Binder, BindingContext
+from pyviews.core.error import ViewInfo
+from pyviews.core.rendering import Node, Setter
+
+
+class CallbackInfo(NamedTuple):
+    """Describes running callback"""
+    kind: str
+    name: str
+    view_info: Optional[ViewInfo] = None
+
+
+class CallbackListener:
+    """Gets notified about callbacks start and finish"""
+
+    def callback_started(self, info: CallbackInfo):
+        """Called before callback"""
+
+    def callback_finished(self, info: CallbackInfo):
+        """Called after callback"""
+
+
+_LISTENERS: List[CallbackListener] = []
+_RUNNING: List[CallbackInfo] = []
+
+
+def add_callback_listener(listener: CallbackListener):
+    """Adds callback listener"""
+    if listener not in _LISTENERS:
+        _LISTENERS.append(listener)
+
+
+def remove_callback_listener(listener: CallbackListener):
+    """Removes callback listener"""
+    if listener in _LISTENERS:
+        _LISTENERS.remove(listener)
+
+
+def current_callback() -> Optional[CallbackInfo]:
+    """Returns innermost running callback. Callbacks are tracked only if there are listeners"""
+    try:
+        return _RUNNING[-1]
+    except IndexError:
+        return None
+
+
+def run_callback(info: CallbackInfo, callback: Callable, *args, **kwargs) -> Any:
+    """Calls callback and notifies listeners"""
+    if not _LISTENERS:
+        return callback(*args, **kwargs)
+    listeners = list(_LISTENERS)
+    _RUNNING.append(info)
+    for listener in listeners:
+        listener.callback_started(info)
+    try:
+        return callback(*args, **kwargs)
+    finally:
+        _RUNNING.pop()
+        for listener in reversed(listeners):
+            listener.callback_finished(info)
+
+
+@inject(binder = Binder)
+def add_bind_wrapper(wrapper: Callable[[Callable, str, BindingContext], None], binder: Binder = In):
+    """Wraps binder.bind with wrapper(bind, binding_type, context). Same wrapper is added once"""
+    bind = binder.bind
+    while isinstance(bind, partial):
+        if bind.func == wrapper:
+            return
+        bind = bind.args[0]
+    binder.bind = partial(wrapper, binder.bind)
+
+
+@inject(binder = Binder)
+def use_binding_callbacks(binder: Binder = In):
+    """Runs setters called by bindings with run_callback"""
+    add_bind_wrapper(_bind, binder = binder)
+
+
+def _bind(bind: Callable[[str, BindingContext], None], binding_type: str, context: BindingContext):
+    if context.setter is not None and context.xml_attr is not None:
+        view_info = context.node.xml_node.view_info if context.node is not None else None
+        info = CallbackInfo(binding_type, context.xml_attr.name, view_info)
+        context.setter = partial(_call_setter, info, context.setter)
+    bind(binding_type, context)
+
+
+def _call_setter(info: CallbackInfo, setter: Setter, node: Node, key: str, value: Any):
+    run_callback(info, setter, node, key, value)
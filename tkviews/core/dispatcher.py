@@ -0,0 +1,154 @@
+"""Main loop dispatcher for background threads"""
+
+import tkinter
+from collections import OrderedDict
+from logging import Logger, getLogger
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+from injectool import DependencyError, add_singleton, resolve
+
+from tkviews.core.callbacks import CallbackInfo, run_callback
+
+_LOGGER = getLogger('tkviews.dispatcher')
+
+
+class DispatcherStats(NamedTuple):
+    """Dispatcher queue statistics. Latency is time in seconds from queueing to call"""
+    depth: int
+    max_depth: int
+    processed: int
+    coalesced: int
+    mean_latency: float
+    max_latency: float
+
+
+class Dispatcher:
+    """
+    Calls callables queued from any thread on main loop thread.
+    Queue is drained with after by batches of batch_size callables,
+    callable queued with key replaces pending callable with the same key
+    """
+
+    def __init__(
+        self,
+        master: Optional[tkinter.Misc] = None,
+        interval: float = 10,
+        batch_size: int = 100,
+        logger: Optional[Logger] = None
+    ):
+        self.master: Optional[tkinter.Misc] = master
+        self.interval: float = interval
+        self.batch_size: int = batch_size
+        self._logger: Logger = logger if logger else _LOGGER
+        self._lock: Lock = Lock()
+        self._queue: OrderedDict = OrderedDict()
+        self._after_id = None
+        self._started: bool = False
+        self._max_depth: int = 0
+        self._processed: int = 0
+        self._coalesced: int = 0
+        self._total_latency: float = 0
+        self._max_latency: float = 0
+
+    @property
+    def started(self) -> bool:
+        """Returns true if queue is drained on main loop"""
+        return self._started
+
+    def invoke(self, callback: Callable, *args, key: Optional[Hashable] = None, **kwargs):
+        """Queues callback. Thread safe"""
+        with self._lock:
+            if key is None:
+                key = object()
+            elif key in self._queue:
+                self._coalesced += 1
+                queued = self._queue[key][3]
+                self._queue[key] = (callback, args, kwargs, queued)
+                return
+            self._queue[key] = (callback, args, kwargs, perf_counter())
+            self._max_depth = max(self._max_depth, len(self._queue))
+
+    def set(self, target: Any, attr: str, value: Any):
+        """Queues setting of attribute. Pending value of the same attribute is replaced. Thread safe"""
+        self.invoke(setattr, target, attr, value, key = (id(target), attr))
+
+    def start(self, master: Optional[tkinter.Misc] = None):
+        """Starts draining queue. Should be called from main loop thread"""
+        if master is not None:
+            self.master = master
+        if not self._started:
+            self._started = True
+            self._schedule(self.interval)
+
+    def stop(self):
+        """Stops draining queue"""
+        self._started = False
+        if self._after_id is not None:
+            master = self._get_master()
+            if master is not None:
+                master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def drain(self, max_count: Optional[int] = None) -> int:
+        """Calls queued callables, not more than max_count. Returns count of called callables"""
+        count = 0
+        while max_count is None or count < max_count:
+            with self._lock:
+                if not self._queue:
+                    break
+                callback, args, kwargs, queued = self._queue.popitem(last = False)[1]
+                latency = perf_counter() - queued
+                self._processed += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+            count += 1
+            info = CallbackInfo('dispatch', getattr(callback, '__name__', str(callback)))
+            try:
+                run_callback(info, callback, *args, **kwargs)
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception('Dispatched callback %s failed', callback)
+        return count
+
+    def stats(self) -> DispatcherStats:
+        """Returns queue depth, max depth, processed and coalesced counts, mean and max latency"""
+        with self._lock:
+            mean_latency = self._total_latency / self._processed if self._processed else 0
+            return DispatcherStats(
+                len(self._queue), self._max_depth, self._processed, self._coalesced, mean_latency, self._max_latency
+            )
+
+    def _get_master(self) -> Optional[tkinter.Misc]:
+        return self.master if self.master is not None else getattr(tkinter, '_default_root', None)
+
+    def _schedule(self, delay: float):
+        master = self._get_master()
+        self._after_id = master.after(int(delay), self._on_timer) if master is not None else None
+
+    def _on_timer(self):
+        self._after_id = None
+        self.drain(self.batch_size)
+        with self._lock:
+            pending = bool(self._queue)
+        if self._started:
+            self._schedule(0 if pending else self.interval)
+
+
+def get_dispatcher() -> Optional[Dispatcher]:
+    """Returns used dispatcher"""
+    try:
+        return resolve(Dispatcher)
+    except DependencyError:
+        return None
+
+
+def use_dispatcher(interval: float = 10, batch_size: int = 100) -> Dispatcher:
+    """Registers dispatcher. Callables can be queued before dispatcher is started"""
+    dispatcher = get_dispatcher()
+    if dispatcher is None:
+        dispatcher = Dispatcher()
+        add_singleton(Dispatcher, dispatcher)
+    dispatcher.interval = interval
+    dispatcher.batch_size = batch_size
+    return dispatcher
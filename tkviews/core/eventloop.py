@@ -0,0 +1,36 @@
+"""tkinter events processing in asyncio event loop"""
+
+import asyncio
+from tkinter import Misc, TclError
+
+import _tkinter
+
+_MIN_DELAY = 0.001
+
+
+async def run_tk(master: Misc, max_interval: float = 10, max_events: int = 100):
+    """
+    Processes tkinter events until master is destroyed. Pending events are processed by batches of max_events,
+    when there are no events delay before next check grows up to max_interval milliseconds
+    """
+    tkapp = master.tk
+    flags = _tkinter.ALL_EVENTS | _tkinter.DONT_WAIT
+    max_delay = max(max_interval / 1000, _MIN_DELAY)
+    delay = _MIN_DELAY
+    while _exists(master):
+        processed = 0
+        while processed < max_events and tkapp.dooneevent(flags):
+            processed += 1
+        if processed:
+            delay = _MIN_DELAY
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+
+def _exists(master: Misc) -> bool:
+    try:
+        return bool(master.winfo_exists())
+    except TclError:
+        return False
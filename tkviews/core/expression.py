@@ -0,0 +1,148 @@
+"""Compiled expressions cache"""
+
+from functools import partial
+from types import CodeType
+from typing import NamedTuple, Optional
+
+from injectool import In, inject
+from pyviews.binding.binder import Binder, BindingContext
+from pyviews.binding.expression import ExpressionBinding
+from pyviews.core.binding import Binding
+from pyviews.core.expression import Expression, ExpressionError, execute, parse_expression
+
+from tkviews.core.cache import LruCache
+
+
+class PrecompiledExpression(Expression):
+    """Expression created from already compiled code"""
+
+    __slots__ = ()
+
+    def __init__(self, code: str, compiled_code: CodeType):  # pylint: disable=super-init-not-called
+        self._code: str = code
+        self._compiled_code: CodeType = compiled_code
+
+
+class CompiledExpression(NamedTuple):
+    """Parsed and compiled expression from attribute value"""
+    binding_type: str
+    expression: Expression
+
+
+class CacheInfo(NamedTuple):
+    """Expression cache statistics"""
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+    compiled: int = 0
+
+
+class ExpressionCache:
+    """
+    Least recently used cache of compiled expressions keyed by expression source.
+    Expressions added from compiled views are stored separately, so they are not evicted by expressions compiled
+    at runtime. Both parts are limited by max size
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._items: LruCache[str, CompiledExpression] = LruCache(max_size)
+        self._compiled: LruCache[str, CompiledExpression] = LruCache(max_size)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum count of cached expressions"""
+        return self._items.max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._items.max_size = value
+        self._compiled.max_size = value
+
+    def get(self, source: str) -> CompiledExpression:
+        """Returns compiled expression for source"""
+        compiled = self._compiled.get(source) or self._items.get(source)
+        if compiled is not None:
+            self.hits += 1
+            return compiled
+        self.misses += 1
+        compiled = _compile(source)
+        self._items.set(source, compiled)
+        return compiled
+
+    def add(self, source: str, compiled: CompiledExpression):
+        """Stores expression of compiled view for source"""
+        self._items.pop(source)
+        self._compiled.set(source, compiled)
+
+    def info(self) -> CacheInfo:
+        """Returns cache statistics. Size is count of expressions compiled at runtime"""
+        return CacheInfo(self.hits, self.misses, self.max_size, len(self._items), len(self._compiled))
+
+    def clear(self):
+        """Removes cached and added expressions and resets statistics"""
+        self._items.clear()
+        self._compiled.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _compile(source: str) -> CompiledExpression:
+    binding_type, body = parse_expression(source)
+    try:
+        code = compile(body if body.strip(' ') else 'None', '<string>', 'eval')
+    except SyntaxError as syntax_error:
+        error = ExpressionError(syntax_error.msg, body)
+        error.cause_error = syntax_error
+        raise error from syntax_error
+    return CompiledExpression(binding_type, PrecompiledExpression(body, code))
+
+
+_EXPRESSION_CACHE = ExpressionCache()
+
+
+def get_expression_cache() -> ExpressionCache:
+    """Returns process wide expression cache"""
+    return _EXPRESSION_CACHE
+
+
+def compile_expression(source: str) -> CompiledExpression:
+    """Returns compiled expression for attribute value using process wide cache"""
+    return _EXPRESSION_CACHE.get(source)
+
+
+def get_binding_expression(context: BindingContext, body: Optional[str] = None) -> Expression:
+    """
+    Returns expression for binding body, context expression body by default.
+    Expression of xml attribute value is taken from process wide cache
+    """
+    body = context.expression_body if body is None else body
+    source = context.xml_attr.value.strip() if context.xml_attr is not None and context.xml_attr.value else ''
+    if body == context.expression_body and source:
+        compiled = compile_expression(source)
+        if compiled.expression.code == body:
+            return compiled.expression
+    return Expression(body)
+
+
+def run_once(context: BindingContext):
+    """Calls setter with cached expression value"""
+    value = execute(get_binding_expression(context), context.node.node_globals)
+    context.setter(context.node, context.xml_attr.name, value)
+
+
+def bind_setter_to_expression(context: BindingContext) -> Binding:
+    """Binds setter to cached expression result changes"""
+    callback = partial(context.setter, context.node, context.xml_attr.name)
+    binding = ExpressionBinding(callback, get_binding_expression(context), context.node.node_globals)
+    binding.bind()
+    return binding
+
+
+@inject(binder = Binder)
+def use_cached_expressions(binder: Binder = In):
+    """Once and oneway bindings use process wide expression cache"""
+    binder.add_rule('once', run_once)
+    binder.add_rule('oneway', bind_setter_to_expression)
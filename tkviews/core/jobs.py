@@ -0,0 +1,198 @@
+"""Coroutine and background handlers of widgets commands"""
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from injectool import DependencyError, add_singleton, resolve
+
+from tkviews.core.dispatcher import Dispatcher, get_dispatcher, use_dispatcher
+
+_EXECUTORS = ('thread', 'process')
+
+
+class JobOptions(NamedTuple):
+    """Options of handler marked as job"""
+    executor: Optional[str]
+    busy: Optional[str]
+    done: Optional[str]
+    restart: bool
+
+
+_JOB_OPTIONS: 'WeakKeyDictionary[Callable, JobOptions]' = WeakKeyDictionary()
+
+
+def job(
+    executor: str = 'thread',
+    busy: Optional[str] = None,
+    done: Optional[str] = None,
+    restart: bool = False
+) -> Callable[[Callable], Callable]:
+    """
+    Marks handler to run in "thread" or "process" pool. Coroutine functions are run in asyncio event loop.
+    busy - attribute of handler owner that is True while handler is running,
+    done - method of handler owner that is called on main loop with handler result,
+    restart - if True, previous run is cancelled when handler is triggered again.
+    Process pool handlers and their arguments are pickled, so they should be module functions
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f'Unknown executor "{executor}", use one of {", ".join(_EXECUTORS)}')
+
+    def _decorate(handler: Callable) -> Callable:
+        _JOB_OPTIONS[handler] = JobOptions(executor, busy, done, restart)
+        return handler
+
+    return _decorate
+
+
+def get_job_options(handler: Callable) -> Optional[JobOptions]:
+    """Returns job options of handler. Coroutine functions are jobs with default options"""
+    try:
+        options = _JOB_OPTIONS.get(getattr(handler, '__func__', handler))
+    except TypeError:
+        options = None
+    if asyncio.iscoroutinefunction(handler):
+        return options._replace(executor = None) if options else JobOptions(None, None, None, False)
+    return options
+
+
+def is_job(handler: Callable) -> bool:
+    """Returns true if handler is coroutine function or marked as job"""
+    return get_job_options(handler) is not None
+
+
+class JobRun:
+    """Running job handler"""
+
+    def __init__(
+        self,
+        key: Tuple[int, int],
+        owner: Any,
+        options: JobOptions,
+        on_error: Callable[[BaseException], None]
+    ):
+        self.key: Tuple[int, int] = key
+        self.owner: Any = owner
+        self.options: JobOptions = options
+        self.on_error: Callable[[BaseException], None] = on_error
+        self.future: Optional[Union[Future, asyncio.Future]] = None
+        self.cancelled: bool = False
+
+    def cancel(self):
+        """Cancels run. Result of already running handler is ignored"""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class JobRunner:
+    """Runs job handlers. Results and errors are passed on main loop"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers: Optional[int] = max_workers
+        self._executors: Dict[str, Executor] = {}
+        self._runs: Dict[Tuple[int, int], list] = {}
+
+    def run(self, handler: Callable, args: tuple, kwargs: dict, on_error: Callable[[BaseException], None]) -> JobRun:
+        """Starts handler. Should be called from main loop thread"""
+        options = get_job_options(handler)
+        owner = getattr(handler, '__self__', None)
+        key = (id(getattr(handler, '__func__', handler)), id(owner))
+        if options.restart:
+            for previous in self._runs.get(key, []):
+                previous.cancel()
+        run = JobRun(key, owner, options, on_error)
+        self._start(run)
+        try:
+            run.future = self._submit(handler, args, kwargs, options)
+        except BaseException:
+            self._finish(run)
+            raise
+        if options.executor is None:
+            run.future.add_done_callback(lambda future: self._complete(run, future))
+        else:
+            dispatcher = _get_started_dispatcher()
+            run.future.add_done_callback(lambda future: dispatcher.invoke(self._complete, run, future))
+        return run
+
+    def _submit(self, handler: Callable, args: tuple, kwargs: dict, options: JobOptions):
+        if options.executor is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError as error:
+                raise RuntimeError('Coroutine handlers are run in asyncio event loop, use launch_async') from error
+            return loop.create_task(handler(*args, **kwargs))
+        return self._get_executor(options.executor).submit(handler, *args, **kwargs)
+
+    def _get_executor(self, executor: str) -> Executor:
+        if executor not in self._executors:
+            executor_type = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+            self._executors[executor] = executor_type(max_workers = self.max_workers)
+        return self._executors[executor]
+
+    def _start(self, run: JobRun):
+        runs = self._runs.setdefault(run.key, [])
+        runs.append(run)
+        if len(runs) == 1:
+            self._set_busy(run, True)
+
+    def _finish(self, run: JobRun):
+        runs = self._runs.get(run.key, [])
+        if run in runs:
+            runs.remove(run)
+        if not runs:
+            self._runs.pop(run.key, None)
+            self._set_busy(run, False)
+
+    @staticmethod
+    def _set_busy(run: JobRun, value: bool):
+        if run.options.busy and run.owner is not None:
+            setattr(run.owner, run.options.busy, value)
+
+    def _complete(self, run: JobRun, future: Union[Future, asyncio.Future]):
+        self._finish(run)
+        if run.cancelled or future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            run.on_error(error)
+            return
+        if run.options.done and run.owner is not None:
+            try:
+                getattr(run.owner, run.options.done)(future.result())
+            except Exception as done_error:  # pylint: disable=broad-except
+                run.on_error(done_error)
+
+    def shutdown(self):
+        """Cancels runs and stops executors"""
+        for runs in list(self._runs.values()):
+            for run in list(runs):
+                run.cancel()
+        for executor in self._executors.values():
+            executor.shutdown(wait = False)
+        self._executors.clear()
+
+
+def _get_started_dispatcher() -> Dispatcher:
+    dispatcher = get_dispatcher()
+    if dispatcher is None:
+        dispatcher = use_dispatcher()
+    if not dispatcher.started:
+        dispatcher.start()
+    return dispatcher
+
+
+def get_job_runner() -> JobRunner:
+    """Returns used job runner"""
+    try:
+        return resolve(JobRunner)
+    except DependencyError:
+        return use_job_runner()
+
+
+def use_job_runner(max_workers: Optional[int] = None) -> JobRunner:
+    """Registers job runner with max_workers for thread and process pools"""
+    runner = JobRunner(max_workers)
+    add_singleton(JobRunner, runner)
+    return runner
@@ -0,0 +1,84 @@
+"""Rendering pipelines specialized for template nodes"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from pyviews.core.error import error_handling
+from pyviews.core.rendering import Node, RenderingContext, RenderingError
+from pyviews.core.xml import XmlNode
+from pyviews.pipes import apply_attributes
+from pyviews.rendering.context import use_context
+from pyviews.rendering.pipeline import CreateNode, Pipe, RenderingPipeline
+
+from tkviews.core.cache import LruCache
+
+PipeCondition = Callable[[XmlNode, type], bool]
+
+_PIPE_CONDITIONS: Dict[Pipe, PipeCondition] = {}
+
+
+def add_pipe_condition(pipe: Pipe, condition: PipeCondition):
+    """
+    Registers condition for pipe.
+    Fused pipeline drops pipe for template node if condition returns False for xml node and master type.
+    Condition should depend only on node name, attribute names, text, children count and master type
+    """
+    _PIPE_CONDITIONS[pipe] = condition
+
+
+def is_pipe_needed(pipe: Pipe, xml_node: XmlNode, master_type: type) -> bool:
+    """Returns true if pipe should be run for xml node and master type"""
+    condition = _PIPE_CONDITIONS.get(getattr(pipe, '__wrapped__', pipe))
+    return condition is None or condition(xml_node, master_type)
+
+
+add_pipe_condition(apply_attributes, lambda xml_node, _: bool(xml_node.attrs))
+
+
+def get_template_key(xml_node: XmlNode, master_type: type) -> Hashable:
+    """Returns key of template node shape. Nodes with the same key use the same fused pipes"""
+    return (
+        xml_node.namespace,
+        xml_node.name,
+        tuple((attr.namespace, attr.name) for attr in xml_node.attrs),
+        xml_node.text,
+        len(xml_node.children),
+        master_type
+    )
+
+
+class FusedPipeline(RenderingPipeline):
+    """Rendering pipeline that runs only pipes needed for template node and master type"""
+
+    def __init__(
+        self,
+        pipes: Optional[List[Pipe]] = None,
+        create_node: Optional[CreateNode] = None,
+        name: Optional[str] = None,
+        max_size: int = 1024
+    ):
+        super().__init__(pipes, create_node, name)
+        self._fused: LruCache[Hashable, Tuple[Pipe, ...]] = LruCache(max_size)
+
+    def get_pipes(self, xml_node: XmlNode, master_type: type) -> Tuple[Pipe, ...]:
+        """Returns pipes needed for xml node and master type"""
+        key = get_template_key(xml_node, master_type)
+        pipes = self._fused.get(key)
+        if pipes is None:
+            pipes = tuple(pipe for pipe in self._pipes if is_pipe_needed(pipe, xml_node, master_type))
+            self._fused.set(key, pipes)
+        return pipes
+
+    def run(self, context: RenderingContext) -> Node:
+        """Runs pipes fused for context xml node and master"""
+        pipe: Optional[Pipe] = None
+        pipes = self.get_pipes(context.xml_node, type(context.get('master')))
+        with use_context(context):
+            with error_handling(RenderingError, lambda e: self._add_pipe_info(e, pipe, context)):
+                node = self._create_node(context)
+                for pipe in pipes:
+                    pipe(node, context)
+                return node
+
+    def clear(self):
+        """Removes fused pipes"""
+        self._fused.clear()
@@ -1,12 +1,16 @@
 """Common rendering functionality"""
 
+from time import perf_counter
 from tkinter import Widget
-from typing import Any, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
-from pyviews.core.expression import Expression, execute, is_expression, parse_expression
+from pyviews.core.expression import execute, is_expression
 from pyviews.core.rendering import Node, NodeGlobals, RenderingContext, Setter, XmlNode
 from pyviews.core.xml import XmlAttr
-from pyviews.pipes import get_setter
+from pyviews.pipes import GetChildContextType, get_setter
+from pyviews.rendering.pipeline import render
+
+from tkviews.core.expression import compile_expression
 
 
 class TkRenderingContext(RenderingContext):
@@ -22,13 +26,101 @@ class TkRenderingContext(RenderingContext):
         self['master'] = value
 
 
+class ChildGlobals(NodeGlobals):
+    """Node globals that inherit parent values on first read"""
+
+    def __init__(self, parent: NodeGlobals):
+        super().__init__()
+        self._pending_parent: Optional[NodeGlobals] = parent
+
+    def _inherit(self):
+        parent = self._pending_parent
+        if parent is None:
+            return
+        self._pending_parent = None
+        for key, value in parent.items():
+            if key not in self._own_keys:
+                dict.__setitem__(self, key, value)
+        self._use_parent(parent)
+
+    def __setitem__(self, key: Any, value: Any):
+        if self._pending_parent is None:
+            super().__setitem__(key, value)
+        else:
+            self._own_keys.add(key)
+            dict.__setitem__(self, key, value)
+
+    def __getitem__(self, key: Any):
+        self._inherit()
+        return super().__getitem__(key)
+
+    def __delitem__(self, key: Any):
+        self._inherit()
+        super().__delitem__(key)
+
+    def __contains__(self, key: Any) -> bool:
+        self._inherit()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._inherit()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._inherit()
+        return super().__len__()
+
+    def __eq__(self, other: Any) -> bool:
+        self._inherit()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        self._inherit()
+        return super().__repr__()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._inherit()
+        return super().get(key, default)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        self._inherit()
+        return super().pop(key, default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._inherit()
+        return super().setdefault(key, default)
+
+    def keys(self):
+        self._inherit()
+        return super().keys()
+
+    def values(self):
+        self._inherit()
+        return super().values()
+
+    def items(self):
+        self._inherit()
+        return super().items()
+
+    def copy(self) -> dict:
+        self._inherit()
+        return super().copy()
+
+    def observe(self, key: str, callback):
+        self._inherit()
+        super().observe(key, callback)
+
+    def observe_all(self, callback):
+        self._inherit()
+        super().observe_all(callback)
+
+
 def render_attribute(node: Node, xml_attr: XmlAttr) -> Tuple[Setter, Any]:
     """Returns setter and value"""
     setter = get_setter(xml_attr)
     value = xml_attr.value if xml_attr.value else ''
     if is_expression(value):
-        expression_ = Expression(parse_expression(value)[1])
-        value = execute(expression_, node.node_globals)
+        value = execute(compile_expression(value).expression, node.node_globals)
     return setter, value
 
 
@@ -37,6 +129,67 @@ def get_tk_child_context(child_xml_node: XmlNode, node: Node, context: TkRenderi
     return TkRenderingContext({
         'parent_node': node,
         'master': context.master,
-        'node_globals': NodeGlobals(node.node_globals),
+        'node_globals': ChildGlobals(node.node_globals),
         'xml_node': child_xml_node
     })
+
+
+class ChildrenRendering:
+    """Renders node children in slices limited by time budget"""
+
+    def __init__(
+        self,
+        node: Node,
+        context: RenderingContext,
+        get_child_context: GetChildContextType,
+        master: Widget,
+        budget: float
+    ):
+        self._node = node
+        self._context = context
+        self._get_child_context = get_child_context
+        self._master = master
+        self._budget = budget / 1000
+        self._index = 0
+        self._after_id = None
+        self._callbacks: List[Callable[[Node], None]] = []
+        self.done = False
+
+    def start(self):
+        """Renders first slice and schedules rest"""
+        self._render_slice()
+
+    def _render_slice(self):
+        self._after_id = None
+        xml_nodes = self._node.xml_node.children
+        end = perf_counter() + self._budget
+        while self._index < len(xml_nodes):
+            xml_node = xml_nodes[self._index]
+            self._index += 1
+            child = render(self._get_child_context(xml_node, self._node, self._context))
+            self._node.add_child(child)
+            if perf_counter() >= end:
+                break
+        if self._index < len(xml_nodes):
+            self._after_id = self._master.after_idle(self._render_slice)
+        else:
+            self._complete()
+
+    def _complete(self):
+        self.done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self._node)
+
+    def add_done_callback(self, callback: Callable[[Node], None]):
+        """Adds callback called when all children are rendered"""
+        if self.done:
+            callback(self._node)
+        else:
+            self._callbacks.append(callback)
+
+    def cancel(self):
+        """Stops rendering of remaining children"""
+        if self._after_id is not None:
+            self._master.after_cancel(self._after_id)
+            self._after_id = None
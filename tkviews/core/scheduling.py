@@ -0,0 +1,151 @@
+"""Coalesced bindings updates applied on idle"""
+
+import tkinter
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.binding.binder import BindingContext
+from pyviews.core.binding import Binding
+from pyviews.core.rendering import Node, Setter
+
+from tkviews.core.callbacks import add_bind_wrapper
+
+
+class UpdateScheduler:
+    """
+    Collects bindings updates and applies last value for every node attribute on idle.
+    Updates that don't fit into budget in milliseconds are applied on next idle, at least one update is applied
+    """
+
+    def __init__(
+        self,
+        budget: float = 8,
+        master: Optional[tkinter.Misc] = None,
+        binding_types: Iterable[str] = ('oneway',)
+    ):
+        self.budget: float = budget
+        self.master: Optional[tkinter.Misc] = master
+        self.binding_types: Tuple[str, ...] = tuple(binding_types)
+        self._updates: OrderedDict = OrderedDict()
+        self._scheduled: bool = False
+        self._immediate: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Count of not applied updates"""
+        return len(self._updates)
+
+    def schedule(self, setter: Setter, node: Node, key: str, value: Any):
+        """Stores update to apply it on idle. Previous update of the same node attribute is replaced"""
+        master = self._get_master()
+        if self._immediate or master is None:
+            self._updates.pop((id(node), key), None)
+            setter(node, key, value)
+            return
+        self._updates[(id(node), key)] = (setter, node, key, value)
+        if not self._scheduled:
+            self._scheduled = True
+            master.after_idle(self._apply_on_idle)
+
+    def discard(self, node: Node, key: str):
+        """Removes pending update"""
+        self._updates.pop((id(node), key), None)
+
+    def flush(self):
+        """Applies all pending updates"""
+        while self._updates:
+            self._apply_next()
+
+    @contextmanager
+    def immediate(self) -> Iterator[None]:
+        """Applies pending updates and updates made inside with block immediately"""
+        self.flush()
+        self._immediate += 1
+        try:
+            yield
+        finally:
+            self._immediate -= 1
+
+    def bind(self, bind: Callable[[str, BindingContext], None], binding_type: str, context: BindingContext):
+        """Binder.bind wrapper: binding setter is replaced with schedule"""
+        if binding_type not in self.binding_types or context.setter is None or context.xml_attr is None:
+            bind(binding_type, context)
+            return
+        context.setter = partial(self.schedule, context.setter)
+        self._immediate += 1
+        try:
+            bind(binding_type, context)
+        finally:
+            self._immediate -= 1
+        context.node.add_binding(PendingUpdate(self, context.node, context.xml_attr.name))
+
+    def _get_master(self) -> Optional[tkinter.Misc]:
+        return self.master if self.master is not None else getattr(tkinter, '_default_root', None)
+
+    def _apply_on_idle(self):
+        self._scheduled = False
+        end = perf_counter() + self.budget / 1000
+        try:
+            while self._updates:
+                self._apply_next()
+                if perf_counter() >= end:
+                    break
+        finally:
+            master = self._get_master()
+            if self._updates and not self._scheduled and master is not None:
+                self._scheduled = True
+                master.after_idle(self._apply_on_idle)
+
+    def _apply_next(self):
+        setter, node, key, value = self._updates.popitem(last = False)[1]
+        setter(node, key, value)
+
+
+class PendingUpdate(Binding):
+    """Discards pending update when node bindings are destroyed"""
+
+    def __init__(self, scheduler: UpdateScheduler, node: Node, key: str):
+        self._scheduler: UpdateScheduler = scheduler
+        self._node: Node = node
+        self._key: str = key
+
+    def bind(self):
+        """Nothing to bind"""
+
+    def destroy(self):
+        self._scheduler.discard(self._node, self._key)
+
+
+def get_update_scheduler() -> Optional[UpdateScheduler]:
+    """Returns used update scheduler"""
+    try:
+        return resolve(UpdateScheduler)
+    except DependencyError:
+        return None
+
+
+@contextmanager
+def immediate_updates() -> Iterator[None]:
+    """Applies pending bindings updates and updates made inside with block immediately"""
+    scheduler = get_update_scheduler()
+    if scheduler is None:
+        yield
+        return
+    with scheduler.immediate():
+        yield
+
+
+def use_update_scheduler(budget: float = 8, binding_types: Iterable[str] = ('oneway',)) -> UpdateScheduler:
+    """Bindings updates are coalesced and applied on idle, initial values are applied immediately"""
+    scheduler = get_update_scheduler()
+    if scheduler is None:
+        scheduler = UpdateScheduler(budget, binding_types = binding_types)
+        add_singleton(UpdateScheduler, scheduler)
+    scheduler.budget = budget
+    scheduler.binding_types = tuple(binding_types)
+    add_bind_wrapper(scheduler.bind)
+    return scheduler
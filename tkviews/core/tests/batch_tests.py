@@ -0,0 +1,243 @@
+from tkinter import StringVar, Tcl
+from tkinter.ttk import OptionMenu
+from unittest.mock import Mock, call, patch
+
+from pyviews.core.error import ViewInfo
+from pytest import fixture, mark
+
+from tkviews.core.batch import BatchError, BatchTkapp, quote, run_deferred
+from tkviews.headless import FakeTk
+
+
+@mark.parametrize('value', [
+    'value', 'two words', '', 'x{y', '{', '}', '{a}b', 'q"uote', 'new\nline', 'back\\slash', 'tail\\', '$var[x]',
+    'a;b', '#comment', 1, 1.5
+])  # yapf: disable
+def test_quote(value):
+    """should return Tcl word evaluated to passed value"""
+    interpreter = Tcl()
+
+    interpreter.eval(f'set result {quote(value)}')
+
+    assert interpreter.getvar('result') == str(value)
+
+
+def test_quote_list():
+    """should return Tcl list"""
+    interpreter = Tcl()
+
+    interpreter.eval(f'set result {quote(("one", "two words", "$x"))}')
+
+    assert interpreter.splitlist(interpreter.getvar('result')) == ('one', 'two words', '$x')
+
+
+@fixture
+def batch_fixture(request):
+    request.cls.tkapp = Mock()
+    request.cls.tkapp.splitlist.return_value = ()
+    request.cls.batch = BatchTkapp(request.cls.tkapp, max_size = 3)
+    request.cls.tkapp.call.reset_mock()
+
+
+@mark.usefixtures('batch_fixture')
+class BatchTkappTests:
+    """BatchTkapp tests"""
+
+    tkapp: Mock
+    batch: BatchTkapp
+
+    def test_call(self):
+        """should call interpreter if not deferred"""
+        self.tkapp.call.return_value = 'value'
+
+        actual = self.batch.call('.label', 'cget', '-text')
+
+        assert actual == 'value'
+        assert self.tkapp.call.call_args == call('.label', 'cget', '-text')
+
+    def test_deferred(self):
+        """should collect deferred commands and schedule flush on idle"""
+        with self.batch.deferred():
+            self.batch.call(('.label', 'configure', '-text', 'two words'))
+            self.batch.call('.label', 'configure', '-fg', 'red')
+
+        assert self.batch.pending == 2
+        assert self.tkapp.call.call_args_list == [call('after', 'idle', self.tkapp.createcommand.call_args[0][0])]
+        assert not self.tkapp.eval.called
+
+    def test_flush_on_idle(self):
+        """should execute collected commands by one call on idle"""
+        with self.batch.deferred():
+            self.batch.call('.label', 'configure', '-text', 'two words')
+            self.batch.call('.label', 'configure', '-fg', 'red')
+
+        self.tkapp.createcommand.call_args[0][1]()
+
+        assert self.tkapp.call.call_args == call(
+            'tkviews_batch_run', ('.label configure -text {two words}', '.label configure -fg red')
+        )
+        assert self.batch.pending == 0
+
+    def test_flush_before_call(self):
+        """should execute collected commands before not deferred call"""
+        with self.batch.deferred():
+            self.batch.call('.label', 'configure', '-text', 'value')
+
+        self.batch.call('.label', 'cget', '-text')
+        self.batch.getvar('variable')
+
+        assert self.tkapp.call.call_args_list[-2:] == [
+            call('tkviews_batch_run', ('.label configure -text value',)),
+            call('.label', 'cget', '-text')
+        ]
+
+    def test_max_size(self):
+        """should flush when max size is reached"""
+        with self.batch.deferred():
+            for _ in range(3):
+                self.batch.call('.label', 'configure', '-text', 'value')
+
+        assert self.tkapp.call.call_args == call('tkviews_batch_run', ('.label configure -text value',) * 3)
+        assert self.batch.pending == 0
+
+    def test_none_arguments(self):
+        """should drop arguments starting from None"""
+        with self.batch.deferred():
+            self.batch.call('.listbox', 'delete', 0, None)
+
+        self.batch.flush()
+
+        assert self.tkapp.call.call_args == call('tkviews_batch_run', ('.listbox delete 0',))
+
+    @mark.parametrize('args', [
+        ('.label', 'cget', '-text'),
+        ('.label', 'configure'),
+        ('.label', 'configure', '-text'),
+        ('.canvas', 'itemconfigure', 1, '-fill'),
+        ('.menu', 'index', 'end'),
+        ('winfo', 'exists', '.label'),
+        ('pack', 'slaves', '.')
+    ]) # yapf: disable
+    def test_calls_query_commands(self, args):
+        """should call commands which results are used after collected commands"""
+        self.tkapp.call.return_value = 'value'
+        with self.batch.deferred():
+            self.batch.call('.label', 'configure', '-text', 'value')
+
+            actual = self.batch.call(*args)
+
+        assert actual == 'value'
+        assert self.tkapp.call.call_args_list[-2:] == [
+            call('tkviews_batch_run', ('.label configure -text value',)),
+            call(*args)
+        ]
+
+    @mark.parametrize('args', [
+        ('.label', 'configure', '-text', 'value'),
+        ('.canvas', 'itemconfigure', 1, '-fill', 'red'),
+        ('.listbox', 'delete', 0),
+        ('.listbox', 'insert', 0, 'value'),
+        ('pack', 'configure', '.label', '-side', 'left'),
+        ('grid', 'forget', '.label'),
+        ('place', '.label', '-x', 1)
+    ]) # yapf: disable
+    def test_defers_write_only_commands(self, args):
+        """should collect commands which results are not used"""
+        with self.batch.deferred():
+            self.batch.call(*args)
+
+        assert self.batch.pending == 1
+
+    def test_booleans(self):
+        """should pass booleans as 1 and 0 like tkinter"""
+        with self.batch.deferred():
+            self.batch.call('.check', 'configure', '-takefocus', True, '-relief', (False, True))
+
+        self.batch.flush()
+
+        assert self.tkapp.call.call_args == call('tkviews_batch_run', ('.check configure -takefocus 1 -relief {0 1}',))
+
+    def test_bytes_not_deferred(self):
+        """should call command with bytes immediately"""
+        with self.batch.deferred():
+            self.batch.call('.label', 'configure', '-data', b'data')
+
+        assert self.tkapp.call.call_args == call('.label', 'configure', '-data', b'data')
+
+
+class BatchErrorsTests:
+    """BatchTkapp errors tests"""
+
+    @staticmethod
+    def test_failed_command():
+        """should execute commands after failed one and report error with view info"""
+        interpreter = Tcl()
+        batch = BatchTkapp(interpreter.tk)
+        view_info = ViewInfo('view', 3)
+        root = Mock()
+
+        interpreter.eval('proc .widget {args} { lappend ::calls $args }')
+
+        with batch.deferred(view_info):
+            batch.call('.widget', 'configure', '-text', 'one')
+            batch.call('.unknown', 'configure', '-text', 'value')
+            batch.call('.widget', 'configure', '-text', '{two words')
+        with patch('tkinter._default_root', root):
+            batch.flush()
+
+        assert [interpreter.splitlist(args) for args in interpreter.splitlist(interpreter.getvar('calls'))] == [
+            ('configure', '-text', 'one'), ('configure', '-text', '{two words')
+        ]
+        error_type, error, _ = root.report_callback_exception.call_args[0]
+        assert error_type is BatchError
+        assert error.view_infos == [view_info]
+        assert '.unknown configure -text value' in str(error)
+
+    @staticmethod
+    def test_nested_view_info():
+        """should restore view info after nested deferred block"""
+        batch = BatchTkapp(Mock())
+        outer, inner = ViewInfo('outer', 1), ViewInfo('inner', 2)
+
+        with batch.deferred(outer):
+            with batch.deferred(inner):
+                assert batch.view_info == inner
+            with batch.deferred():
+                assert batch.view_info == outer
+
+        assert batch.view_info is None
+
+
+class RunDeferredTests:
+    """run_deferred tests"""
+
+    @staticmethod
+    def test_defers():
+        """should defer commands called by method"""
+        batch = BatchTkapp(Mock())
+        widget = Mock(tk = batch)
+
+        run_deferred(widget, lambda: widget.tk.call('.label', 'configure', '-text', 'value'))
+
+        assert batch.pending == 1
+        assert batch.deferring == 0
+
+    @staticmethod
+    def test_widget_querying_interpreter():
+        """should create widget that uses interpreter results in constructor"""
+        root = FakeTk()
+        root.tk = BatchTkapp(root.tk)
+
+        menu = run_deferred(root, OptionMenu, root, StringVar(root), 'one', 'one', 'two')
+
+        assert str(menu) in root.tk.tkapp.widgets
+        root.destroy()
+
+    @staticmethod
+    def test_calls_without_batch():
+        """should call method if widget interpreter is not batched"""
+        widget, method = Mock(), Mock()
+
+        run_deferred(widget, method, 1, key = 'value')
+
+        assert method.call_args == call(1, key = 'value')
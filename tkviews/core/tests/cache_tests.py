@@ -0,0 +1,59 @@
+from pytest import fixture, mark
+
+from tkviews.core.cache import LruCache
+
+
+@fixture
+def cache_fixture(request):
+    request.cls.cache = LruCache(2)
+
+
+@mark.usefixtures('cache_fixture')
+class LruCacheTests:
+    """LruCache tests"""
+
+    cache: LruCache
+
+    def test_get(self):
+        """should return stored value"""
+        self.cache.set('key', 'value')
+
+        assert self.cache.get('key') == 'value'
+        assert self.cache.get('other') is None
+
+    def test_removes_least_recently_used(self):
+        """should remove least recently used value if size is exceeded"""
+        self.cache.set('one', 1)
+        self.cache.set('two', 2)
+        self.cache.get('one')
+
+        self.cache.set('three', 3)
+
+        assert self.cache.get('one') == 1
+        assert self.cache.get('two') is None
+        assert len(self.cache) == 2
+
+    def test_max_size(self):
+        """should remove exceeding values on max size change"""
+        self.cache.set('one', 1)
+        self.cache.set('two', 2)
+
+        self.cache.max_size = 1
+
+        assert len(self.cache) == 1
+        assert self.cache.get('two') == 2
+
+    def test_pop(self):
+        """should remove value"""
+        self.cache.set('key', 'value')
+
+        assert self.cache.pop('key') == 'value'
+        assert self.cache.get('key') is None
+
+    def test_clear(self):
+        """should remove values"""
+        self.cache.set('key', 'value')
+
+        self.cache.clear()
+
+        assert len(self.cache) == 0
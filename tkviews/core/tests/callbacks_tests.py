@@ -0,0 +1,114 @@
+from unittest.mock import Mock
+
+from injectool import resolve
+from pytest import fixture, mark
+from pyviews.binding.binder import Binder, BindingContext
+from pyviews.core.error import ViewInfo
+from pyviews.core.xml import XmlAttr
+
+from tkviews.core.callbacks import CallbackInfo, CallbackListener, add_callback_listener, current_callback, \
+    remove_callback_listener, run_callback, use_binding_callbacks, add_bind_wrapper
+
+
+@fixture
+def listener_fixture(request):
+    listener = Mock(spec = CallbackListener)
+    add_callback_listener(listener)
+    request.cls.listener = listener
+    yield
+    remove_callback_listener(listener)
+
+
+@mark.usefixtures('listener_fixture')
+class RunCallbackTests:
+    """run_callback tests"""
+
+    listener: Mock
+
+    def test_notifies_listeners(self):
+        """should notify listeners before and after callback"""
+        info = CallbackInfo('command', 'Button-1', ViewInfo('view', 1))
+        callback = Mock(side_effect = lambda: self.listener.callback_started.called)
+
+        run_callback(info, callback)
+
+        assert callback.called
+        assert self.listener.callback_started.call_args[0] == (info,)
+        assert self.listener.callback_finished.call_args[0] == (info,)
+
+    def test_current_callback(self):
+        """should return running callback"""
+        info = CallbackInfo('command', 'Button-1')
+        actual = []
+
+        run_callback(info, lambda: actual.append(current_callback()))
+
+        assert actual == [info]
+        assert current_callback() is None
+
+    def test_notifies_on_error(self):
+        """should notify listeners if callback raises"""
+        callback = Mock(side_effect = ValueError())
+
+        try:
+            run_callback(CallbackInfo('command', 'Button-1'), callback)
+        except ValueError:
+            pass
+
+        assert self.listener.callback_finished.called
+        assert current_callback() is None
+
+
+def test_run_callback_without_listeners():
+    """should call callback with args and return result"""
+    callback = Mock(return_value = 1)
+
+    actual = run_callback(CallbackInfo('command', 'Button-1'), callback, 2, key = 3)
+
+    assert actual == 1
+    assert callback.call_args[0] == (2,)
+    assert callback.call_args[1] == {'key': 3}
+
+
+@mark.usefixtures('binder_fixture')
+class UseBindingCallbacksTests:
+    """use_binding_callbacks tests"""
+
+    @staticmethod
+    def test_runs_setter_as_callback():
+        """should call binding setter with run_callback"""
+        use_binding_callbacks()
+        use_binding_callbacks()
+        listener, setter = Mock(spec = CallbackListener), Mock()
+        node = Mock(node_globals = {}, xml_node = Mock(view_info = ViewInfo('view', 2)))
+        context = BindingContext({'node': node, 'setter': setter, 'xml_attr': XmlAttr('text'), 'expression_body': '1'})
+        add_callback_listener(listener)
+
+        try:
+            resolve(Binder).bind('once', context)
+        finally:
+            remove_callback_listener(listener)
+
+        assert setter.call_args[0] == (node, 'text', 1)
+        assert listener.callback_started.call_args[0] == (CallbackInfo('once', 'text', ViewInfo('view', 2)),)
+
+
+@mark.usefixtures('binder_fixture')
+class AddBindWrapperTests:
+    """add_bind_wrapper tests"""
+
+    @staticmethod
+    def test_wraps_once():
+        """should add wrappers to binder bind once"""
+        calls = []
+        first = lambda bind, binding_type, context: calls.append('first') or bind(binding_type, context)
+        second = lambda bind, binding_type, context: calls.append('second') or bind(binding_type, context)
+        node = Mock(node_globals = {})
+        context = BindingContext({'node': node, 'setter': Mock(), 'xml_attr': XmlAttr('text'), 'expression_body': '1'})
+
+        add_bind_wrapper(first)
+        add_bind_wrapper(second)
+        add_bind_wrapper(first)
+        resolve(Binder).bind('once', context)
+
+        assert calls == ['second', 'first']
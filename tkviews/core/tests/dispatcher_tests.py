@@ -0,0 +1,150 @@
+from threading import Thread
+from unittest.mock import Mock, call, patch
+
+from pytest import fixture, mark
+
+from tkviews.core import dispatcher as dispatcher_module
+from tkviews.core.dispatcher import Dispatcher, DispatcherStats, get_dispatcher, use_dispatcher
+
+
+@fixture
+def dispatcher_fixture(request):
+    with patch(f'{dispatcher_module.__name__}.perf_counter') as perf_counter:
+        perf_counter.return_value = 0
+        request.cls.perf_counter = perf_counter
+        request.cls.master = Mock()
+        request.cls.logger = Mock()
+        request.cls.dispatcher = Dispatcher(request.cls.master, batch_size = 2, logger = request.cls.logger)
+        yield
+
+
+@mark.usefixtures('dispatcher_fixture')
+class DispatcherTests:
+    """Dispatcher tests"""
+
+    perf_counter: Mock
+    master: Mock
+    logger: Mock
+    dispatcher: Dispatcher
+
+    def _run_timer(self):
+        delay, callback = self.master.after.call_args[0]
+        self.master.after.reset_mock()
+        callback()
+        return delay
+
+    def test_invoke(self):
+        """should call queued callables in order on timer"""
+        callback = Mock()
+        self.dispatcher.start()
+        self.dispatcher.invoke(callback, 1)
+        self.dispatcher.invoke(callback, 2, key = 'key')
+
+        assert not callback.called
+
+        self._run_timer()
+
+        assert callback.call_args_list == [call(1), call(2)]
+
+    def test_coalesces(self):
+        """should call last callable queued with the same key"""
+        callback = Mock()
+        for value in range(10):
+            self.dispatcher.invoke(callback, value, key = 'key')
+
+        self.dispatcher.drain()
+
+        assert callback.call_args_list == [call(9)]
+        assert self.dispatcher.stats().coalesced == 9
+
+    def test_set(self):
+        """should set last value of attribute"""
+        target, other = Mock(), Mock()
+        for value in range(3):
+            self.dispatcher.set(target, 'value', value)
+        self.dispatcher.set(other, 'value', 'other')
+
+        self.dispatcher.drain()
+
+        assert target.value == 2
+        assert other.value == 'other'
+
+    def test_bounded_batches(self):
+        """should call batch size callables and schedule rest immediately"""
+        callback = Mock()
+        self.dispatcher.start()
+        for value in range(3):
+            self.dispatcher.invoke(callback, value)
+
+        self._run_timer()
+        first_batch = callback.call_count
+        delay = self._run_timer()
+
+        assert first_batch == 2
+        assert delay == 0
+        assert callback.call_count == 3
+        assert self.master.after.call_args[0][0] == 10
+
+    def test_stop(self):
+        """should cancel timer"""
+        self.dispatcher.start()
+        after_id = self.master.after.return_value
+
+        self.dispatcher.stop()
+
+        assert self.master.after_cancel.call_args == call(after_id)
+        assert not self.dispatcher.started
+
+    def test_logs_error(self):
+        """should log error and call next callables"""
+        callback = Mock()
+        self.dispatcher.invoke(Mock(side_effect = ValueError()))
+        self.dispatcher.invoke(callback)
+
+        self.dispatcher.drain()
+
+        assert self.logger.exception.called
+        assert callback.called
+
+    def test_stats(self):
+        """should return queue depth and latency"""
+        self.dispatcher.invoke(Mock())
+        self.dispatcher.invoke(Mock())
+        self.dispatcher.invoke(Mock())
+        self.perf_counter.return_value = 0.1
+        self.dispatcher.drain(1)
+        self.perf_counter.return_value = 0.3
+        self.dispatcher.drain(1)
+
+        assert self.dispatcher.stats() == DispatcherStats(1, 3, 2, 0, 0.2, 0.3)
+
+    def test_threads(self):
+        """should queue callables from threads"""
+        callback = Mock()
+        threads = [Thread(target = self.dispatcher.invoke, args = (callback, value)) for value in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.dispatcher.drain()
+
+        assert sorted(args[0][0] for args in callback.call_args_list) == list(range(10))
+
+
+@mark.usefixtures('container_fixture')
+class UseDispatcherTests:
+    """use_dispatcher tests"""
+
+    @staticmethod
+    def test_registers_dispatcher():
+        """should register one dispatcher"""
+        dispatcher = use_dispatcher(interval = 20)
+
+        assert get_dispatcher() is dispatcher
+        assert use_dispatcher() is dispatcher
+
+    @staticmethod
+    def test_not_registered():
+        """should return None if dispatcher is not used"""
+        assert get_dispatcher() is None
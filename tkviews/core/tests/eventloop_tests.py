@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import Mock
+
+from pytest import fixture, mark
+
+from tkviews.core.eventloop import run_tk
+from tkviews.headless import FakeTk
+
+
+@fixture
+def eventloop_fixture(request):
+    root = FakeTk()
+    request.cls.root = root
+    yield root
+    root.destroy()
+
+
+@mark.usefixtures('eventloop_fixture')
+class RunTkTests:
+    """run_tk() tests"""
+
+    root: FakeTk
+
+    def test_runs_until_destroyed(self):
+        """should process tkinter events until root is destroyed"""
+        callback = Mock()
+        self.root.after(5, callback)
+        self.root.after(10, self.root.destroy)
+
+        asyncio.run(run_tk(self.root))
+
+        assert callback.called
+        assert not self.root.winfo_exists()
+
+    def test_runs_coroutines(self):
+        """should let other coroutines run between tkinter events"""
+        events = []
+
+        async def run():
+            async def fetch():
+                await asyncio.sleep(0)
+                events.append('coroutine')
+                self.root.after(0, self.root.destroy)
+
+            task = asyncio.ensure_future(fetch())
+            self.root.after(0, lambda: events.append('tkinter'))
+            await run_tk(self.root)
+            await task
+
+        asyncio.run(run())
+
+        assert events == ['tkinter', 'coroutine']
+
+    def test_batches_events(self):
+        """should process not more than max_events before yielding to asyncio loop"""
+        tkapp = Mock()
+        tkapp.dooneevent.return_value = 1
+        master = Mock(tk = tkapp)
+        master.winfo_exists.side_effect = [True, False]
+
+        asyncio.run(run_tk(master, max_events = 5))
+
+        assert tkapp.dooneevent.call_count == 5
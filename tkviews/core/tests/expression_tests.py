@@ -0,0 +1,184 @@
+from unittest.mock import Mock, call
+
+from injectool import resolve
+from pytest import fixture, mark, raises
+from pyviews.binding.binder import Binder, BindingContext
+from pyviews.core.expression import _COMPILATION_CACHE, Expression, ExpressionError
+from pyviews.core.xml import XmlAttr
+
+from tkviews.core.expression import CacheInfo, CompiledExpression, ExpressionCache, compile_expression, \
+    get_binding_expression, get_expression_cache
+
+
+@fixture
+def cache_fixture(request):
+    request.cls.cache = ExpressionCache(2)
+
+
+@mark.usefixtures('cache_fixture')
+class ExpressionCacheTests:
+    """ExpressionCache tests"""
+
+    cache: ExpressionCache
+
+    @mark.parametrize('source, binding_type, code', [
+        ('{1 + 1}', 'oneway', '1 + 1'),
+        ('once:{value}', 'once', 'value'),
+        ('{{vm.value}}', 'twoways', 'vm.value')
+    ]) # yapf: disable
+    def test_compiles_expression(self, source, binding_type, code):
+        """should return parsed and compiled expression"""
+        actual = self.cache.get(source)
+
+        assert actual.binding_type == binding_type
+        assert actual.expression.code == code
+
+    def test_bypasses_pyviews_compilation_cache(self):
+        """should not store expression to pyviews compilation cache, so evicted expression is freed"""
+        self.cache.get('{"not in pyviews cache"}')
+
+        assert '"not in pyviews cache"' not in _COMPILATION_CACHE
+
+    def test_returns_cached_expression(self):
+        """should return same compiled expression for same source"""
+        first = self.cache.get('{1 + 1}')
+
+        actual = self.cache.get('{1 + 1}')
+
+        assert actual is first
+        assert self.cache.info() == CacheInfo(1, 1, 2, 1)
+
+    def test_removes_least_recently_used(self):
+        """should remove least recently used expression if size is exceeded"""
+        one = self.cache.get('{1}')
+        self.cache.get('{2}')
+        self.cache.get('{1}')
+        self.cache.get('{3}')
+
+        assert self.cache.get('{1}') is one
+        assert self.cache.info() == CacheInfo(2, 3, 2, 2)
+        self.cache.get('{2}')
+        assert self.cache.info().misses == 4
+
+    def test_keeps_added_expressions(self):
+        """should not evict added expressions by expressions compiled at runtime"""
+        compiled = CompiledExpression('oneway', Expression('"added"'))
+        self.cache.add('{"added"}', compiled)
+
+        for source in ('{1}', '{2}', '{3}'):
+            self.cache.get(source)
+
+        assert self.cache.get('{"added"}') is compiled
+        assert self.cache.info() == CacheInfo(1, 3, 2, 2, 1)
+
+    def test_limits_added_expressions(self):
+        """should remove least recently used added expression if size is exceeded"""
+        for source in ('{1}', '{2}', '{3}'):
+            self.cache.add(source, CompiledExpression('oneway', Expression(source[1:-1])))
+
+        assert self.cache.info().compiled == 2
+
+    def test_add_replaces_cached_expression(self):
+        """should replace least recently used expression with added one"""
+        self.cache.get('{1}')
+        compiled = CompiledExpression('oneway', Expression('1'))
+
+        self.cache.add('{1}', compiled)
+
+        assert self.cache.get('{1}') is compiled
+        assert self.cache.info().size == 0
+
+    def test_max_size_trims_cache(self):
+        """should remove exceeding expressions on max size change"""
+        self.cache.get('{1}')
+        self.cache.get('{2}')
+
+        self.cache.max_size = 1
+
+        assert self.cache.info().size == 1
+
+    def test_clear(self):
+        """should remove expressions and reset statistics"""
+        self.cache.get('{1}')
+        self.cache.get('{1}')
+
+        self.cache.add('{2}', CompiledExpression('oneway', Expression('2')))
+
+        self.cache.clear()
+
+        assert self.cache.info() == CacheInfo(0, 0, 2, 0, 0)
+
+    @mark.parametrize('source', ['value', '{1 +}'])
+    def test_raises_for_invalid_expression(self, source):
+        """should raise ExpressionError and don't cache invalid expression"""
+        with raises(ExpressionError):
+            self.cache.get(source)
+
+        assert self.cache.info().size == 0
+
+
+def test_compile_expression():
+    """should use process wide cache"""
+    actual = compile_expression('{"compile_expression"}')
+
+    assert get_expression_cache().get('{"compile_expression"}') is actual
+
+
+def _create_context(value: str, body: str) -> BindingContext:
+    return BindingContext({
+        'node': Mock(node_globals = {'value': 'value'}),
+        'expression_body': body,
+        'setter': Mock(),
+        'xml_attr': XmlAttr('text', value)
+    })
+
+
+class GetBindingExpressionTests:
+    """get_binding_expression() tests"""
+
+    @staticmethod
+    def test_returns_cached_expression():
+        """should return cached expression of xml attribute value"""
+        context = _create_context(' {"binding expression"} ', '"binding expression"')
+
+        actual = get_binding_expression(context)
+
+        assert actual is compile_expression('{"binding expression"}').expression
+
+    @staticmethod
+    @mark.parametrize('value, body, code', [
+        ('{"whole"}', '"part"', '"part"'),
+        ('', '"body"', '"body"'),
+        ('{{"twoways"}:{debounce=1}}', '"twoways"}:{debounce=1', '"twoways"')
+    ]) # yapf: disable
+    def test_returns_expression_for_body(value, body, code):
+        """should return expression for passed body if it doesn't match xml attribute value"""
+        context = _create_context(value, body)
+
+        actual = get_binding_expression(context, code)
+
+        assert actual.code == code
+
+
+@mark.usefixtures('binder_fixture')
+class UseCachedExpressionsTests:
+    """use_cached_expressions() tests"""
+
+    @staticmethod
+    @mark.parametrize('binding_type, value', [
+        ('once', 'once:{value + " once"}'),
+        ('oneway', '{value + " oneway"}')
+    ]) # yapf: disable
+    def test_uses_cache(binding_type, value):
+        """should execute cached expression and pass result to setter"""
+        cache = get_expression_cache()
+        body = value.split('{', 1)[1][:-1]
+        binder = resolve(Binder)
+        hits = cache.hits
+
+        for _ in range(2):
+            context = _create_context(value, body)
+            binder.bind(binding_type, context)
+
+        assert context.setter.call_args == call(context.node, 'text', f'value {binding_type}')
+        assert cache.hits == hits + 1
@@ -0,0 +1,146 @@
+import asyncio
+from threading import Event
+from time import sleep
+from unittest.mock import Mock, call
+
+from pytest import fixture, mark, raises
+
+from tkviews.core.dispatcher import use_dispatcher
+from tkviews.core.jobs import JobOptions, JobRunner, get_job_options, is_job, job
+
+
+class ViewModel:
+    def __init__(self):
+        self.loading = False
+        self.loaded = Mock()
+        self.busy_values = []
+        self.release = Event()
+
+    def __setattr__(self, key, value):
+        if key == 'loading' and hasattr(self, 'busy_values'):
+            self.busy_values.append(value)
+        super().__setattr__(key, value)
+
+    @job(busy = 'loading', done = 'loaded')
+    def load(self, value):
+        self.release.wait(5)
+        return value * 2
+
+    @job(busy = 'loading', done = 'loaded')
+    async def fetch(self, value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    @job(restart = True, done = 'loaded')
+    async def search(self, value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def fail(self):
+        raise ValueError('error')
+
+    def sync(self):
+        pass
+
+
+class JobTests:
+    """job() tests"""
+
+    @staticmethod
+    def test_options():
+        """should mark handler with options"""
+        assert get_job_options(ViewModel().load) == JobOptions('thread', 'loading', 'loaded', False)
+
+    @staticmethod
+    def test_coroutine_options():
+        """should run coroutine functions in event loop"""
+        assert get_job_options(ViewModel().fetch).executor is None
+        assert get_job_options(ViewModel().fail) == JobOptions(None, None, None, False)
+
+    @staticmethod
+    def test_keeps_handler():
+        """should not change marked handler"""
+        assert not hasattr(ViewModel.load, '_job_options')
+
+    @staticmethod
+    def test_not_job():
+        """should not mark other handlers"""
+        assert not is_job(ViewModel().sync)
+
+    @staticmethod
+    def test_unknown_executor():
+        """should raise error for unknown executor"""
+        with raises(ValueError):
+            job(executor = 'gpu')
+
+
+@fixture
+def runner_fixture(request):
+    request.cls.runner = JobRunner()
+    request.cls.view_model = ViewModel()
+    request.cls.on_error = Mock()
+
+
+@mark.usefixtures('container_fixture', 'runner_fixture')
+class JobRunnerTests:
+    """JobRunner tests"""
+
+    runner: JobRunner
+    view_model: ViewModel
+    on_error: Mock
+
+    def _run_async(self, *runs):
+
+        async def run():
+            started = [self.runner.run(handler, args, {}, self.on_error) for handler, args in runs]
+            await asyncio.gather(*(run.future for run in started), return_exceptions = True)
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+    def test_coroutine(self):
+        """should run coroutine and pass result to done method"""
+        self._run_async((self.view_model.fetch, (2,)))
+
+        assert self.view_model.loaded.call_args == call(4)
+        assert self.view_model.busy_values == [True, False]
+
+    def test_coroutine_error(self):
+        """should pass coroutine error to on_error"""
+        self._run_async((self.view_model.fail, ()))
+
+        error = self.on_error.call_args[0][0]
+        assert isinstance(error, ValueError)
+
+    def test_restart(self):
+        """should cancel previous run when handler is triggered again"""
+        self._run_async((self.view_model.search, (1,)), (self.view_model.search, (2,)))
+
+        assert self.view_model.loaded.call_args_list == [call(2)]
+        assert not self.on_error.called
+
+    def test_requires_event_loop(self):
+        """should raise error if coroutine is run without event loop"""
+        with raises(RuntimeError):
+            self.runner.run(self.view_model.fetch, (1,), {}, self.on_error)
+
+        assert self.view_model.busy_values == [True, False]
+
+    def test_thread(self):
+        """should run handler in thread and pass result on main loop"""
+        dispatcher = use_dispatcher()
+        dispatcher.master = Mock()
+
+        run = self.runner.run(self.view_model.load, (2,), {}, self.on_error)
+        busy_while_running = self.view_model.loading
+        self.view_model.release.set()
+        run.future.result(5)
+        for _ in range(500):
+            if dispatcher.drain():
+                break
+            sleep(0.01)
+
+        assert busy_while_running
+        assert self.view_model.loaded.call_args == call(4)
+        assert not self.view_model.loading
+        self.runner.shutdown()
@@ -0,0 +1,76 @@
+from tkinter import Frame, PanedWindow
+from unittest.mock import Mock
+
+from pytest import mark
+from pyviews.core.xml import XmlAttr, XmlNode
+from pyviews.pipes import apply_attributes
+
+from tkviews.core import FusedPipeline, TkRenderingContext
+from tkviews.core.pipeline import is_pipe_needed
+from tkviews.widgets.node import add_to_panedwindow, apply_text, render_widget_children
+
+
+@mark.parametrize('pipe, xml_node, master_type, expected', [
+    (apply_attributes, XmlNode('tkinter', 'Label'), Frame, False),
+    (apply_attributes, XmlNode('tkinter', 'Label', attrs = [XmlAttr('text', 'value')]), Frame, True),
+    (apply_text, XmlNode('tkinter', 'Label', text = '  '), Frame, False),
+    (apply_text, XmlNode('tkinter', 'Label', text = 'value'), Frame, True),
+    (add_to_panedwindow, XmlNode('tkinter', 'Label'), Frame, False),
+    (add_to_panedwindow, XmlNode('tkinter', 'Label'), PanedWindow, True),
+    (render_widget_children, XmlNode('tkinter', 'Label'), Frame, False),
+    (render_widget_children, XmlNode('tkinter', 'Frame', children = [XmlNode('tkinter', 'Label')]), Frame, True),
+    (Mock(), XmlNode('tkinter', 'Label'), Frame, True)
+]) # yapf: disable
+def test_is_pipe_needed(pipe, xml_node, master_type, expected):
+    """should return result of registered condition or True"""
+    assert is_pipe_needed(pipe, xml_node, master_type) == expected
+
+
+class FusedPipelineTests:
+    """FusedPipeline tests"""
+
+    @staticmethod
+    def test_runs_needed_pipes():
+        """should create node and run only needed pipes"""
+        node, text_pipe, pipe = Mock(), Mock(), Mock()
+        pipeline = FusedPipeline([apply_text, pipe], create_node = lambda ctx: node)
+        context = TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label'), 'master': Frame.__new__(Frame)})
+
+        actual = pipeline.run(context)
+
+        assert actual is node
+        assert pipe.call_args[0] == (node, context)
+        assert pipeline.get_pipes(context.xml_node, Frame) == (pipe,)
+
+    @staticmethod
+    def test_caches_pipes_per_template():
+        """should return same pipes for same xml node and master type"""
+        pipeline = FusedPipeline([apply_text, add_to_panedwindow])
+        xml_node = XmlNode('tkinter', 'Label', text = 'value')
+
+        first = pipeline.get_pipes(xml_node, Frame)
+
+        assert pipeline.get_pipes(xml_node, Frame) is first
+        assert pipeline.get_pipes(xml_node, PanedWindow) == (apply_text, add_to_panedwindow)
+
+    @staticmethod
+    def test_shares_pipes_between_same_templates():
+        """should return same pipes for xml nodes with the same shape"""
+        pipeline = FusedPipeline([apply_text, add_to_panedwindow])
+        first = pipeline.get_pipes(XmlNode('tkinter', 'Label', text = 'value'), Frame)
+
+        actual = pipeline.get_pipes(XmlNode('tkinter', 'Label', text = 'value'), Frame)
+
+        assert actual is first
+        assert pipeline.get_pipes(XmlNode('tkinter', 'Label'), Frame) == ()
+
+    @staticmethod
+    def test_removes_least_recently_used():
+        """should keep max_size fused templates"""
+        pipeline = FusedPipeline([Mock()], max_size = 1)
+        one, two = XmlNode('tkinter', 'Label'), XmlNode('tkinter', 'Button')
+        first = pipeline.get_pipes(one, Frame)
+
+        pipeline.get_pipes(two, Frame)
+
+        assert pipeline.get_pipes(one, Frame) is not first
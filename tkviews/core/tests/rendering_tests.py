@@ -1,12 +1,14 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from pytest import mark
+from pytest import fixture, mark
+from pyviews.core.expression import execute
 from pyviews.core.rendering import Node, NodeGlobals
 from pyviews.core.xml import XmlAttr
 from pyviews.setters import call
 
 from tkviews import bind
-from tkviews.core import render_attribute
+from tkviews.core import ChildGlobals, ChildrenRendering, TkRenderingContext, render_attribute
+from tkviews.core import rendering
 
 
 @mark.parametrize('node_globals, xml_attr, setter, value', [
@@ -20,3 +22,147 @@ def test_render_attribute(node_globals, xml_attr, setter, value):
     actual = render_attribute(node, xml_attr)
 
     assert actual == (setter, value)
+
+
+class ChildGlobalsTests:
+    """ChildGlobals tests"""
+
+    @staticmethod
+    def test_does_not_inherit_on_write():
+        """should not copy parent values and subscribe to parent on write"""
+        parent = NodeGlobals({'one': 1})
+
+        child = ChildGlobals(parent)
+        child['two'] = 2
+
+        assert dict.get(child, 'one') is None
+        assert not parent._all_callbacks
+
+    @staticmethod
+    def test_inherits_parent_values():
+        """should return parent values"""
+        parent = NodeGlobals({'one': 1, 'two': 2})
+
+        child = ChildGlobals(parent)
+        child['two'] = 'child two'
+
+        assert child['one'] == 1
+        assert child['two'] == 'child two'
+        assert parent['two'] == 2
+
+    @staticmethod
+    def test_observes_parent_after_inheriting():
+        """should update values on parent changes"""
+        parent = NodeGlobals({'one': 1})
+        child = ChildGlobals(parent)
+        child['two'] = 2
+        assert 'one' in child
+
+        parent['one'] = 'new one'
+        parent['two'] = 'parent two'
+
+        assert child['one'] == 'new one'
+        assert child['two'] == 2
+
+    @staticmethod
+    def test_inherits_values_set_before_reading():
+        """should inherit parent values that are set before first read"""
+        parent = NodeGlobals()
+        child = ChildGlobals(parent)
+
+        parent['one'] = 1
+
+        assert child.get('one') == 1
+
+    @staticmethod
+    def test_inherits_through_chain():
+        """should inherit values from not inherited parent"""
+        root = NodeGlobals({'one': 1})
+        parent = ChildGlobals(root)
+        parent['two'] = 2
+        child = ChildGlobals(parent)
+
+        assert dict(child) == {'one': 1, 'two': 2}
+
+    @staticmethod
+    @mark.parametrize('expression, expected', [
+        ('one + 1', 2),
+        ('[one + i for i in range(2)]', [1, 2]),
+        ('(lambda: one)()', 1)
+    ]) # yapf: disable
+    def test_used_in_expressions(expression, expected):
+        """should provide parent values to expression"""
+        child = ChildGlobals(NodeGlobals({'one': 1}))
+
+        actual = execute(expression, child)
+
+        assert actual == expected
+
+
+@fixture
+def children_rendering_fixture(request):
+    with patch(rendering.__name__ + '.render') as render_mock:
+        with patch(rendering.__name__ + '.perf_counter') as perf_counter_mock:
+            perf_counter_mock.side_effect = [0, 0.01, 0.02, 0.03, 0.04, 0.05]
+            render_mock.side_effect = lambda ctx: ctx
+            xml_nodes = [Mock(), Mock(), Mock()]
+            request.cls.node = Node(Mock(children = xml_nodes))
+            request.cls.xml_nodes = xml_nodes
+            request.cls.master = Mock()
+            request.cls.context = TkRenderingContext()
+            request.cls.rendering = ChildrenRendering(
+                request.cls.node, request.cls.context, lambda x, n, c: x, request.cls.master, 15
+            )
+            yield render_mock
+
+
+@mark.usefixtures('children_rendering_fixture')
+class ChildrenRenderingTests:
+    """ChildrenRendering tests"""
+
+    node: Node
+    xml_nodes: list
+    master: Mock
+    rendering: ChildrenRendering
+
+    def _run_scheduled(self):
+        self.master.after_idle.call_args[0][0]()
+
+    def test_renders_first_slice(self):
+        """should render children until budget is exceeded and schedule next slice"""
+        self.rendering.start()
+
+        assert self.node.children == self.xml_nodes[:2]
+        assert self.master.after_idle.called
+        assert not self.rendering.done
+
+    def test_renders_rest_in_next_slices(self):
+        """should render remaining children in scheduled slice"""
+        self.rendering.start()
+
+        self._run_scheduled()
+
+        assert self.node.children == self.xml_nodes
+        assert self.rendering.done
+
+    def test_calls_done_callbacks(self):
+        """should call done callbacks when all children are rendered"""
+        callback, late_callback = Mock(), Mock()
+        self.rendering.add_done_callback(callback)
+        self.rendering.start()
+        assert not callback.called
+
+        self._run_scheduled()
+        self.rendering.add_done_callback(late_callback)
+
+        assert callback.call_args[0] == (self.node,)
+        assert late_callback.call_args[0] == (self.node,)
+
+    def test_cancel(self):
+        """should cancel scheduled slice"""
+        self.master.after_idle.return_value = 'after id'
+        self.rendering.start()
+
+        self.rendering.cancel()
+
+        assert self.master.after_cancel.call_args[0] == ('after id',)
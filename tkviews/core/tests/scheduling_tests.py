@@ -0,0 +1,174 @@
+from unittest.mock import Mock, call
+
+from injectool import resolve
+from pytest import fixture, mark
+from pyviews.binding.binder import Binder, BindingContext
+from pyviews.core.binding import BindableEntity
+from pyviews.core.rendering import Node
+from pyviews.core.xml import XmlAttr, XmlNode
+
+from tkviews.core.scheduling import UpdateScheduler, immediate_updates, use_update_scheduler
+
+
+@fixture
+def scheduler_fixture(request):
+    request.cls.master = Mock()
+    request.cls.scheduler = UpdateScheduler(master = request.cls.master)
+    request.cls.setter = Mock()
+    request.cls.node = Mock()
+
+
+@mark.usefixtures('scheduler_fixture')
+class UpdateSchedulerTests:
+    """UpdateScheduler tests"""
+
+    master: Mock
+    scheduler: UpdateScheduler
+    setter: Mock
+    node: Mock
+
+    def _run_idle(self):
+        callback = self.master.after_idle.call_args[0][0]
+        self.master.after_idle.reset_mock()
+        callback()
+
+    def test_schedule(self):
+        """should apply update on idle"""
+        self.scheduler.schedule(self.setter, self.node, 'text', 'value')
+
+        assert not self.setter.called
+        assert self.master.after_idle.call_count == 1
+
+        self._run_idle()
+
+        assert self.setter.call_args == call(self.node, 'text', 'value')
+
+    def test_coalesces(self):
+        """should apply only last value of node attribute"""
+        other_node = Mock()
+        for value in range(10):
+            self.scheduler.schedule(self.setter, self.node, 'text', value)
+            self.scheduler.schedule(self.setter, other_node, 'text', value)
+
+        self._run_idle()
+
+        assert self.master.after_idle.call_count == 0
+        assert self.setter.call_args_list == [call(self.node, 'text', 9), call(other_node, 'text', 9)]
+
+    def test_budget(self):
+        """should apply one update and rest of updates on next idle if budget is exceeded"""
+        self.scheduler.budget = 0
+        other_node = Mock()
+        self.scheduler.schedule(self.setter, self.node, 'text', 'value')
+        self.scheduler.schedule(self.setter, other_node, 'text', 'value')
+
+        self._run_idle()
+
+        assert self.setter.call_args_list == [call(self.node, 'text', 'value')]
+        assert self.scheduler.pending == 1
+        assert self.master.after_idle.call_count == 1
+
+        self._run_idle()
+
+        assert self.scheduler.pending == 0
+        assert self.master.after_idle.call_count == 0
+
+    def test_flush(self):
+        """should apply pending updates immediately"""
+        self.scheduler.schedule(self.setter, self.node, 'text', 'value')
+
+        self.scheduler.flush()
+
+        assert self.setter.call_args == call(self.node, 'text', 'value')
+        assert self.scheduler.pending == 0
+
+    def test_immediate(self):
+        """should apply pending updates and updates inside with block immediately"""
+        self.scheduler.schedule(self.setter, self.node, 'text', 'value')
+
+        with self.scheduler.immediate():
+            assert self.setter.call_count == 1
+
+            self.scheduler.schedule(self.setter, self.node, 'text', 'new value')
+
+            assert self.setter.call_args == call(self.node, 'text', 'new value')
+
+    def test_discard(self):
+        """should remove pending update"""
+        self.scheduler.schedule(self.setter, self.node, 'text', 'value')
+
+        self.scheduler.discard(self.node, 'text')
+        self._run_idle()
+
+        assert not self.setter.called
+
+    def test_without_master(self, monkeypatch):
+        """should apply update immediately if there is no master"""
+        monkeypatch.setattr('tkinter._default_root', None)
+        scheduler = UpdateScheduler()
+
+        scheduler.schedule(self.setter, self.node, 'text', 'value')
+
+        assert self.setter.called
+
+
+class Model(BindableEntity):
+
+    def __init__(self):
+        super().__init__()
+        self.value = 1
+
+
+@mark.usefixtures('binder_fixture')
+class UseUpdateSchedulerTests:
+    """use_update_scheduler tests"""
+
+    @staticmethod
+    def _bind(setter: Mock) -> Node:
+        node = Node(XmlNode('tkinter', 'Label'), {'vm': Model()})
+        context = BindingContext({
+            'node': node,
+            'setter': setter,
+            'xml_attr': XmlAttr('text'),
+            'expression_body': 'vm.value'
+        })
+        resolve(Binder).bind('oneway', context)
+        return node
+
+    def test_schedules_updates(self):
+        """should apply initial value immediately and schedule changes"""
+        scheduler = use_update_scheduler()
+        scheduler.master = Mock()
+        setter = Mock()
+
+        node = self._bind(setter)
+        node.node_globals['vm'].value = 2
+        node.node_globals['vm'].value = 3
+
+        assert setter.call_args_list == [call(node, 'text', 1)]
+
+        scheduler.flush()
+
+        assert setter.call_args_list == [call(node, 'text', 1), call(node, 'text', 3)]
+
+    def test_immediate_updates(self):
+        """should apply updates inside with block immediately"""
+        use_update_scheduler().master = Mock()
+        setter = Mock()
+        node = self._bind(setter)
+
+        with immediate_updates():
+            node.node_globals['vm'].value = 2
+
+        assert setter.call_args == call(node, 'text', 2)
+
+    def test_discards_on_destroy(self):
+        """should discard pending updates of destroyed node"""
+        scheduler = use_update_scheduler()
+        scheduler.master = Mock()
+        node = self._bind(Mock())
+
+        node.node_globals['vm'].value = 2
+        node.destroy()
+
+        assert scheduler.pending == 0
@@ -0,0 +1,206 @@
+from os import utime
+from os.path import join
+from unittest.mock import Mock, patch
+
+from injectool import add_singleton
+from pytest import fixture, mark, raises
+from pyviews.rendering.views import ViewError
+
+from tkviews.compiler import compile_views
+from tkviews.core.expression import PrecompiledExpression, get_expression_cache
+from tkviews.core import views
+from tkviews.core.views import ViewsCache, ViewsCacheInfo, get_compiled_path, get_view_root, load_compiled_view, \
+    use_views_options
+
+VIEW = '''<?xml version="1.0"?>
+<Label xmlns="tkinter" text="{'compiled view expression'}" />
+'''
+
+
+@fixture
+def compiled_view_fixture(request, tmp_path):
+    xml_path = join(str(tmp_path), 'view.xml')
+    with open(xml_path, 'w', encoding = 'utf-8') as view_file:
+        view_file.write(VIEW)
+    compile_views(str(tmp_path))
+    request.cls.views_folder = str(tmp_path)
+    request.cls.xml_path = xml_path
+    request.cls.compiled_path = get_compiled_path(str(tmp_path), 'view')
+
+
+@mark.usefixtures('compiled_view_fixture')
+class LoadCompiledViewTests:
+    """load_compiled_view() tests"""
+
+    views_folder: str
+    xml_path: str
+    compiled_path: str
+
+    def test_loads_compiled_view(self):
+        """should return root xml node from compiled view"""
+        actual = load_compiled_view(self.views_folder, 'view', 'xml')
+
+        assert actual.name == 'Label'
+        assert actual.attrs[0].value == "{'compiled view expression'}"
+
+    def test_adds_compiled_expressions(self):
+        """should add compiled expressions to expression cache"""
+        load_compiled_view(self.views_folder, 'view', 'xml')
+
+        actual = get_expression_cache().get("{'compiled view expression'}")
+
+        assert isinstance(actual.expression, PrecompiledExpression)
+        assert actual.expression.code == "'compiled view expression'"
+
+    def test_ignores_outdated_compiled_view(self):
+        """should return None if xml file is newer than compiled view"""
+        utime(self.compiled_path, (1, 1))
+
+        actual = load_compiled_view(self.views_folder, 'view', 'xml')
+
+        assert actual is None
+
+    def test_returns_none_if_view_is_not_compiled(self):
+        """should return None if compiled view doesn't exist"""
+        actual = load_compiled_view(self.views_folder, 'other', 'xml')
+
+        assert actual is None
+
+
+@fixture
+def views_cache_fixture(request):
+    request.cls.cache = ViewsCache(2)
+
+
+@mark.usefixtures('views_cache_fixture')
+class ViewsCacheTests:
+    """ViewsCache tests"""
+
+    cache: ViewsCache
+
+    def test_loads_view(self):
+        """should load view if it is not cached"""
+        root = Mock()
+
+        actual = self.cache.get('path', 1, lambda: root)
+
+        assert actual is root
+        assert self.cache.info() == ViewsCacheInfo(0, 1, 2, 1)
+
+    def test_returns_cached_view(self):
+        """should return cached view if modification time is not changed"""
+        root = self.cache.get('path', 1, Mock)
+
+        actual = self.cache.get('path', 1, Mock)
+
+        assert actual is root
+        assert self.cache.info() == ViewsCacheInfo(1, 1, 2, 1)
+
+    def test_does_not_check_modification_time(self):
+        """should return cached view if modification time is None"""
+        root = self.cache.get('path', 1, Mock)
+
+        actual = self.cache.get('path', None, Mock)
+
+        assert actual is root
+
+    def test_reloads_modified_view(self):
+        """should load view again if modification time is changed"""
+        root = self.cache.get('path', 1, Mock)
+
+        actual = self.cache.get('path', 2, Mock)
+
+        assert actual is not root
+
+    def test_removes_least_recently_used(self):
+        """should remove least recently used view if size is exceeded"""
+        one = self.cache.get('one', 1, Mock)
+        self.cache.get('two', 1, Mock)
+        self.cache.get('one', 1, Mock)
+        self.cache.get('three', 1, Mock)
+
+        assert self.cache.get('one', 1, Mock) is one
+        assert self.cache.info().size == 2
+        self.cache.get('two', 1, Mock)
+        assert self.cache.info().misses == 4
+
+
+@fixture
+def view_root_fixture(request, tmp_path, container_fixture):
+    xml_path = join(str(tmp_path), 'view.xml')
+    with open(xml_path, 'w', encoding = 'utf-8') as view_file:
+        view_file.write(VIEW)
+    add_singleton('views_folder', str(tmp_path))
+    add_singleton('view_ext', 'xml')
+    request.cls.xml_path = xml_path
+    request.cls.views_folder = str(tmp_path)
+
+
+@mark.usefixtures('view_root_fixture')
+class GetViewRootTests:
+    """get_view_root() tests"""
+
+    xml_path: str
+    views_folder: str
+
+    def test_parses_view(self):
+        """should return parsed view root"""
+        actual = get_view_root('view')
+
+        assert actual.name == 'Label'
+
+    def test_returns_cached_view(self):
+        """should return cached view root if file is not modified"""
+        root = get_view_root('view')
+
+        actual = get_view_root('view')
+
+        assert actual is root
+
+    @staticmethod
+    def test_does_not_check_files():
+        """should return cached view root without files check if reload is not used"""
+        root = get_view_root('view')
+
+        with patch(views.__name__ + '.getmtime') as getmtime:
+            actual = get_view_root('view')
+
+        assert actual is root
+        assert not getmtime.called
+
+    def test_parses_modified_view(self):
+        """should parse view again if file is modified and reload is used"""
+        use_views_options(reload = True)
+        root = get_view_root('view')
+        utime(self.xml_path, (1, 1))
+
+        actual = get_view_root('view')
+
+        assert actual is not root
+        assert actual == root
+
+    def test_ignores_compiled_view(self):
+        """should not check compiled view if compiled views are not used"""
+        compile_views(self.views_folder)
+
+        with patch(views.__name__ + '.getmtime') as getmtime:
+            actual = get_view_root('view')
+
+        assert actual.name == 'Label'
+        assert not getmtime.called
+
+    def test_loads_compiled_view(self):
+        """should load compiled view if compiled views are used"""
+        compile_views(self.views_folder)
+        use_views_options(compiled = True)
+
+        with patch(views.__name__ + '._parse_view') as parse_view:
+            actual = get_view_root('view')
+
+        assert actual.name == 'Label'
+        assert not parse_view.called
+
+    def test_raises_if_view_is_not_found(self):
+        """should raise ViewError if view file doesn't exist"""
+        with raises(ViewError):
+            get_view_root('other')
@@ -0,0 +1,179 @@
+"""Views loading"""
+
+from importlib.util import MAGIC_NUMBER, module_from_spec, spec_from_file_location
+from marshal import loads
+from os.path import getmtime, join
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.core.error import ViewInfo, error_handling
+from pyviews.core.rendering import Node, RenderingContext
+from pyviews.core.xml import XmlNode, parse
+from pyviews.rendering.pipeline import render
+from pyviews.rendering.views import ViewError
+
+from tkviews.core.cache import LruCache
+from tkviews.core.expression import CompiledExpression, PrecompiledExpression, get_expression_cache
+
+COMPILED_FOLDER = '__tkviews__'
+
+
+class ViewsCacheInfo(NamedTuple):
+    """Views cache statistics"""
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class ViewsCache:
+    """Least recently used cache of parsed views keyed by file path and modification time"""
+
+    def __init__(self, max_size: int = 64):
+        self._items: LruCache[str, Tuple[Any, XmlNode]] = LruCache(max_size)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum count of cached views"""
+        return self._items.max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._items.max_size = value
+
+    def get(self, path: str, modified: Any, load: Callable[[], XmlNode]) -> XmlNode:
+        """Returns cached view root or loads it if file is modified. Modification time is not checked if it is None"""
+        cached = self._items.get(path)
+        if cached is not None and (modified is None or cached[0] == modified):
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        root = load()
+        self._items.set(path, (modified, root))
+        return root
+
+    def info(self) -> ViewsCacheInfo:
+        """Returns cache statistics"""
+        return ViewsCacheInfo(self.hits, self.misses, self.max_size, len(self._items))
+
+    def clear(self):
+        """Removes cached views and resets statistics"""
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class ViewsOptions(NamedTuple):
+    """Views loading options"""
+    compiled: bool = False
+    reload: bool = False
+
+
+def use_views_options(compiled: bool = False, reload: bool = False):
+    """
+    Configures views loading. compiled - compiled views are used if they are newer than xml files,
+    reload - changed views files are loaded again, files are checked on every render
+    """
+    add_singleton(ViewsOptions, ViewsOptions(compiled, reload))
+
+
+def get_views_options() -> ViewsOptions:
+    """Returns used views loading options"""
+    try:
+        return resolve(ViewsOptions)
+    except DependencyError:
+        return _DEFAULT_OPTIONS
+
+
+_DEFAULT_OPTIONS = ViewsOptions()
+_VIEWS_CACHE = ViewsCache()
+
+
+def get_views_cache() -> ViewsCache:
+    """Returns process wide views cache"""
+    return _VIEWS_CACHE
+
+
+def render_tk_view(view_name: str, context: RenderingContext) -> Node:
+    """Renders view using cached view root"""
+    with error_handling(ViewError, lambda e: e.add_view_info(ViewInfo(view_name, None))):
+        context.xml_node = get_view_root(view_name)
+        return render(context)
+
+
+def get_view_root(view_name: str) -> XmlNode:
+    """
+    Returns view root xml node from compiled view or from xml file.
+    Cached view is returned without files check if reload is not used
+    """
+    views_folder, view_ext = resolve('views_folder'), resolve('view_ext')
+    options = get_views_options()
+    xml_path = _get_xml_path(views_folder, view_name, view_ext)
+    modified = _get_views_modified(views_folder, view_name, view_ext, options) if options.reload else None
+    return _VIEWS_CACHE.get(xml_path, modified, lambda: _load_view(views_folder, view_name, view_ext, options))
+
+
+def _get_views_modified(views_folder: str, view_name: str, view_ext: str, options: ViewsOptions) -> tuple:
+    compiled_time = _get_modified(get_compiled_path(views_folder, view_name)) if options.compiled else None
+    return compiled_time, _get_modified(_get_xml_path(views_folder, view_name, view_ext))
+
+
+def _load_view(views_folder: str, view_name: str, view_ext: str, options: ViewsOptions) -> XmlNode:
+    if options.compiled:
+        compiled_root = load_compiled_view(views_folder, view_name, view_ext)
+        if compiled_root is not None:
+            return compiled_root
+    xml_path = _get_xml_path(views_folder, view_name, view_ext)
+    try:
+        return _parse_view(xml_path, view_name)
+    except FileNotFoundError as not_found:
+        error = ViewError('View is not found')
+        error.add_info('View name', view_name)
+        error.add_info('Path', xml_path)
+        raise error from not_found
+
+
+def get_compiled_path(views_folder: str, view_name: str) -> str:
+    """Returns path to compiled view module"""
+    return join(views_folder, COMPILED_FOLDER, f'{view_name}.py')
+
+
+def load_compiled_view(views_folder: str, view_name: str, view_ext: str) -> Optional[XmlNode]:
+    """Returns root xml node from compiled view if compiled view is newer than xml file"""
+    compiled_path = get_compiled_path(views_folder, view_name)
+    compiled_time = _get_modified(compiled_path)
+    if compiled_time is None:
+        return None
+    xml_time = _get_modified(_get_xml_path(views_folder, view_name, view_ext))
+    if xml_time is not None and compiled_time < xml_time:
+        return None
+    return _import_compiled_view(compiled_path, view_name)
+
+
+def _get_xml_path(views_folder: str, view_name: str, view_ext: str) -> str:
+    return join(views_folder, f'{view_name}.{view_ext}')
+
+
+def _get_modified(path: str) -> Optional[float]:
+    try:
+        return getmtime(path)
+    except OSError:
+        return None
+
+
+def _parse_view(xml_path: str, view_name: str) -> XmlNode:
+    with open(xml_path, 'rb') as xml_file:
+        return parse(xml_file, view_name)
+
+
+def _import_compiled_view(compiled_path: str, view_name: str) -> XmlNode:
+    spec = spec_from_file_location(f'{COMPILED_FOLDER}.{view_name.replace("/", ".")}', compiled_path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if module.MAGIC == MAGIC_NUMBER:
+        cache = get_expression_cache()
+        for source, binding_type, body, code in module.EXPRESSIONS:
+            cache.add(source, CompiledExpression(binding_type, PrecompiledExpression(body, loads(code))))
+    return module.ROOT
@@ -0,0 +1,7 @@
+"""Rendering and event loop diagnostics"""
+
+from .instrumentation import RenderRecorder, InstrumentedPipeline, use_instrumentation
+from .metrics import RenderMetrics, Timing, use_render_metrics, dump_metrics
+from .tracing import Tracer, use_tracing, dump_trace
+from .watchdog import Watchdog, Stall, StallStats, use_watchdog
+from .tcl import TclProfiler, TclStats, use_tcl_profiler
@@ -0,0 +1,155 @@
+"""Rendering pipelines instrumentation"""
+
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Iterable, List, Optional
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.core.rendering import Node, RenderingContext
+from pyviews.rendering.pipeline import Pipe, RenderingPipeline, render_view, use_pipeline
+
+TKVIEWS_PIPELINES = (
+    'tkviews.Root', 'tkinter', 'tkinter.ttk', 'tkviews.PresenterNode', 'tkviews.Container', 'tkviews.View',
+    'tkviews.For', 'tkviews.If', 'tkviews.Style', 'tkviews.StylesView', 'tkviews.TtkStyle', 'tkviews.canvas',
+    'tkviews.ListboxItem', 'tkviews.Code'
+)
+
+
+class RenderRecorder:
+    """Receives durations of pipelines, pipes and views rendering"""
+
+    def __init__(self):
+        self.enabled: bool = True
+
+    def add_pipeline(self, pipeline: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipeline run"""
+
+    def pipe_started(self, pipeline: str, pipe: str, context: RenderingContext):
+        """Called before pipe call"""
+
+    def add_pipe(self, pipeline: str, pipe: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipe call"""
+
+    def add_view(self, view: str, start: float, duration: float):
+        """Adds view rendering"""
+
+
+def get_pipe_name(pipe: Any) -> str:
+    """Returns readable pipe name"""
+    if isinstance(pipe, partial):
+        pipe = pipe.func
+    return getattr(pipe, '__qualname__', None) or repr(pipe)
+
+
+def get_pipeline_name(pipeline: RenderingPipeline) -> str:
+    """Returns pipeline name"""
+    return pipeline._name or type(pipeline).__name__  # pylint: disable=protected-access
+
+
+class TimedPipe:
+    """Pipe wrapper that passes call duration to recorders"""
+
+    def __init__(self, pipe: Pipe, pipeline_name: str, recorders: List[RenderRecorder], name: Optional[str] = None):
+        self.__wrapped__: Pipe = pipe
+        self.name: str = name if name else get_pipe_name(pipe)
+        self._pipeline_name: str = pipeline_name
+        self._recorders: List[RenderRecorder] = recorders
+
+    def __call__(self, *args):
+        for recorder in self._recorders:
+            if recorder.enabled:
+                recorder.pipe_started(self._pipeline_name, self.name, args[-1])
+        start = perf_counter()
+        try:
+            return self.__wrapped__(*args)
+        finally:
+            duration = perf_counter() - start
+            for recorder in self._recorders:
+                if recorder.enabled:
+                    recorder.add_pipe(self._pipeline_name, self.name, args[-1], start, duration)
+
+    def __repr__(self):
+        return repr(self.__wrapped__)
+
+
+class InstrumentedPipeline(RenderingPipeline):
+    """Pipeline wrapper that passes pipeline and pipes durations to recorders"""
+
+    def __init__(self, pipeline: RenderingPipeline, recorders: Optional[List[RenderRecorder]] = None):
+        name = get_pipeline_name(pipeline)
+        super().__init__(name = name)
+        self.pipeline: RenderingPipeline = pipeline
+        self.recorders: List[RenderRecorder] = recorders if recorders else []
+        self._timed: RenderingPipeline = type(pipeline)(
+            pipes = [TimedPipe(pipe, name, self.recorders) for pipe in _get_pipes(pipeline)],
+            create_node = TimedPipe(_get_create_node(pipeline), name, self.recorders, 'create_node'),
+            name = name
+        )
+
+    def run(self, context: RenderingContext) -> Node:
+        if not any(recorder.enabled for recorder in self.recorders):
+            return self.pipeline.run(context)
+        start = perf_counter()
+        try:
+            return self._timed.run(context)
+        finally:
+            duration = perf_counter() - start
+            for recorder in self.recorders:
+                if recorder.enabled:
+                    recorder.add_pipeline(self._name, context, start, duration)
+
+
+def _get_pipes(pipeline: RenderingPipeline) -> List[Pipe]:
+    return pipeline._pipes  # pylint: disable=protected-access
+
+
+def _get_create_node(pipeline: RenderingPipeline) -> Callable:
+    return pipeline._create_node  # pylint: disable=protected-access
+
+
+class TimedRenderView:
+    """render_view implementation that passes view rendering duration to recorders"""
+
+    def __init__(self, view_render: Callable[[str, RenderingContext], Node]):
+        self.view_render = view_render
+        self.recorders: List[RenderRecorder] = []
+
+    def __call__(self, view_name: str, context: RenderingContext) -> Node:
+        if not any(recorder.enabled for recorder in self.recorders):
+            return self.view_render(view_name, context)
+        start = perf_counter()
+        try:
+            return self.view_render(view_name, context)
+        finally:
+            duration = perf_counter() - start
+            for recorder in self.recorders:
+                if recorder.enabled:
+                    recorder.add_view(view_name, start, duration)
+
+
+def use_instrumentation(recorder: RenderRecorder, class_paths: Iterable[str] = TKVIEWS_PIPELINES):
+    """Wraps registered pipelines and render_view to pass rendering durations to recorder"""
+    for class_path in class_paths:
+        try:
+            pipeline = resolve((RenderingPipeline, class_path))
+        except DependencyError:
+            continue
+        if not isinstance(pipeline, InstrumentedPipeline):
+            pipeline = InstrumentedPipeline(pipeline)
+            use_pipeline(pipeline, class_path)
+        if recorder not in pipeline.recorders:
+            pipeline.recorders.append(recorder)
+    view_render = _get_timed_render_view()
+    if recorder not in view_render.recorders:
+        view_render.recorders.append(recorder)
+
+
+def _get_timed_render_view() -> TimedRenderView:
+    try:
+        view_render = resolve(render_view)
+    except DependencyError:
+        view_render = render_view.__wrapped__
+    if not isinstance(view_render, TimedRenderView):
+        view_render = TimedRenderView(view_render)
+        add_singleton(render_view, view_render)
+    return view_render
@@ -0,0 +1,110 @@
+"""Rendering timing metrics"""
+
+from bisect import bisect_left
+from json import dump
+from typing import Dict, Iterable, List, Optional, TextIO, Union
+
+from pyviews.core.rendering import RenderingContext
+
+from tkviews.diagnostics.instrumentation import TKVIEWS_PIPELINES, RenderRecorder, use_instrumentation
+
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Timing:
+    """Calls count and duration histogram"""
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0
+        self.max: float = 0
+        self.buckets: List[int] = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, duration: float):
+        """Adds call duration in seconds"""
+        duration_ms = duration * 1000
+        self.count += 1
+        self.total += duration_ms
+        self.max = max(self.max, duration_ms)
+        self.buckets[bisect_left(BUCKETS_MS, duration_ms)] += 1
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in milliseconds"""
+        return self.total / self.count if self.count else 0
+
+    def to_dict(self) -> dict:
+        """Returns json serializable timing"""
+        histogram = {f'<={bound}': count for bound, count in zip(BUCKETS_MS, self.buckets)}
+        histogram[f'>{BUCKETS_MS[-1]}'] = self.buckets[-1]
+        return {
+            'count': self.count,
+            'total_ms': self.total,
+            'mean_ms': self.mean,
+            'max_ms': self.max,
+            'histogram': histogram
+        }
+
+
+class RenderMetrics(RenderRecorder):
+    """Rendering timings per pipeline, pipe and view"""
+
+    def __init__(self):
+        super().__init__()
+        self.pipelines: Dict[str, Timing] = {}
+        self.pipes: Dict[str, Dict[str, Timing]] = {}
+        self.views: Dict[str, Timing] = {}
+
+    def add_pipeline(self, pipeline: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipeline run duration"""
+        _get_timing(self.pipelines, pipeline).add(duration)
+
+    def add_pipe(self, pipeline: str, pipe: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipe call duration"""
+        _get_timing(self.pipes.setdefault(pipeline, {}), pipe).add(duration)
+
+    def add_view(self, view: str, start: float, duration: float):
+        """Adds view rendering duration"""
+        _get_timing(self.views, view).add(duration)
+
+    def to_dict(self) -> dict:
+        """Returns json serializable metrics"""
+        return {
+            'pipelines': {name: timing.to_dict() for name, timing in self.pipelines.items()},
+            'pipes': {
+                pipeline: {name: timing.to_dict() for name, timing in pipes.items()}
+                for pipeline, pipes in self.pipes.items()
+            },
+            'views': {name: timing.to_dict() for name, timing in self.views.items()}
+        }
+
+    def reset(self):
+        """Removes collected timings"""
+        self.pipelines = {}
+        self.pipes = {}
+        self.views = {}
+
+
+def _get_timing(timings: Dict[str, Timing], key: str) -> Timing:
+    timing = timings.get(key)
+    if timing is None:
+        timing = timings[key] = Timing()
+    return timing
+
+
+def dump_metrics(metrics: RenderMetrics, file: Union[str, TextIO]):
+    """Writes metrics to json file"""
+    if isinstance(file, str):
+        with open(file, 'w', encoding = 'utf-8') as json_file:
+            dump(metrics.to_dict(), json_file, indent = 2)
+    else:
+        dump(metrics.to_dict(), file, indent = 2)
+
+
+def use_render_metrics(
+    metrics: Optional[RenderMetrics] = None, class_paths: Iterable[str] = TKVIEWS_PIPELINES
+) -> RenderMetrics:
+    """Wraps registered pipelines and render_view to record timings"""
+    metrics = metrics if metrics else RenderMetrics()
+    use_instrumentation(metrics, class_paths)
+    return metrics
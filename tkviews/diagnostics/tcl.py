@@ -0,0 +1,224 @@
+"""Tcl interpreter calls profiling"""
+
+from contextlib import contextmanager
+from time import perf_counter
+from tkinter import Tk
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.core.error import ViewInfo
+from pyviews.core.rendering import RenderingContext
+
+from tkviews.core.callbacks import CallbackInfo, CallbackListener, add_callback_listener, current_callback, \
+    remove_callback_listener, use_binding_callbacks
+from tkviews.diagnostics.instrumentation import TKVIEWS_PIPELINES, RenderRecorder, use_instrumentation
+from tkviews.widgets.node import create_tk
+
+_OUTSIDE = 'outside of tkviews'
+
+
+class TclStats:
+    """Tcl calls count and cumulative time by command and call site"""
+
+    def __init__(self):
+        self.count: int = 0
+        self.time: float = 0
+        self.commands: Dict[str, List[float]] = {}
+        self.sites: Dict[str, List[float]] = {}
+
+    def add(self, command: str, site: str, duration: float):
+        """Adds Tcl call"""
+        self.count += 1
+        self.time += duration
+        _add(self.commands, command, duration)
+        _add(self.sites, site, duration)
+
+    def top_commands(self, count: int = 10, by_time: bool = False) -> List[dict]:
+        """Returns commands with most calls or time"""
+        return _top(self.commands, count, by_time)
+
+    def top_sites(self, count: int = 10, by_time: bool = False) -> List[dict]:
+        """Returns call sites with most calls or time"""
+        return _top(self.sites, count, by_time)
+
+    def to_dict(self, count: int = 10) -> dict:
+        """Returns top commands and call sites by count and cumulative time"""
+        return {
+            'calls': self.count,
+            'time_ms': self.time * 1000,
+            'commands_by_count': self.top_commands(count),
+            'commands_by_time': self.top_commands(count, by_time = True),
+            'sites_by_count': self.top_sites(count),
+            'sites_by_time': self.top_sites(count, by_time = True)
+        }
+
+
+def _add(stats: Dict[str, List[float]], key: str, duration: float):
+    try:
+        item = stats[key]
+        item[0] += 1
+        item[1] += duration
+    except KeyError:
+        stats[key] = [1, duration]
+
+
+def _top(stats: Dict[str, List[float]], count: int, by_time: bool) -> List[dict]:
+    items = sorted(stats.items(), key = lambda item: item[1][1 if by_time else 0], reverse = True)
+    return [{'name': name, 'count': calls, 'time_ms': time * 1000} for name, (calls, time) in items[:count]]
+
+
+class TclProfiler(RenderRecorder, CallbackListener):
+    """Attributes Tcl calls to running pipe or callback"""
+
+    def __init__(self):
+        super().__init__()
+        self.stats: TclStats = TclStats()
+        self._windows: List[TclStats] = []
+        self._pipes: List[str] = []
+
+    def attach(self, root: Tk) -> Tk:
+        """Replaces root interpreter with profiled one. Widgets created before keep original interpreter"""
+        if not isinstance(root.tk, ProfiledTkapp):
+            root.tk = ProfiledTkapp(root.tk, self)
+        return root
+
+    def pipe_started(self, pipeline: str, pipe: str, context: RenderingContext):
+        """Pushes call site"""
+        self._pipes.append(_get_site(f'{pipeline}.{pipe}', _get_view_info(context)))
+
+    def add_pipe(self, pipeline: str, pipe: str, context: RenderingContext, start: float, duration: float):
+        """Pops call site"""
+        if self._pipes:
+            self._pipes.pop()
+
+    def add_call(self, command: str, duration: float):
+        """Adds Tcl call to current call site"""
+        if not self.enabled:
+            return
+        site = self.get_site()
+        self.stats.add(command, site, duration)
+        for window in self._windows:
+            window.add(command, site, duration)
+
+    def get_site(self) -> str:
+        """Returns current call site"""
+        if self._pipes:
+            return self._pipes[-1]
+        callback: Optional[CallbackInfo] = current_callback()
+        if callback is None:
+            return _OUTSIDE
+        return _get_site(f'{callback.kind} {callback.name}', callback.view_info)
+
+    @contextmanager
+    def measure(self) -> Iterator[TclStats]:
+        """Collects Tcl calls made inside with block to separate stats"""
+        window = TclStats()
+        self._windows.append(window)
+        try:
+            yield window
+        finally:
+            self._windows.remove(window)
+
+    def reset(self):
+        """Removes collected stats"""
+        self.stats = TclStats()
+
+    def stop(self):
+        """Stops profiling"""
+        self.enabled = False
+        remove_callback_listener(self)
+
+
+def _get_view_info(context: RenderingContext) -> Optional[ViewInfo]:
+    xml_node = context.get('xml_node')
+    return xml_node.view_info if xml_node is not None else None
+
+
+def _get_site(name: str, view_info: Optional[ViewInfo]) -> str:
+    if view_info is None:
+        return name
+    return f'{name} ({view_info.view}, line {view_info.line})'
+
+
+class ProfiledTkapp:
+    """Tcl interpreter proxy that passes calls durations to profiler"""
+
+    def __init__(self, tkapp: Any, profiler: TclProfiler):
+        self.tkapp: Any = tkapp
+        self._profiler: TclProfiler = profiler
+
+    def call(self, *args):
+        """Calls Tcl command"""
+        start = perf_counter()
+        try:
+            return self.tkapp.call(*args)
+        finally:
+            self._profiler.add_call(get_command(args), perf_counter() - start)
+
+    def eval(self, script: str):
+        """Evaluates Tcl script"""
+        start = perf_counter()
+        try:
+            return self.tkapp.eval(script)
+        finally:
+            self._profiler.add_call(get_command(script.split(None, 2)), perf_counter() - start)
+
+    def _profile_var(self, name: str, method: str, *args):
+        start = perf_counter()
+        try:
+            return getattr(self.tkapp, method)(*args)
+        finally:
+            self._profiler.add_call(name, perf_counter() - start)
+
+    def getvar(self, *args):
+        """Gets Tcl variable"""
+        return self._profile_var('getvar', 'getvar', *args)
+
+    def setvar(self, *args):
+        """Sets Tcl variable"""
+        return self._profile_var('setvar', 'setvar', *args)
+
+    def globalgetvar(self, *args):
+        """Gets global Tcl variable"""
+        return self._profile_var('getvar', 'globalgetvar', *args)
+
+    def globalsetvar(self, *args):
+        """Sets global Tcl variable"""
+        return self._profile_var('setvar', 'globalsetvar', *args)
+
+    def __getattr__(self, name: str):
+        return getattr(self.tkapp, name)
+
+
+def get_command(args: Iterable[Any]) -> str:
+    """Returns command name with subcommand, widget path is replaced with "widget" """
+    args = list(args)
+    if len(args) == 1 and isinstance(args[0], tuple):
+        args = list(args[0])
+    if not args:
+        return ''
+    command = str(args[0])
+    if command.startswith('.'):
+        command = 'widget'
+    if len(args) > 1 and isinstance(args[1], str) and args[1].isalpha():
+        return f'{command} {args[1]}'
+    return command
+
+
+def use_tcl_profiler(profiler: Optional[TclProfiler] = None,
+                     class_paths: Iterable[str] = TKVIEWS_PIPELINES) -> TclProfiler:
+    """Profiles Tcl calls of created roots by pipes and callbacks"""
+    profiler = profiler if profiler else TclProfiler()
+    profiler.enabled = True
+    use_instrumentation(profiler, class_paths)
+    add_callback_listener(profiler)
+    try:
+        use_binding_callbacks()
+    except DependencyError:
+        pass
+    try:
+        tk_factory = resolve(create_tk)
+    except DependencyError:
+        tk_factory = create_tk.__wrapped__
+    add_singleton(create_tk, lambda: profiler.attach(tk_factory()))
+    return profiler
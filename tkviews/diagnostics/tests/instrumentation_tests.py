@@ -0,0 +1,104 @@
+from functools import partial
+from unittest.mock import Mock
+
+from injectool import add_singleton, resolve
+from pytest import mark
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, render_view, use_pipeline
+
+from tkviews.core import FusedPipeline, TkRenderingContext
+from tkviews.diagnostics import InstrumentedPipeline, RenderRecorder, use_instrumentation
+from tkviews.diagnostics.instrumentation import get_pipe_name
+from tkviews.widgets.node import apply_text
+
+
+def _pipe(node, context):
+    pass
+
+
+@mark.parametrize('pipe, name', [
+    (_pipe, '_pipe'),
+    (partial(_pipe, context = None), '_pipe'),
+    (RenderRecorder.add_pipe, 'RenderRecorder.add_pipe')
+]) # yapf: disable
+def test_get_pipe_name(pipe, name):
+    """should return pipe qualified name"""
+    assert get_pipe_name(pipe) == name
+
+
+class InstrumentedPipelineTests:
+    """InstrumentedPipeline tests"""
+
+    @staticmethod
+    def test_passes_durations():
+        """should pass pipeline, pipes and create node durations to recorders"""
+        recorder = Mock(enabled = True)
+        node, pipe = Mock(), Mock()
+        pipeline = InstrumentedPipeline(
+            RenderingPipeline([_pipe, pipe], create_node = lambda ctx: node, name = 'test'), [recorder]
+        )
+        context = TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')})
+
+        actual = pipeline.run(context)
+
+        assert actual is node
+        assert pipe.call_args[0] == (node, context)
+        assert recorder.add_pipeline.call_args[0][:2] == ('test', context)
+        assert [call_args[0][:3] for call_args in recorder.add_pipe.call_args_list] == [
+            ('test', 'create_node', context),
+            ('test', '_pipe', context),
+            ('test', repr(pipe), context)
+        ]
+
+    @staticmethod
+    def test_disabled():
+        """should run wrapped pipeline if recorders are disabled"""
+        recorder = Mock(enabled = False)
+        pipeline = InstrumentedPipeline(RenderingPipeline([_pipe], create_node = Mock(), name = 'test'), [recorder])
+
+        pipeline.run(TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')}))
+
+        assert not recorder.add_pipeline.called
+        assert not recorder.add_pipe.called
+
+    @staticmethod
+    def test_keeps_fused_conditions():
+        """should drop not needed pipes of fused pipeline"""
+        recorder = Mock(enabled = True)
+        pipeline = InstrumentedPipeline(FusedPipeline([apply_text], create_node = Mock(), name = 'fused'), [recorder])
+
+        pipeline.run(TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')}))
+
+        assert [call_args[0][1] for call_args in recorder.add_pipe.call_args_list] == ['create_node']
+
+
+@mark.usefixtures('container_fixture')
+class UseInstrumentationTests:
+    """use_instrumentation tests"""
+
+    @staticmethod
+    def test_adds_recorders():
+        """should wrap pipeline once and add every recorder"""
+        use_pipeline(RenderingPipeline(name = 'widget'), 'tkinter')
+        one, two = RenderRecorder(), RenderRecorder()
+
+        use_instrumentation(one)
+        use_instrumentation(two)
+        use_instrumentation(two)
+
+        actual = resolve((RenderingPipeline, 'tkinter'))
+        assert actual.recorders == [one, two]
+        assert not isinstance(actual.pipeline, InstrumentedPipeline)
+
+    @staticmethod
+    def test_wraps_render_view():
+        """should pass view rendering duration to recorder"""
+        view_render, recorder = Mock(), Mock(enabled = True)
+        add_singleton(render_view, view_render)
+        context = TkRenderingContext()
+
+        use_instrumentation(recorder)
+        render_view('view', context)
+
+        assert view_render.call_args[0] == ('view', context)
+        assert recorder.add_view.call_args[0][0] == 'view'
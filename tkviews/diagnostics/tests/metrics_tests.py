@@ -0,0 +1,87 @@
+from io import StringIO
+from json import loads
+from unittest.mock import Mock
+
+from injectool import add_singleton, resolve
+from pytest import mark
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, render_view, use_pipeline
+
+from tkviews.core import TkRenderingContext
+from tkviews.diagnostics import InstrumentedPipeline, RenderMetrics, Timing, dump_metrics, use_render_metrics
+
+
+class TimingTests:
+    """Timing tests"""
+
+    @staticmethod
+    def test_add():
+        """should count calls and put duration to histogram bucket"""
+        timing = Timing()
+
+        timing.add(0.002)
+        timing.add(0.004)
+        timing.add(2)
+
+        actual = timing.to_dict()
+        assert actual['count'] == 3
+        assert actual['max_ms'] == 2000
+        assert actual['mean_ms'] == 2006 / 3
+        assert actual['histogram']['<=2.5'] == 1
+        assert actual['histogram']['<=5'] == 1
+        assert actual['histogram']['>1000'] == 1
+
+
+@mark.usefixtures('container_fixture')
+class UseRenderMetricsTests:
+    """use_render_metrics tests"""
+
+    @staticmethod
+    def test_wraps_registered_pipelines():
+        """should replace registered pipelines with instrumented ones"""
+        pipeline = RenderingPipeline(name = 'widget')
+        use_pipeline(pipeline, 'tkinter')
+
+        metrics = use_render_metrics()
+        use_render_metrics(metrics)
+
+        actual = resolve((RenderingPipeline, 'tkinter'))
+        assert isinstance(actual, InstrumentedPipeline)
+        assert actual.pipeline is pipeline
+        assert actual.recorders == [metrics]
+
+    @staticmethod
+    def test_records_pipelines():
+        """should record pipeline, pipes and node creation timings"""
+        use_pipeline(RenderingPipeline([Mock(__qualname__ = 'pipe')], create_node = Mock(), name = 'test'), 'tkinter')
+
+        metrics = use_render_metrics()
+        resolve((RenderingPipeline, 'tkinter')).run(TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')}))
+
+        assert metrics.pipelines['test'].count == 1
+        assert metrics.pipes['test']['pipe'].count == 1
+        assert metrics.pipes['test']['create_node'].count == 1
+
+    @staticmethod
+    def test_records_views():
+        """should record view rendering timings"""
+        view_render = Mock()
+        add_singleton(render_view, view_render)
+
+        metrics = use_render_metrics()
+        render_view('view', TkRenderingContext())
+
+        assert view_render.called
+        assert metrics.views['view'].count == 1
+
+
+def test_dump_metrics():
+    """should write metrics as json"""
+    metrics = RenderMetrics()
+    metrics.add_view('view', 0, 0.001)
+    file = StringIO()
+
+    dump_metrics(metrics, file)
+
+    actual = loads(file.getvalue())
+    assert actual['views']['view']['count'] == 1
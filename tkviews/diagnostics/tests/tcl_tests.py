@@ -0,0 +1,153 @@
+from unittest.mock import Mock
+
+from injectool import add_singleton, resolve
+from pytest import fixture, mark
+from pyviews.core.error import ViewInfo
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, use_pipeline
+
+from tkviews.core import TkRenderingContext
+from tkviews.core.callbacks import CallbackInfo, add_callback_listener, run_callback
+from tkviews.diagnostics import TclProfiler, TclStats, use_tcl_profiler
+from tkviews.diagnostics.tcl import ProfiledTkapp, get_command
+from tkviews.widgets.node import Root, create_tk
+
+
+class TclStatsTests:
+    """TclStats tests"""
+
+    @staticmethod
+    def test_to_dict():
+        """should return top commands and sites by count and time"""
+        stats = TclStats()
+        stats.add('widget configure', 'site', 0.001)
+        stats.add('widget configure', 'site', 0.001)
+        stats.add('pack configure', 'other site', 0.005)
+
+        actual = stats.to_dict(1)
+
+        assert actual['calls'] == 3
+        assert actual['commands_by_count'] == [{'name': 'widget configure', 'count': 2, 'time_ms': 2}]
+        assert actual['commands_by_time'] == [{'name': 'pack configure', 'count': 1, 'time_ms': 5}]
+        assert actual['sites_by_count'][0]['name'] == 'site'
+        assert actual['sites_by_time'][0]['name'] == 'other site'
+
+
+@mark.parametrize('args, expected', [
+    (('.!frame.!label', 'configure', '-text', 'a'), 'widget configure'),
+    ((('.!label', 'cget', '-text'),), 'widget cget'),
+    (('pack', 'configure', '.!label'), 'pack configure'),
+    (('after', 100, 'callback'), 'after'),
+    (('label', '.!label'), 'label')
+])  # yapf: disable
+def test_get_command(args, expected):
+    """should return command with subcommand"""
+    assert get_command(args) == expected
+
+
+@fixture
+def profiler_fixture(request):
+    request.cls.profiler = TclProfiler()
+    request.cls.tkapp = Mock()
+    request.cls.profiled = ProfiledTkapp(request.cls.tkapp, request.cls.profiler)
+
+
+@mark.usefixtures('profiler_fixture')
+class TclProfilerTests:
+    """TclProfiler tests"""
+
+    profiler: TclProfiler
+    tkapp: Mock
+    profiled: ProfiledTkapp
+
+    def test_call(self):
+        """should pass call to interpreter and add it to stats"""
+        self.tkapp.call.return_value = 'value'
+
+        actual = self.profiled.call('.!label', 'cget', '-text')
+
+        assert actual == 'value'
+        assert self.tkapp.call.call_args[0] == ('.!label', 'cget', '-text')
+        assert self.profiler.stats.commands['widget cget'][0] == 1
+        assert self.profiler.stats.sites['outside of tkviews'][0] == 1
+
+    def test_variables(self):
+        """should add variables access to stats"""
+        self.profiled.globalsetvar('name', 'value')
+        self.profiled.globalgetvar('name')
+
+        assert self.tkapp.globalsetvar.called
+        assert self.profiler.stats.commands['setvar'][0] == 1
+        assert self.profiler.stats.commands['getvar'][0] == 1
+
+    def test_pipe_site(self):
+        """should attribute calls to running pipe"""
+        xml_node = XmlNode('tkinter', 'Label', view_info = ViewInfo('view', 3))
+        context = TkRenderingContext({'xml_node': xml_node})
+
+        self.profiler.pipe_started('widget pipeline', 'apply_attributes', context)
+        self.profiled.call('.!label', 'configure')
+        self.profiler.add_pipe('widget pipeline', 'apply_attributes', context, 0, 0)
+        self.profiled.call('.!label', 'configure')
+
+        sites = self.profiler.stats.sites
+        assert sites['widget pipeline.apply_attributes (view, line 3)'][0] == 1
+        assert sites['outside of tkviews'][0] == 1
+
+    def test_callback_site(self):
+        """should attribute calls to running callback"""
+        add_callback_listener(self.profiler)
+        try:
+            info = CallbackInfo('command', 'Button-1', ViewInfo('view', 5))
+            run_callback(info, lambda: self.profiled.call('.!label', 'configure'))
+        finally:
+            self.profiler.stop()
+
+        assert self.profiler.stats.sites['command Button-1 (view, line 5)'][0] == 1
+
+    def test_measure(self):
+        """should collect calls made inside block to separate stats"""
+        self.profiled.call('update')
+        with self.profiler.measure() as window:
+            self.profiled.call('update')
+
+        assert window.count == 1
+        assert self.profiler.stats.count == 2
+
+    def test_disabled(self):
+        """should not add calls if disabled"""
+        self.profiler.enabled = False
+
+        self.profiled.call('update')
+
+        assert self.profiler.stats.count == 0
+
+
+@mark.usefixtures('container_fixture')
+class UseTclProfilerTests:
+    """use_tcl_profiler tests"""
+
+    @staticmethod
+    def test_attaches_to_root():
+        """should replace created root interpreter"""
+        add_singleton(create_tk, lambda: Mock(tk = Mock()))
+        profiler = use_tcl_profiler()
+        try:
+            root = Root(Mock())
+        finally:
+            profiler.stop()
+
+        assert isinstance(root.instance.tk, ProfiledTkapp)
+
+    @staticmethod
+    def test_instruments_pipelines():
+        """should receive pipes and node creation starts"""
+        use_pipeline(RenderingPipeline([Mock(__qualname__ = 'pipe')], create_node = Mock(), name = 'test'), 'tkinter')
+        profiler = use_tcl_profiler()
+        profiler.pipe_started = Mock()
+        profiler.stop()
+        profiler.enabled = True
+
+        resolve((RenderingPipeline, 'tkinter')).run(TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')}))
+
+        assert profiler.pipe_started.call_count == 2
@@ -0,0 +1,89 @@
+from io import StringIO
+from json import loads
+from unittest.mock import Mock
+
+from injectool import resolve
+from pytest import mark
+from pyviews.core.error import ViewInfo
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, use_pipeline
+
+from tkviews.core import TkRenderingContext
+from tkviews.core.callbacks import CallbackInfo, run_callback
+from tkviews.diagnostics import Tracer, dump_trace, use_tracing
+
+
+class TracerTests:
+    """Tracer tests"""
+
+    @staticmethod
+    def test_add_pipe():
+        """should add complete event with view info"""
+        tracer = Tracer()
+        context = TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label', view_info = ViewInfo('view', 3))})
+
+        tracer.add_pipe('widget pipeline', 'apply_text', context, 1, 0.5)
+
+        assert list(tracer.events) == [{
+            'name': 'apply_text',
+            'cat': 'pipe',
+            'ph': 'X',
+            'ts': 1_000_000,
+            'dur': 500_000,
+            'pid': tracer.events[0]['pid'],
+            'tid': tracer.events[0]['tid'],
+            'args': {'pipeline': 'widget pipeline', 'view': 'view', 'line': 3}
+        }]
+
+    @staticmethod
+    def test_callback_span():
+        """should add span for callback"""
+        tracer = Tracer()
+        info = CallbackInfo('command', 'Button-1', ViewInfo('view', 5))
+
+        tracer.callback_started(info)
+        tracer.callback_finished(info)
+
+        event = tracer.events[0]
+        assert (event['name'], event['cat'], event['args']) == ('Button-1', 'command', {'view': 'view', 'line': 5})
+
+    @staticmethod
+    def test_max_events():
+        """should keep last events"""
+        tracer = Tracer(max_events = 2)
+
+        for name in ['one', 'two', 'three']:
+            tracer.add_span(name, 'test', 0, 0)
+
+        assert [event['name'] for event in tracer.events] == ['two', 'three']
+
+
+@mark.usefixtures('binder_fixture')
+class UseTracingTests:
+    """use_tracing tests"""
+
+    @staticmethod
+    def test_traces_pipelines_and_callbacks():
+        """should add spans for pipelines, pipes and callbacks"""
+        use_pipeline(RenderingPipeline([], create_node = Mock(), name = 'widget pipeline'), 'tkinter')
+        tracer = use_tracing()
+        try:
+            resolve((RenderingPipeline, 'tkinter')).run(TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label')}))
+            run_callback(CallbackInfo('command', 'Button-1'), Mock())
+        finally:
+            tracer.stop()
+        run_callback(CallbackInfo('command', 'Button-2'), Mock())
+
+        assert [event['cat'] for event in tracer.events] == ['pipe', 'pipeline', 'command']
+
+
+def test_dump_trace():
+    """should write trace in chrome trace event format"""
+    tracer = Tracer()
+    tracer.add_span('span', 'test', 0, 1)
+    file = StringIO()
+
+    dump_trace(tracer, file)
+
+    actual = loads(file.getvalue())
+    assert actual['traceEvents'][0]['name'] == 'span'
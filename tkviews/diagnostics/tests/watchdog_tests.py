@@ -0,0 +1,94 @@
+from unittest.mock import Mock, patch
+
+from pytest import fixture, mark
+from pyviews.core.error import ViewInfo
+
+from tkviews.core.callbacks import CallbackInfo, run_callback
+from tkviews.diagnostics import StallStats, Watchdog
+from tkviews.diagnostics import watchdog as watchdog_module
+
+
+@fixture
+def watchdog_fixture(request):
+    with patch(f'{watchdog_module.__name__}.perf_counter') as perf_counter:
+        perf_counter.return_value = 0
+        request.cls.perf_counter = perf_counter
+        request.cls.master = Mock()
+        request.cls.logger = Mock()
+        request.cls.watchdog = Watchdog(request.cls.master, threshold = 100, logger = request.cls.logger)
+        yield
+
+
+@mark.usefixtures('watchdog_fixture')
+class WatchdogTests:
+    """Watchdog tests"""
+
+    perf_counter: Mock
+    master: Mock
+    logger: Mock
+    watchdog: Watchdog
+
+    def test_beat_schedules_next(self):
+        """should schedule next heartbeat with after"""
+        self.watchdog._beat()
+
+        assert self.master.after.call_args[0] == (50, self.watchdog._beat)
+
+    def test_does_not_detect_short_delay(self):
+        """should not detect stall shorter than threshold"""
+        self.watchdog._beat()
+        self.perf_counter.return_value = 0.05
+
+        self.watchdog._check()
+        self.watchdog._beat()
+
+        assert not self.logger.warning.called
+        assert self.watchdog.stats() == StallStats(0, 0, 0)
+
+    def test_detects_stall(self):
+        """should log stack and running callback of stall"""
+        self.watchdog._beat()
+        self.perf_counter.return_value = 0.2
+        info = CallbackInfo('command', 'Button-1', ViewInfo('view', 4))
+
+        with patch(f'{watchdog_module.__name__}.current_callback', return_value = info):
+            self.watchdog._check()
+        self.watchdog._check()
+
+        assert self.logger.warning.call_count == 1
+        assert 'in command "Button-1" (view, line 4)' in self.logger.warning.call_args[0]
+
+    def test_records_stall_on_beat(self):
+        """should record stall duration when heartbeat is resumed"""
+        self.watchdog._beat()
+        self.perf_counter.return_value = 0.2
+        self.watchdog._check()
+        self.perf_counter.return_value = 0.5
+
+        self.watchdog._beat()
+
+        assert self.watchdog.stats() == StallStats(1, 0.5, 0.5)
+        assert [stall.duration for stall in self.watchdog.get_stalls()] == [0.5]
+
+    def test_captures_main_thread_stack(self):
+        """should capture stack of thread that started watchdog"""
+        self.watchdog._beat()
+        self.perf_counter.return_value = 0.2
+
+        self.watchdog._check()
+        self.watchdog._beat()
+
+        assert 'test_captures_main_thread_stack' in self.watchdog.get_stalls()[0].stack
+
+    def test_tracks_callbacks(self):
+        """should enable callbacks tracking while started"""
+        actual = []
+        with patch(f'{watchdog_module.__name__}.Thread'):
+            self.watchdog.start()
+        info = CallbackInfo('command', 'Button-1')
+
+        run_callback(info, lambda: actual.append(watchdog_module.current_callback()))
+        self.watchdog.stop()
+
+        assert actual == [info]
+        assert self.master.after_cancel.called
@@ -0,0 +1,106 @@
+"""Chrome trace events of rendering and callbacks"""
+
+from collections import deque
+from json import dump
+from os import getpid
+from threading import get_ident
+from time import perf_counter
+from typing import Iterable, List, Optional, TextIO, Union
+
+from injectool import DependencyError
+from pyviews.core.error import ViewInfo
+from pyviews.core.rendering import RenderingContext
+
+from tkviews.core.callbacks import CallbackInfo, CallbackListener, add_callback_listener, remove_callback_listener, \
+    use_binding_callbacks
+from tkviews.diagnostics.instrumentation import TKVIEWS_PIPELINES, RenderRecorder, use_instrumentation
+
+
+class Tracer(RenderRecorder, CallbackListener):
+    """Collects spans in chrome trace event format"""
+
+    def __init__(self, max_events: int = 1_000_000):
+        super().__init__()
+        self.events: deque = deque(maxlen = max_events)
+        self._starts: List[float] = []
+        self._pid: int = getpid()
+
+    def add_pipeline(self, pipeline: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipeline span"""
+        self.add_span(pipeline, 'pipeline', start, duration, _get_view_info(context))
+
+    def add_pipe(self, pipeline: str, pipe: str, context: RenderingContext, start: float, duration: float):
+        """Adds pipe span"""
+        self.add_span(pipe, 'pipe', start, duration, _get_view_info(context), pipeline = pipeline)
+
+    def add_view(self, view: str, start: float, duration: float):
+        """Adds render_view span"""
+        self.add_span(view, 'view', start, duration, ViewInfo(view, None))
+
+    def callback_started(self, info: CallbackInfo):
+        """Stores callback start"""
+        self._starts.append(perf_counter())
+
+    def callback_finished(self, info: CallbackInfo):
+        """Adds callback span"""
+        start = self._starts.pop()
+        if self.enabled:
+            self.add_span(str(info.name), info.kind, start, perf_counter() - start, info.view_info)
+
+    def add_span(
+        self, name: str, category: str, start: float, duration: float, view_info: Optional[ViewInfo] = None, **args
+    ):
+        """Adds complete event"""
+        if view_info is not None:
+            args['view'] = view_info.view
+            args['line'] = view_info.line
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start * 1_000_000,
+            'dur': duration * 1_000_000,
+            'pid': self._pid,
+            'tid': get_ident(),
+            'args': args
+        })
+
+    def to_dict(self) -> dict:
+        """Returns trace in chrome trace event format"""
+        return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def clear(self):
+        """Removes collected events"""
+        self.events.clear()
+
+    def stop(self):
+        """Stops tracing"""
+        self.enabled = False
+        remove_callback_listener(self)
+
+
+def _get_view_info(context: RenderingContext) -> Optional[ViewInfo]:
+    xml_node = context.get('xml_node')
+    return xml_node.view_info if xml_node is not None else None
+
+
+def dump_trace(tracer: Tracer, file: Union[str, TextIO]):
+    """Writes trace to json file that can be opened with Perfetto or chrome://tracing"""
+    if isinstance(file, str):
+        with open(file, 'w', encoding = 'utf-8') as json_file:
+            dump(tracer.to_dict(), json_file)
+    else:
+        dump(tracer.to_dict(), file)
+
+
+def use_tracing(tracer: Optional[Tracer] = None, class_paths: Iterable[str] = TKVIEWS_PIPELINES) -> Tracer:
+    """Traces rendering, widget commands and binding callbacks"""
+    tracer = tracer if tracer else Tracer()
+    tracer.enabled = True
+    use_instrumentation(tracer, class_paths)
+    add_callback_listener(tracer)
+    try:
+        use_binding_callbacks()
+    except DependencyError:
+        pass
+    return tracer
@@ -0,0 +1,135 @@
+"""Main loop stalls detection"""
+
+import sys
+from collections import deque
+from logging import Logger, getLogger
+from threading import Event, Lock, Thread, get_ident
+from time import perf_counter
+from tkinter import Misc
+from traceback import format_stack
+from typing import List, NamedTuple, Optional
+
+from tkviews.core.callbacks import CallbackInfo, CallbackListener, add_callback_listener, current_callback, \
+    remove_callback_listener
+
+_LOGGER = getLogger('tkviews.watchdog')
+
+
+class Stall(NamedTuple):
+    """Main loop stall"""
+    duration: float
+    callback: Optional[CallbackInfo]
+    stack: str
+
+
+class StallStats(NamedTuple):
+    """Main loop stalls statistics"""
+    count: int
+    total: float
+    max: float
+
+
+class Watchdog(CallbackListener):
+    """Detects main loop stalls with after heartbeat checked from monitor thread"""
+
+    def __init__(
+        self,
+        master: Misc,
+        threshold: float = 200,
+        interval: float = 50,
+        max_stalls: int = 100,
+        logger: Optional[Logger] = None
+    ):
+        self._master: Misc = master
+        self._threshold: float = threshold / 1000
+        self._interval: float = interval / 1000
+        self._logger: Logger = logger if logger else _LOGGER
+        self._lock: Lock = Lock()
+        self._stopped: Event = Event()
+        self._thread: Optional[Thread] = None
+        self._after_id = None
+        self._main_thread: int = get_ident()
+        self._last_beat: float = perf_counter()
+        self._detected: Optional[Stall] = None
+        self._stats: StallStats = StallStats(0, 0, 0)
+        self._stalls: deque = deque(maxlen = max_stalls)
+
+    def start(self):
+        """Starts heartbeat and monitor thread. Should be called from main loop thread"""
+        self._stopped.clear()
+        self._main_thread = get_ident()
+        add_callback_listener(self)
+        self._beat()
+        self._thread = Thread(target = self._monitor, name = 'tkviews watchdog', daemon = True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops heartbeat and monitor thread"""
+        self._stopped.set()
+        remove_callback_listener(self)
+        if self._after_id is not None:
+            self._master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _beat(self):
+        now = perf_counter()
+        with self._lock:
+            detected, self._detected = self._detected, None
+            started = self._last_beat
+            self._last_beat = now
+        if detected is not None:
+            self._add_stall(detected._replace(duration = now - started))
+        self._after_id = self._master.after(int(self._interval * 1000), self._beat)
+
+    def _monitor(self):
+        while not self._stopped.wait(self._interval):
+            self._check()
+
+    def _check(self):
+        with self._lock:
+            if self._detected is not None:
+                return
+            duration = perf_counter() - self._last_beat
+            if duration < self._threshold:
+                return
+            stall = self._detected = Stall(duration, current_callback(), _get_stack(self._main_thread))
+        self._logger.warning('Main loop is stalled for %d ms %s\n%s', duration * 1000, _describe(stall), stall.stack)
+
+    def _add_stall(self, stall: Stall):
+        with self._lock:
+            self._stalls.append(stall)
+            self._stats = StallStats(
+                self._stats.count + 1, self._stats.total + stall.duration, max(self._stats.max, stall.duration)
+            )
+        self._logger.warning('Main loop stall took %d ms %s', stall.duration * 1000, _describe(stall))
+
+    def stats(self) -> StallStats:
+        """Returns count, total and max duration in seconds of finished stalls"""
+        with self._lock:
+            return self._stats
+
+    def get_stalls(self) -> List[Stall]:
+        """Returns last finished stalls"""
+        with self._lock:
+            return list(self._stalls)
+
+
+def _get_stack(thread_id: int) -> str:
+    frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+    return ''.join(format_stack(frame)) if frame is not None else ''
+
+
+def _describe(stall: Stall) -> str:
+    callback = stall.callback
+    if callback is None:
+        return 'outside of callbacks'
+    if callback.view_info is None:
+        return f'in {callback.kind} "{callback.name}"'
+    return f'in {callback.kind} "{callback.name}" ({callback.view_info.view}, line {callback.view_info.line})'
+
+
+def use_watchdog(master: Misc, threshold: float = 200, interval: float = 50) -> Watchdog:
+    """Starts watchdog that logs main loop stalls longer than threshold in milliseconds"""
+    watchdog = Watchdog(master, threshold, interval)
+    watchdog.start()
+    return watchdog
@@ -0,0 +1,596 @@
+"""In-memory tkinter backend to render views without display"""
+
+import tkinter
+from _tkinter import TCL_VERSION, TK_VERSION, TclError
+from collections import Counter
+from heapq import heappop, heappush
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+from injectool import add_singleton
+
+from tkviews.widgets.node import create_tk
+
+_EVENT_ARGS = ('0', '1', '0', '0', '0', '0', '0', '0', '0', '0', '', '0', '??', '0')
+_ESCAPES = {'n': '\n', 't': '\t'}
+_TRUE = {'1', 'true', 'yes', 'on'}
+_FALSE = {'0', 'false', 'no', 'off', ''}
+_SIZES = ('width', 'height', 'reqwidth', 'reqheight')
+
+
+class FakeWidget:  # pylint: disable=too-many-instance-attributes
+    """Widget state stored by fake interpreter"""
+
+    def __init__(self, path: str, widget_class: str, options: Dict[str, Any]):
+        self.path: str = path
+        self.widget_class: str = widget_class
+        self.options: Dict[str, Any] = options
+        self.manager: str = ''
+        self.geometry: Dict[str, Any] = {}
+        self.items: Dict[int, Tuple[str, tuple, Dict[str, Any]]] = {}
+        self.entries: List[Any] = []
+        self.text: str = ''
+        self.bindings: Dict[str, List[str]] = {}
+
+
+class FakeTkapp:  # pylint: disable=too-many-instance-attributes
+    """
+    In-memory stand-in for tkinter Tcl interpreter.
+    Keeps widgets, canvas and listbox items, variables and scheduled callbacks and counts calls by command
+    """
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.round_trips: int = 0
+        self.widgets: Dict[str, FakeWidget] = {'.': FakeWidget('.', 'toplevel', {})}
+        self.commands: Dict[str, Callable] = {}
+        self.variables: Dict[str, Any] = {'tk_version': TK_VERSION, 'tcl_version': TCL_VERSION}
+        self.traces: Dict[str, List[Tuple[tuple, str]]] = {}
+        self.time: float = 0
+        self._timers: List[Tuple[float, int, str]] = []
+        self._idle: List[Tuple[int, str]] = []
+        self._after_ids = count()
+        self._item_ids = count(1)
+        self._quit: bool = False
+
+    @property
+    def calls_count(self) -> int:
+        """Total count of calls"""
+        return sum(self.calls.values())
+
+    def call(self, *args) -> Any:
+        """Executes Tcl command"""
+        self.round_trips += 1
+        return self._execute(args)
+
+    def _execute(self, args: tuple) -> Any:
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        args = tuple(_flatten(_until_none(args)))
+        command = str(args[0])
+        widget = self.widgets.get(command)
+        if widget is not None:
+            self.calls[str(args[1]) if len(args) > 1 else command] += 1
+            return self._widget_command(widget, args[1:])
+        self.calls[command] += 1
+        handler = getattr(self, f'_cmd_{command.replace("::", "_")}', None)
+        if handler is not None:
+            return handler(*args[1:])
+        if command.startswith('.'):
+            raise TclError(f'invalid command name "{command}"')
+        if command in self.commands:
+            return self.commands[command](*args[1:])
+        if len(args) > 1 and str(args[1]).startswith('.') and _is_widget_class(command):
+            return self._create_widget(command, str(args[1]), args[2:])
+        return ''
+
+    def eval(self, script: str) -> Any:
+        """Executes script commands, only plain words, braces, quotes and backslashes are supported"""
+        self.round_trips += 1
+        result = ''
+        for command in _parse_script(script):
+            result = self._execute(tuple(command))
+        return result
+
+    def createcommand(self, name: str, func: Callable):
+        """Registers python callback"""
+        self.commands[name] = func
+
+    def deletecommand(self, name: str):
+        """Removes python callback"""
+        if self.commands.pop(name, None) is None:
+            raise TclError("can't delete Tcl command")
+
+    def getvar(self, name: str) -> Any:
+        """Returns variable value"""
+        self.calls['getvar'] += 1
+        self.round_trips += 1
+        try:
+            return self.variables[name]
+        except KeyError as key_error:
+            raise TclError(f'can\'t read "{name}": no such variable') from key_error
+
+    def setvar(self, name: str, value: Any):
+        """Sets variable value and calls write traces"""
+        self.calls['setvar'] += 1
+        self.round_trips += 1
+        self._setvar(name, value)
+
+    def _setvar(self, name: str, value: Any):
+        self.variables[name] = value
+        for operations, callback in list(self.traces.get(name, [])):
+            if 'write' in operations and callback in self.commands:
+                self.commands[callback](name, '', 'write')
+
+    def unsetvar(self, name: str):
+        """Removes variable"""
+        self.calls['unsetvar'] += 1
+        self.round_trips += 1
+        self.variables.pop(name, None)
+        self.traces.pop(name, None)
+
+    globalgetvar = getvar
+    globalsetvar = setvar
+    globalunsetvar = unsetvar
+
+    @staticmethod
+    def getint(value: Any) -> int:
+        """Converts value to int"""
+        try:
+            return int(value)
+        except (TypeError, ValueError) as error:
+            raise TclError(f'expected integer but got "{value}"') from error
+
+    @staticmethod
+    def getdouble(value: Any) -> float:
+        """Converts value to float"""
+        try:
+            return float(value)
+        except (TypeError, ValueError) as error:
+            raise TclError(f'expected floating-point number but got "{value}"') from error
+
+    @staticmethod
+    def getboolean(value: Any) -> bool:
+        """Converts value to bool"""
+        if isinstance(value, (bool, int)):
+            return bool(value)
+        value = str(value).lower()
+        if value in _TRUE or value in _FALSE:
+            return value in _TRUE
+        raise TclError(f'expected boolean value but got "{value}"')
+
+    @staticmethod
+    def splitlist(value: Any) -> tuple:
+        """Splits Tcl list"""
+        if isinstance(value, tuple):
+            return value
+        if isinstance(value, list):
+            return tuple(value)
+        return tuple(str(value).split())
+
+    split = splitlist
+
+    @staticmethod
+    def wantobjects() -> int:
+        """Interpreter returns python objects"""
+        return 1
+
+    @staticmethod
+    def willdispatch():
+        """Nothing to dispatch in fake interpreter"""
+
+    @staticmethod
+    def interpaddr() -> int:
+        """Fake interpreter address"""
+        return 0
+
+    def mainloop(self, _: int = 0):
+        """Runs scheduled callbacks until quit is called or nothing is scheduled"""
+        self._quit = False
+        while not self._quit and self.dooneevent():
+            pass
+
+    def quit(self):
+        """Stops main loop"""
+        self._quit = True
+
+    def dooneevent(self, _: int = 0) -> int:
+        """Runs one idle or timer callback. Advances time to timer if needed"""
+        if self._idle:
+            self._run(self._idle.pop(0)[1])
+            return 1
+        if self._timers:
+            due, _, callback = heappop(self._timers)
+            self.time = max(self.time, due)
+            self._run(callback)
+            return 1
+        return 0
+
+    def advance(self, milliseconds: float):
+        """Advances time and runs idle and due callbacks"""
+        self.time += milliseconds
+        self._cmd_update()
+
+    def _run(self, callback: str):
+        if callback in self.commands:
+            self.commands[callback]()
+
+    def _create_widget(self, widget_class: str, path: str, options: tuple) -> str:
+        widget = FakeWidget(path, widget_class, _parse_options(options))
+        self.widgets[path] = widget
+        self._update_variable(widget, widget.options)
+        return path
+
+    def _widget_command(self, widget: FakeWidget, args: tuple) -> Any:
+        if not args:
+            return ''
+        subcommand, args = str(args[0]), args[1:]
+        handler = getattr(self, f'_widget_{subcommand}', None)
+        return handler(widget, *args) if handler is not None else ''
+
+    def _widget_configure(self, widget: FakeWidget, *args) -> Any:
+        if len(args) == 1:
+            option = str(args[0])
+            return option, option[1:], option[1:].capitalize(), '', widget.options.get(option, '')
+        if not args:
+            return tuple((key, key[1:], key[1:].capitalize(), '', value) for key, value in widget.options.items())
+        options = _parse_options(args)
+        widget.options.update(options)
+        self._update_variable(widget, options)
+        return ''
+
+    _widget_config = _widget_configure
+
+    @staticmethod
+    def _widget_cget(widget: FakeWidget, option: str) -> Any:
+        return widget.options.get(str(option), '')
+
+    def _widget_create(self, widget: FakeWidget, item_type: str, *args) -> int:
+        position = next((i for i, arg in enumerate(args) if str(arg).startswith('-')), len(args))
+        item_id = next(self._item_ids)
+        widget.items[item_id] = (str(item_type), args[:position], _parse_options(args[position:]))
+        return item_id
+
+    @staticmethod
+    def _widget_itemconfigure(widget: FakeWidget, item: Any, *args) -> Any:
+        item_id = FakeTkapp.getint(item)
+        if item_id not in widget.items:
+            return ''
+        options = widget.items[item_id][2]
+        if len(args) == 1:
+            return options.get(str(args[0]), '')
+        options.update(_parse_options(args))
+        return ''
+
+    _widget_itemconfig = _widget_itemconfigure
+
+    @staticmethod
+    def _widget_itemcget(widget: FakeWidget, item: Any, option: str) -> Any:
+        item = widget.items.get(FakeTkapp.getint(item))
+        return item[2].get(str(option), '') if item else ''
+
+    @staticmethod
+    def _widget_coords(widget: FakeWidget, item: Any, *coords) -> Any:
+        item_id = FakeTkapp.getint(item)
+        if item_id not in widget.items:
+            return ''
+        item_type, current, options = widget.items[item_id]
+        if not coords:
+            return current
+        widget.items[item_id] = (item_type, coords, options)
+        return ''
+
+    def _widget_insert(self, widget: FakeWidget, index: Any, *values) -> str:
+        if widget.widget_class == 'listbox':
+            position = len(widget.entries) if str(index) == 'end' else self.getint(index)
+            widget.entries[position:position] = values
+        else:
+            text = self._get_text(widget)
+            position = len(text) if str(index) == 'end' else self.getint(index)
+            self._set_text(widget, text[:position] + ''.join(str(value) for value in values) + text[position:])
+        return ''
+
+    def _widget_delete(self, widget: FakeWidget, first: Any, *rest) -> str:
+        if widget.items:
+            for item in (first, *rest):
+                widget.items.pop(self.getint(item), None)
+            return ''
+        last = rest[0] if rest else None
+        if widget.widget_class == 'listbox':
+            start, end = self._get_range(widget.entries, first, last)
+            del widget.entries[start:end]
+        else:
+            text = self._get_text(widget)
+            start, end = self._get_range(text, first, last)
+            self._set_text(widget, text[:start] + text[end:])
+        return ''
+
+    def _widget_size(self, widget: FakeWidget) -> int:
+        return len(widget.entries)
+
+    def _widget_get(self, widget: FakeWidget, first: Any = None, last: Any = None) -> Any:
+        if widget.widget_class == 'listbox':
+            start, end = self._get_range(widget.entries, first, last)
+            return widget.entries[start] if last is None else tuple(widget.entries[start:end])
+        return self._get_text(widget)
+
+    def _widget_set(self, widget: FakeWidget, value: Any) -> str:
+        variable = widget.options.get('-variable')
+        if variable:
+            self._setvar(str(variable), value)
+        return ''
+
+    def _widget_bind(self, widget: FakeWidget, *args) -> Any:
+        return self._cmd_bind(widget.path, *args[1:]) if widget.items else ''
+
+    def _get_range(self, values: Any, first: Any, last: Any) -> Tuple[int, int]:
+        start = len(values) if str(first) == 'end' else self.getint(first)
+        if last is None:
+            return start, start + 1
+        end = len(values) if str(last) == 'end' else self.getint(last) + (1 if values is not None else 0)
+        return start, end
+
+    def _get_text(self, widget: FakeWidget) -> str:
+        variable = widget.options.get('-textvariable')
+        if variable:
+            return str(self.variables.get(str(variable), ''))
+        return widget.text
+
+    def _set_text(self, widget: FakeWidget, text: str):
+        variable = widget.options.get('-textvariable')
+        if variable:
+            self._setvar(str(variable), text)
+        else:
+            widget.text = text
+
+    def _update_variable(self, widget: FakeWidget, options: Dict[str, Any]):
+        for key in ('-textvariable', '-variable'):
+            variable = options.get(key)
+            if variable and str(variable) not in self.variables:
+                self.variables[str(variable)] = ''
+        if '-text' in options:
+            widget.text = str(options['-text'])
+
+    def _cmd_destroy(self, *paths) -> str:
+        for path in paths:
+            path = str(path)
+            prefix = '.' if path == '.' else f'{path}.'
+            for widget_path in [key for key in self.widgets if key == path or key.startswith(prefix)]:
+                del self.widgets[widget_path]
+        return ''
+
+    def _geometry(self, manager: str, subcommand: str, *args) -> Any:
+        widget = self.widgets.get(str(args[0])) if args else None
+        if widget is None:
+            return ''
+        if subcommand == 'configure':
+            widget.manager = manager
+            widget.geometry.update(_parse_options(args[1:]))
+        elif subcommand in ('forget', 'remove'):
+            widget.manager = ''
+            if subcommand == 'forget':
+                widget.geometry = {}
+        elif subcommand == 'info':
+            parent = widget.path.rsplit('.', 1)[0] or '.'
+            return tuple(_flatten({'-in': parent, **widget.geometry}.items()))
+        return ''
+
+    def _cmd_pack(self, *args) -> Any:
+        return self._geometry('pack', *args)
+
+    def _cmd_grid(self, *args) -> Any:
+        return self._geometry('grid', *args)
+
+    def _cmd_place(self, *args) -> Any:
+        return self._geometry('place', *args)
+
+    def _cmd_winfo(self, subcommand: str, *args) -> Any:
+        path = str(args[0]) if args else '.'
+        widget = self.widgets.get(path)
+        if subcommand == 'exists':
+            return int(widget is not None)
+        if widget is None:
+            raise TclError(f'bad window path name "{path}"')
+        if subcommand == 'children':
+            return tuple(key for key in self.widgets if key.rsplit('.', 1)[0] == (path if path != '.' else ''))
+        return _get_widget_info(widget, subcommand)
+
+    def _cmd_bind(self, target: str, *args) -> Any:
+        widget = self.widgets.get(str(target))
+        bindings = widget.bindings if widget is not None else self.widgets['.'].bindings
+        if len(args) < 2:
+            return ''
+        sequence, script = str(args[0]), str(args[1])
+        if script.startswith('+'):
+            bindings.setdefault(sequence, []).append(script[1:])
+        else:
+            bindings[sequence] = [script] if script else []
+        return ''
+
+    def _cmd_event(self, subcommand: str, *args) -> str:
+        if subcommand != 'generate':
+            return ''
+        path, sequence = (*args, '', '')[:2]
+        widget = self.widgets.get(str(path))
+        scripts = widget.bindings.get(str(sequence), []) if widget is not None else []
+        for script in [*scripts, *self.widgets['.'].bindings.get(str(sequence), [])]:
+            callback = _get_callback_name(script)
+            if callback in self.commands:
+                if self.commands[callback](*_EVENT_ARGS, str(path), '4', '0', '0', '') == 'break':
+                    break
+        return ''
+
+    def _cmd_after(self, delay: Any, *args) -> Any:
+        delay = str(delay)
+        if delay == 'idle':
+            after_id = f'after#{next(self._after_ids)}'
+            self._idle.append((after_id, str(args[0])))
+            return after_id
+        if delay == 'info':
+            return self._after_info(str(args[0])) if args else ''
+        if delay == 'cancel':
+            after_id = str(args[0])
+            self._idle = [item for item in self._idle if item[0] != after_id]
+            self._timers = [item for item in self._timers if f'after#{item[1]}' != after_id]
+            self._timers.sort()
+            return ''
+        number = next(self._after_ids)
+        if args:
+            heappush(self._timers, (self.time + self.getdouble(delay), number, str(args[0])))
+        return f'after#{number}'
+
+    def _after_info(self, after_id: str) -> tuple:
+        for idle_id, callback in self._idle:
+            if idle_id == after_id:
+                return callback, 'idle'
+        for _, number, callback in self._timers:
+            if f'after#{number}' == after_id:
+                return callback, 'timer'
+        raise TclError(f'event "{after_id}" doesn\'t exist')
+
+    def _cmd_update(self, *args) -> str:
+        idle = self._idle
+        self._idle = []
+        for _, callback in idle:
+            self._run(callback)
+        if not args:
+            while self._timers and self._timers[0][0] <= self.time:
+                self._run(heappop(self._timers)[2])
+        return ''
+
+    def _cmd_info(self, subcommand: str, *args) -> Any:
+        if subcommand == 'exists':
+            return int(str(args[0]) in self.variables)
+        return ''
+
+    def _cmd_trace(self, subcommand: str, _kind: str, name: str, *args) -> Any:
+        traces = self.traces.setdefault(str(name), [])
+        if subcommand == 'add':
+            traces.append((self.splitlist(args[0]), str(self.splitlist(args[1])[0])))
+        elif subcommand == 'remove':
+            operations, callback = self.splitlist(args[0]), str(self.splitlist(args[1])[0])
+            if (operations, callback) in traces:
+                traces.remove((operations, callback))
+        elif subcommand == 'info':
+            return tuple((operations, callback) for operations, callback in traces)
+        return ''
+
+    def _cmd_tkviews_batch_run(self, *commands) -> tuple:
+        errors = []
+        for index, command in enumerate(commands):
+            try:
+                for args in _parse_script(str(command)):
+                    self._execute(tuple(args))
+            except TclError as error:
+                errors.extend((index, str(error)))
+        return tuple(errors)
+
+    def _cmd_wm(self, subcommand: str, *_) -> str:
+        return 'normal' if subcommand == 'state' else ''
+
+
+def _flatten(args: Any):
+    for arg in args:
+        if isinstance(arg, (tuple, list)):
+            yield from _flatten(arg)
+        else:
+            yield arg
+
+
+def _until_none(args: tuple) -> tuple:
+    """Returns arguments before first None, like _tkinter passes them"""
+    none_index = next((index for index, arg in enumerate(args) if arg is None), len(args))
+    return args[:none_index]
+
+
+def _parse_script(script: str) -> List[List[str]]:
+    commands: List[List[str]] = []
+    words: List[str] = []
+    position, length = 0, len(script)
+    while position < length:
+        char = script[position]
+        if char in '\n;':
+            if words:
+                commands.append(words)
+                words = []
+            position += 1
+        elif char.isspace():
+            position += 1
+        else:
+            word, position = _read_braced(script, position) if char == '{' else _read_word(script, position)
+            words.append(word)
+    if words:
+        commands.append(words)
+    return commands
+
+
+def _read_braced(script: str, position: int) -> Tuple[str, int]:
+    depth, start = 1, position + 1
+    while depth:
+        position += 1
+        if script[position] == '\\':
+            position += 1
+        elif script[position] == '{':
+            depth += 1
+        elif script[position] == '}':
+            depth -= 1
+    return script[start:position], position + 1
+
+
+def _read_word(script: str, position: int) -> Tuple[str, int]:
+    quoted = script[position] == '"'
+    position += 1 if quoted else 0
+    word = []
+    length = len(script)
+    while position < length:
+        char = script[position]
+        if char == '\\' and position + 1 < length:
+            position += 1
+            word.append(_ESCAPES.get(script[position], script[position]))
+        elif (quoted and char == '"') or (not quoted and (char.isspace() or char == ';')):
+            position += 1 if quoted else 0
+            break
+        else:
+            word.append(char)
+        position += 1
+    return ''.join(word), position
+
+
+def _get_widget_info(widget: FakeWidget, subcommand: str) -> Any:
+    info = {
+        'manager': widget.manager,
+        'ismapped': int(bool(widget.manager) or widget.path == '.'),
+        'class': widget.widget_class.split('::')[-1].capitalize(),
+        'toplevel': '.',
+        'parent': '.'
+    }
+    return info.get(subcommand, 1 if subcommand in _SIZES else 0)
+
+
+def _parse_options(args: tuple) -> Dict[str, Any]:
+    return {str(args[i]): args[i + 1] for i in range(0, len(args) - 1, 2)}
+
+
+def _is_widget_class(command: str) -> bool:
+    return command.split('::')[-1].isalpha() and command.islower()
+
+
+def _get_callback_name(script: str) -> str:
+    start = script.find('[')
+    return script[start + 1:].split(' ', 1)[0] if start >= 0 else script.split(' ', 1)[0]
+
+
+class FakeTk(tkinter.Tk):
+    """tkinter root that uses in-memory interpreter"""
+
+    def __init__(self, *_, **__):  # pylint: disable=super-init-not-called
+        self.master = None
+        self.children = {}
+        self._tkloaded = False
+        self.tk = FakeTkapp()
+        self._loadtk()
+
+
+def use_headless():
+    """Uses in-memory tkinter backend for Root"""
+    add_singleton(create_tk, FakeTk)
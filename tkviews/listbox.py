@@ -6,7 +6,7 @@ from pyviews.core.xml import XmlNode
 from pyviews.pipes import apply_attributes
 from pyviews.rendering.pipeline import RenderingPipeline
 
-from tkviews.core import TkRenderingContext
+from tkviews.core import TkRenderingContext, run_deferred
 
 
 class ListboxItem(Node):
@@ -64,6 +64,10 @@ def setup_on_updated(node: ListboxItem, context: TkRenderingContext):
 
 
 def _update_item(listbox: Listbox, item: ListboxItem):
+    run_deferred(listbox, _replace_item, listbox, item, view_info = item.xml_node.view_info)
+
+
+def _replace_item(listbox: Listbox, item: ListboxItem):
     listbox.delete(item.index)
     listbox.insert(item.index, item.value)
 
@@ -4,13 +4,13 @@ from typing import Any, List, Optional
 
 from pyviews.containers import render_view_content
 from pyviews.core.error import PyViewsError
-from pyviews.core.expression import execute, is_expression, parse_expression
+from pyviews.core.expression import execute, is_expression
 from pyviews.core.rendering import Node, NodeGlobals, Setter
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.pipes import apply_attributes, get_setter, render_children
 from pyviews.rendering.pipeline import RenderingPipeline
 
-from tkviews.core import TkRenderingContext
+from tkviews.core import TkRenderingContext, compile_expression
 
 STYLES_KEY = '_node_styles'
 
@@ -93,8 +93,7 @@ def _get_style_item(node: Style, attr: XmlAttr):
     setter = get_setter(attr)
     value = attr.value if attr.value else ''
     if is_expression(value):
-        expression_body = parse_expression(value).body
-        value = execute(expression_body, node.node_globals)
+        value = execute(compile_expression(value).expression, node.node_globals)
     return StyleItem(setter, attr.name, value)
 
 
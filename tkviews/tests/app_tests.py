@@ -0,0 +1,36 @@
+from unittest.mock import Mock, patch
+
+from pytest import mark
+
+from tkviews import app
+from tkviews.core.dispatcher import get_dispatcher, use_dispatcher
+
+
+@mark.usefixtures('container_fixture')
+class StartTests:
+    """_start() tests"""
+
+    @staticmethod
+    def test_does_not_use_dispatcher():
+        """should not register dispatcher"""
+        with patch(app.__name__ + '.render_view') as render_view:
+            _, stop = app._start('root', None, None)  # pylint: disable=protected-access
+            stop()
+
+        assert get_dispatcher() is None
+        assert not render_view.return_value.instance.after.called
+
+    @staticmethod
+    def test_starts_registered_dispatcher():
+        """should start and stop registered dispatcher"""
+        dispatcher = use_dispatcher()
+        root = Mock()
+
+        with patch(app.__name__ + '.render_view', return_value = root):
+            _, stop = app._start('root', None, None)  # pylint: disable=protected-access
+            started = dispatcher.started
+            stop()
+
+        assert started
+        assert dispatcher.master is root.instance
+        assert not dispatcher.started
@@ -0,0 +1,69 @@
+from os.path import join
+
+from pyviews.core.xml import parse
+
+from tkviews.compiler import compile_view, compile_views, main
+from tkviews.core.views import COMPILED_FOLDER
+
+VIEW = '''<?xml version="1.0"?>
+<Frame xmlns="tkinter" xmlns:call="tkviews.call" background="red">
+    <Label text="{vm.value}" call:pack="{args(side='left')}">Text</Label>
+    <Label text="{invalid expression}" />
+</Frame>
+'''
+
+
+def _write_view(folder, name: str) -> str:
+    path = join(str(folder), name)
+    with open(path, 'w', encoding = 'utf-8') as view_file:
+        view_file.write(VIEW)
+    return path
+
+
+class CompileViewTests:
+    """compile_view() tests"""
+
+    @staticmethod
+    def test_compiles_xml_nodes(tmp_path):
+        """should create module with parsed view root"""
+        xml_path = _write_view(tmp_path, 'view.xml')
+
+        module = {}
+        exec(compile_view(xml_path, 'view'), module)
+
+        with open(xml_path, 'rb') as xml_file:
+            assert module['ROOT'] == parse(xml_file, 'view')
+
+    @staticmethod
+    def test_compiles_expressions(tmp_path):
+        """should add compiled valid expressions"""
+        xml_path = _write_view(tmp_path, 'view.xml')
+
+        module = {}
+        exec(compile_view(xml_path, 'view'), module)
+
+        actual = [(source, binding_type, body) for source, binding_type, body, _ in module['EXPRESSIONS']]
+        assert actual == [('{vm.value}', 'oneway', 'vm.value'), ("{args(side='left')}", 'oneway', "args(side='left')")]
+
+
+def test_compile_views(tmp_path):
+    """should compile all views from folder to compiled folder"""
+    (tmp_path / 'nested').mkdir()
+    _write_view(tmp_path, 'one.xml')
+    _write_view(tmp_path / 'nested', 'two.xml')
+
+    actual = compile_views(str(tmp_path))
+
+    assert sorted(actual) == sorted([
+        join(str(tmp_path), COMPILED_FOLDER, 'one.py'),
+        join(str(tmp_path), COMPILED_FOLDER, 'nested/two.py')
+    ])
+
+
+def test_main(tmp_path):
+    """compile command should compile views"""
+    _write_view(tmp_path, 'one.xml')
+
+    main(['compile', str(tmp_path)])
+
+    assert (tmp_path / COMPILED_FOLDER / 'one.py').exists()
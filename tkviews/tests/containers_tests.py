@@ -0,0 +1,278 @@
+from unittest.mock import Mock, patch
+
+from pytest import fixture, mark
+from pyviews.containers import If, View
+from pyviews.core.rendering import Node
+
+from tkviews.containers import HiddenContent, KeepAliveCache, keep_if_alive, keep_views_alive
+from tkviews.core.rendering import TkRenderingContext
+from tkviews.widgets import WidgetNode
+
+
+def _create_widget_node(manager: str = 'pack', info: dict = None) -> WidgetNode:
+    widget = Mock()
+    widget.winfo_manager.return_value = manager
+    widget.pack_info.return_value = info if info else {}
+    widget.place_info.return_value = info if info else {}
+    widget.master.pack_slaves.return_value = [widget]
+    return WidgetNode(widget, Mock())
+
+
+def _create_node(*children: Node) -> Node:
+    node = Node(Mock())
+    node.add_children(list(children))
+    return node
+
+
+class HiddenContentTests:
+    """HiddenContent tests"""
+
+    @staticmethod
+    def test_pauses_and_resumes_bindings():
+        """should destroy bindings on hide and bind them on show"""
+        binding, child_binding = Mock(), Mock()
+        child = _create_widget_node()
+        child.add_binding(child_binding)
+        node = _create_node(child)
+        node.add_binding(binding)
+        content = HiddenContent([node])
+
+        content.hide()
+
+        assert binding.destroy.called and child_binding.destroy.called
+        assert not binding.bind.called
+
+        content.show()
+
+        assert binding.bind.called and child_binding.bind.called
+
+    @staticmethod
+    @mark.parametrize('manager, forget, info, restore, args', [
+        ('pack', 'pack_forget', {'side': 'left'}, 'pack', {'side': 'left'}),
+        ('place', 'place_forget', {'x': '10'}, 'place', {'x': '10'}),
+        ('grid', 'grid_remove', None, 'grid', {})
+    ]) # yapf: disable
+    def test_unmaps_and_restores_widgets(manager, forget, info, restore, args):
+        """should forget widget geometry on hide and restore it on show"""
+        node = _create_widget_node(manager, info)
+        widget = node.instance
+        content = HiddenContent([_create_node(node)])
+
+        content.hide()
+
+        assert getattr(widget, forget).called
+        assert not getattr(widget, restore).called
+
+        content.show()
+
+        assert getattr(widget, restore).call_args[1] == args
+
+    @staticmethod
+    def test_restores_pack_order():
+        """should pack widgets back before next packed sibling"""
+        header, footer = Mock(), Mock()
+        footer.winfo_manager.return_value = 'pack'
+        first, second = _create_widget_node(), _create_widget_node()
+        slaves = [header, first.instance, second.instance, footer]
+        master = Mock()
+        master.pack_slaves.side_effect = lambda: list(slaves)
+        for node in (first, second):
+            node.instance.pack_info.return_value = {'in': master}
+            node.instance.pack_forget.side_effect = lambda w=node.instance: slaves.remove(w)
+            node.instance.winfo_manager.side_effect = lambda w=node.instance: 'pack' if w in slaves else ''
+        content = HiddenContent([_create_node(first, second)])
+
+        content.hide()
+        first.instance.pack.side_effect = lambda **kw: slaves.insert(slaves.index(kw['before']), first.instance)
+        second.instance.pack.side_effect = lambda **kw: slaves.insert(slaves.index(kw['before']), second.instance)
+        content.show()
+
+        assert slaves == [header, first.instance, second.instance, footer]
+
+    @staticmethod
+    def test_unmaps_only_top_widgets():
+        """should unmap top widgets only"""
+        child = _create_widget_node()
+        node = _create_widget_node()
+        node.add_child(child)
+        content = HiddenContent([node])
+
+        content.hide()
+
+        assert node.instance.pack_forget.called
+        assert not child.instance.winfo_manager.called
+
+    @staticmethod
+    def test_cost():
+        """should estimate cost as count of nodes"""
+        content = HiddenContent([_create_node(_create_node(), _create_node()), _create_node()])
+
+        assert content.cost == 4
+
+
+class KeepAliveCacheTests:
+    """KeepAliveCache tests"""
+
+    @staticmethod
+    def test_restores_stored_nodes():
+        """should return stored nodes and remove them from cache"""
+        cache = KeepAliveCache()
+        nodes = [_create_node()]
+        cache.store('key', nodes)
+
+        assert cache.restore('key') is nodes
+        assert cache.restore('key') is None
+        assert cache.count == 0
+
+    @staticmethod
+    def test_evicts_by_count():
+        """should destroy least recently stored nodes if count is exceeded"""
+        cache = KeepAliveCache(max_count = 2)
+        first, second, third = _create_node(), _create_node(), _create_node()
+        first.on_destroy = Mock()
+
+        cache.store('first', [first])
+        cache.store('second', [second])
+        cache.store('third', [third])
+
+        assert first.on_destroy.called
+        assert cache.restore('first') is None
+        assert cache.restore('second') == [second]
+
+    @staticmethod
+    def test_evicts_by_cost():
+        """should destroy least recently stored nodes if cost is exceeded"""
+        cache = KeepAliveCache(max_cost = 3)
+        first, second = _create_node(_create_node()), _create_node(_create_node())
+
+        cache.store('first', [first])
+        cache.store('second', [second])
+
+        assert cache.count == 1
+        assert cache.cost == 2
+        assert cache.restore('first') is None
+
+    @staticmethod
+    def test_clear():
+        """should destroy stored nodes"""
+        cache = KeepAliveCache()
+        node = _create_node()
+        node.on_destroy = Mock()
+        cache.store('key', [node])
+
+        cache.clear()
+
+        assert node.on_destroy.called
+        assert cache.count == 0
+        assert cache.cost == 0
+
+
+@fixture
+def keep_alive_fixture(request):
+    with patch('tkviews.containers.render_view_content') as render_view_content:
+        with patch('tkviews.containers.render_if') as render_if:
+            request.cls.render_view_content = render_view_content
+            request.cls.render_if = render_if
+            request.cls.context = TkRenderingContext()
+            yield
+
+
+@mark.usefixtures('keep_alive_fixture')
+class KeepViewsAliveTests:
+    """keep_views_alive tests"""
+
+    render_view_content: Mock
+    context: TkRenderingContext
+
+    def test_renders_new_view(self):
+        """should hide current view and render new"""
+        view = View(Mock())
+        view.name = 'one'
+        content = _create_widget_node()
+        view.add_child(content)
+        keep_views_alive(view, self.context)
+
+        view.name = 'two'
+
+        assert content.instance.pack_forget.called
+        assert not content.instance.destroy.called
+        assert view.children == []
+        assert self.render_view_content.call_args[0] == (view, self.context)
+
+    def test_restores_previous_view(self):
+        """should show kept alive view instead of rendering"""
+        view = View(Mock())
+        view.name = 'one'
+        content = _create_widget_node()
+        view.add_child(content)
+        keep_views_alive(view, self.context)
+        view.name = 'two'
+        self.render_view_content.reset_mock()
+
+        view.name = 'one'
+
+        assert not self.render_view_content.called
+        assert view.children == [content]
+        assert content.instance.pack.called
+
+    def test_destroys_kept_views(self):
+        """should destroy kept alive views on node destroy"""
+        view = View(Mock())
+        view.name = 'one'
+        content = _create_node()
+        content.on_destroy = Mock()
+        view.add_child(content)
+        keep_views_alive(view, self.context)
+        view.name = 'two'
+
+        view.destroy()
+
+        assert content.on_destroy.called
+
+
+@mark.usefixtures('keep_alive_fixture')
+class KeepIfAliveTests:
+    """keep_if_alive tests"""
+
+    render_if: Mock
+    context: TkRenderingContext
+
+    def test_hides_and_restores_children(self):
+        """should hide children on false condition and restore them on true"""
+        node = If(Mock())
+        node.condition = True
+        child = _create_widget_node()
+        node.add_child(child)
+        keep_if_alive(node, self.context)
+
+        node.condition = False
+
+        assert node.children == []
+        assert child.instance.pack_forget.called
+
+        node.condition = True
+
+        assert node.children == [child]
+        assert not self.render_if.called
+
+    def test_renders_children(self):
+        """should render children if nothing is kept alive"""
+        node = If(Mock())
+        keep_if_alive(node, self.context)
+
+        node.condition = True
+
+        assert self.render_if.call_args[0] == (node, self.context)
+
+    def test_ignores_same_truthiness(self):
+        """should not touch children if condition truthiness is not changed"""
+        node = If(Mock())
+        node.condition = True
+        child = _create_widget_node()
+        node.add_child(child)
+        keep_if_alive(node, self.context)
+
+        node.condition = 'yes'
+
+        assert node.children == [child]
+        assert not child.instance.pack_forget.called
@@ -0,0 +1,194 @@
+from tkinter import Button, Canvas, Entry, Label, Listbox, StringVar, TclError
+from unittest.mock import Mock
+
+from injectool import add_singleton
+from pytest import fixture, mark, raises
+
+from tkviews.headless import FakeTk, FakeTkapp, use_headless
+from tkviews.widgets.node import Root, create_tk
+
+
+@fixture
+def headless_fixture(request):
+    root = FakeTk()
+    request.cls.root = root
+    request.cls.tkapp = root.tk
+    yield root
+    root.destroy()
+
+
+@mark.usefixtures('headless_fixture')
+class FakeTkTests:
+    """FakeTk tests"""
+
+    root: FakeTk
+    tkapp: FakeTkapp
+
+    def test_configure(self):
+        """should store widget options and count calls"""
+        label = Label(self.root, text = 'text')
+
+        label.configure(foreground = 'red')
+
+        assert label.cget('text') == 'text'
+        assert label.cget('foreground') == 'red'
+        assert self.tkapp.calls['label'] == 1
+        assert self.tkapp.calls['configure'] == 1
+        assert self.tkapp.calls['cget'] == 2
+
+    def test_geometry(self):
+        """should store geometry manager and options"""
+        label = Label(self.root)
+
+        label.pack(side = 'left')
+
+        assert label.winfo_manager() == 'pack'
+        assert label.pack_info()['side'] == 'left'
+
+        label.pack_forget()
+
+        assert label.winfo_manager() == ''
+
+    def test_destroy(self):
+        """should remove widget and its children"""
+        canvas = Canvas(self.root)
+        Label(canvas)
+
+        canvas.destroy()
+
+        assert list(self.tkapp.widgets) == ['.']
+
+    def test_destroy_root(self):
+        """should remove root widget"""
+        self.root.destroy()
+
+        assert not self.root.winfo_exists()
+
+    def test_canvas_items(self):
+        """should store canvas items"""
+        canvas = Canvas(self.root)
+
+        item = canvas.create_rectangle(0, 0, 10, 10, fill = 'red')
+        canvas.itemconfigure(item, fill = 'blue')
+
+        assert canvas.itemcget(item, 'fill') == 'blue'
+        assert canvas.coords(item) == [0, 0, 10, 10]
+
+        canvas.delete(item)
+
+        assert self.tkapp.widgets[str(canvas)].items == {}
+
+    def test_listbox(self):
+        """should store listbox items"""
+        listbox = Listbox(self.root)
+
+        listbox.insert('end', 'one', 'three')
+        listbox.insert(1, 'two')
+        listbox.delete(0)
+
+        assert listbox.size() == 2
+        assert listbox.get(0, 'end') == ('two', 'three')
+
+    def test_drops_arguments_from_none(self):
+        """should drop arguments starting from first None like tkinter"""
+        listbox = Listbox(self.root)
+
+        self.tkapp.call(str(listbox), 'insert', 'end', 'one', None, 'two')
+
+        assert listbox.get(0, 'end') == ('one',)
+
+    def test_variables(self):
+        """should store variables and call write traces"""
+        variable = StringVar(self.root)
+        callback = Mock()
+        variable.trace_add('write', callback)
+        entry = Entry(self.root, textvariable = variable)
+
+        entry.insert(0, 'value')
+
+        assert variable.get() == 'value'
+        assert callback.call_count == 1
+
+    def test_bind(self):
+        """should call bound handler on generated event"""
+        button = Button(self.root)
+        handler = Mock()
+        button.bind('<Button-1>', handler)
+
+        button.event_generate('<Button-1>')
+
+        assert handler.call_count == 1
+        assert handler.call_args[0][0].widget is button
+
+    def test_after(self):
+        """should run after callbacks using virtual time"""
+        callback = Mock()
+        self.root.after(100, callback)
+        self.root.after_idle(callback)
+
+        self.root.update()
+
+        assert callback.call_count == 1
+
+        self.tkapp.advance(100)
+
+        assert callback.call_count == 2
+
+    def test_mainloop(self):
+        """should run scheduled callbacks until quit"""
+        callback = Mock()
+        self.root.after(10, callback)
+        self.root.after(20, self.root.quit)
+        self.root.after(30, callback)
+
+        self.root.mainloop()
+
+        assert callback.call_count == 1
+        assert self.tkapp.time == 20
+
+    def test_after_cancel(self):
+        """should not run canceled callback"""
+        callback = Mock()
+        after_id = self.root.after(10, callback)
+
+        self.root.after_cancel(after_id)
+        self.tkapp.advance(10)
+
+        assert not callback.called
+
+    @staticmethod
+    @mark.parametrize('value, expected', [
+        ('1', True),
+        ('yes', True),
+        ('off', False),
+        (0, False)
+    ])  # yapf: disable
+    def test_getboolean(value, expected):
+        """should convert value to bool"""
+        assert FakeTkapp.getboolean(value) == expected
+
+    @staticmethod
+    def test_getint_raises():
+        """should raise TclError for invalid integer"""
+        with raises(TclError):
+            FakeTkapp.getint('value')
+
+
+@mark.usefixtures('container_fixture')
+def test_use_headless():
+    """should use FakeTk as Root instance"""
+    use_headless()
+
+    root = Root(Mock())
+
+    assert isinstance(root.instance, FakeTk)
+    root.instance.destroy()
+
+
+@mark.usefixtures('container_fixture')
+def test_create_tk_dependency():
+    """should use registered tk factory"""
+    tk = Mock()
+    add_singleton(create_tk, lambda: tk)
+
+    assert Root(Mock()).instance is tk
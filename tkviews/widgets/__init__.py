@@ -1,8 +1,9 @@
 """Widgets functionality"""
 
-from .binding import VariableBinding, use_variables_binding
+from .binding import VariableBinding, use_variables_binding, use_shared_variables
 from .binding import bind_variable_and_expression, bind_custom_variable_and_expression
 from .node import Root, get_root_pipeline, WidgetNode, get_widget_pipeline, setup_widget_setter, \
-    setup_widget_destroy, apply_text, render_widget_children
-from .setters import bind, bind_all, config
+    setup_widget_destroy, apply_text, render_widget_children, apply_widget_attributes, add_setter_route, \
+    remove_setter_route, use_batching
+from .setters import bind, bind_all, config, config_command, use_job_commands
 from .ttk import TtkStyle
@@ -1,8 +1,9 @@
 """Widgets binding"""
 
+import ast
 from tkinter import (BooleanVar, Checkbutton, DoubleVar, Entry, IntVar, Radiobutton, Scale, Spinbox, StringVar,
                      Variable, Widget)
-from typing import Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from injectool import In, inject
 from pyviews.binding.binder import Binder, BindingContext
@@ -12,25 +13,70 @@ from pyviews.core.binding import Binding, BindingCallback, BindingError
 from pyviews.core.error import PyViewsError, error_handling
 from pyviews.core.expression import Expression, execute
 
+from tkviews.core.callbacks import CallbackInfo, run_callback
+from tkviews.core.expression import get_binding_expression
+from tkviews.widgets.traces import VariableTrace, get_variable_trace
+
+
+_UNSET = object()
+
+
+class VariableSync:
+    """Last value synchronized between variable and expression. Used to skip echo and equal updates"""
+
+    def __init__(self, var: Variable):
+        self.var: Variable = var
+        self.value: Any = _UNSET
+        self.setting: bool = False
+        self.delayed: Optional['DelayedCallback'] = None
+
+    def set(self, value: Any):
+        """Sets variable if value is changed. Pending delayed variable value is discarded"""
+        if value == self.value:
+            return
+        self.value = value
+        if self.delayed is not None:
+            self.delayed.discard()
+        self.setting = True
+        try:
+            self.var.set(value)
+        finally:
+            self.setting = False
+
+    def reset(self):
+        """Forgets last value"""
+        self.value = _UNSET
+
 
 class VariableBinding(Binding):
-    """Binding is subscribed on tkinter Var changes"""
+    """Binding is subscribed on tkinter Var changes. Bindings of one variable share one write trace"""
 
-    def __init__(self, callback: BindingCallback, var: Variable):
+    def __init__(self, callback: BindingCallback, var: Variable, sync: Optional[VariableSync] = None):
         super().__init__()
         self._callback = callback
         self._var = var
-        self._trace_id = None
+        self._sync: Optional[VariableSync] = sync
+        self._trace: Optional[VariableTrace] = None
+        self._trace_key: Optional[int] = None
+        self._callback_info = CallbackInfo('variable', str(var))
 
     def bind(self):
         """Applies binding"""
         self.destroy()
-        self._trace_id = self._var.trace_add('write', self._var_callback)
+        self._trace = get_variable_trace(self._var)
+        self._trace_key = self._trace.add(self._var_callback)
 
     def _var_callback(self, *_):
+        sync = self._sync
+        if sync is not None and sync.setting:
+            return
         with error_handling(BindingError, self._add_error_info):
-            value = self._var.get()
-            self._callback(value)
+            value = self._trace.get()
+            if sync is not None:
+                if value == sync.value:
+                    return
+                sync.value = value
+            run_callback(self._callback_info, self._callback, value)
 
     def _add_error_info(self, error: PyViewsError):
         error.add_info('Binding', self)
@@ -39,9 +85,135 @@ class VariableBinding(Binding):
 
     def destroy(self):
         """Destroys binding"""
-        if self._trace_id:
-            self._var.trace_remove('write', self._trace_id)
-        self._trace_id = None
+        if self._trace is not None:
+            self._trace.remove(self._trace_key)
+        self._trace = None
+        self._trace_key = None
+        if self._sync is not None:
+            self._sync.reset()
+
+
+class DelayedCallback(Binding):  # pylint: disable=too-many-instance-attributes
+    """
+    Passes last value to callback after debounce or throttle interval in milliseconds or on widget focus out.
+    Pending value is passed when binding is destroyed
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        callback: BindingCallback,
+        widget: Widget,
+        *,
+        debounce: Optional[float] = None,
+        throttle: Optional[float] = None,
+        focusout: bool = False,
+        callback_info: Optional[CallbackInfo] = None
+    ):
+        super().__init__()
+        self._callback: BindingCallback = callback
+        self._widget: Widget = widget
+        self._debounce: Optional[float] = debounce
+        self._throttle: Optional[float] = throttle
+        self._focusout: bool = focusout
+        self._callback_info: CallbackInfo = callback_info if callback_info else CallbackInfo('variable', str(callback))
+        self._value: Any = None
+        self._pending: bool = False
+        self._after_id = None
+        self._active: bool = False
+        self._focus_bound: bool = False
+
+    def __call__(self, value: Any):
+        self._value = value
+        self._pending = True
+        if self._debounce is not None:
+            self._cancel()
+            self._after_id = self._widget.after(int(self._debounce), self._on_timer)
+        elif self._throttle is not None and self._after_id is None:
+            self._deliver()
+            self._after_id = self._widget.after(int(self._throttle), self._on_timer)
+
+    @property
+    def widget(self) -> Widget:
+        """Widget used for timers and focus out"""
+        return self._widget
+
+    @widget.setter
+    def widget(self, widget: Widget):
+        rescheduled = self._after_id is not None
+        self._cancel()
+        self._widget = widget
+        if rescheduled:
+            interval = self._debounce if self._debounce is not None else self._throttle
+            self._after_id = widget.after(int(interval), self._on_timer)
+        if self._focus_bound:
+            self._focus_bound = False
+            self.bind()
+
+    def _on_timer(self):
+        self._after_id = None
+        if self._pending:
+            self._deliver()
+            if self._throttle is not None and self._debounce is None:
+                self._after_id = self._widget.after(int(self._throttle), self._on_timer)
+
+    def _on_focus_out(self, *_):
+        if self._active:
+            self.flush()
+
+    def _deliver(self):
+        self._pending = False
+        run_callback(self._callback_info, self._callback, self._value)
+
+    def _cancel(self):
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def discard(self):
+        """Drops pending value"""
+        self._cancel()
+        self._pending = False
+        self._value = None
+
+    def flush(self):
+        """Passes pending value to callback"""
+        self._cancel()
+        if self._pending:
+            self._deliver()
+
+    def bind(self):
+        """Subscribes to widget focus out"""
+        self._active = True
+        if self._focusout and not self._focus_bound:
+            self._widget.bind('<FocusOut>', self._on_focus_out, '+')
+            self._focus_bound = True
+
+    def destroy(self):
+        """Passes pending value to callback"""
+        self._active = False
+        self.flush()
+
+
+_DELAY_OPTIONS = ('debounce', 'throttle', 'focusout')
+
+
+def split_binding_options(expression_body: str) -> Tuple[str, Optional[str]]:
+    """Splits "expression}:{options" to expression and options"""
+    parts = expression_body.rsplit('}:{', 1)
+    return (parts[0], parts[1]) if len(parts) == 2 else (expression_body, None)
+
+
+def get_binding_options(options_body: Optional[str], context: BindingContext) -> dict:
+    """Executes options like "debounce=300, focusout=True" and returns them as dictionary"""
+    if not options_body:
+        return {}
+    options = execute(Expression(f'dict({options_body})'), context.node.node_globals)
+    unknown = [key for key in options if key not in _DELAY_OPTIONS]
+    if unknown:
+        error = BindingError(f'Unknown binding options: {", ".join(unknown)}')
+        error.add_info('Options', options_body)
+        raise error
+    return options
 
 
 @inject(binder = Binder)
@@ -77,17 +249,158 @@ def use_variables_binding(binder: Binder = In):
 
 def bind_variable_and_expression(variable: Union[Variable, Type[Variable]], context: BindingContext) -> TwoWaysBinding:
     """Create two ways binding between variable and expression"""
+    return _bind_variable_and_expression(variable, context)[0]
+
+
+def _bind_variable_and_expression(
+    variable: Union[Variable, Type[Variable]],
+    context: BindingContext
+) -> Tuple[TwoWaysBinding, Optional[DelayedCallback]]:
+    expression_body, options_body = split_binding_options(context.expression_body)
+    options = get_binding_options(options_body, context)
     if isinstance(variable, type):
         variable = variable()
     context.setter(context.node, context.xml_attr.name, variable)
-    property_expression = Expression(context.expression_body)
+    property_expression = get_binding_expression(context, expression_body)
 
-    expr_binding = ExpressionBinding(variable.set, property_expression, context.node.node_globals)
+    sync = VariableSync(variable)
+    expr_binding = ExpressionBinding(sync.set, property_expression, context.node.node_globals)
     expression_callback = get_expression_callback(property_expression, context.node.node_globals)
-    var_binding = VariableBinding(expression_callback, variable)
+    if options:
+        delayed = DelayedCallback(
+            expression_callback,
+            context.node.instance,
+            **options,
+            callback_info = CallbackInfo('variable', str(variable))
+        )
+        sync.delayed = delayed
+        var_binding = TwoWaysBinding(VariableBinding(delayed, variable, sync), delayed)
+    else:
+        var_binding = VariableBinding(expression_callback, variable, sync)
     two_ways_binding = TwoWaysBinding(expr_binding, var_binding)
     two_ways_binding.bind()
-    return two_ways_binding
+    return two_ways_binding, sync.delayed
+
+
+class SharedVariable:
+    """Variable shared by widgets bound to the same expression"""
+
+    def __init__(self, key: tuple, variable: Variable):
+        self.key: tuple = key
+        self.variable: Variable = variable
+        self.binding: Optional[Binding] = None
+        self.delayed: Optional[DelayedCallback] = None
+        self.widgets: List[Widget] = []
+
+    @property
+    def count(self) -> int:
+        """Count of widgets using variable"""
+        return len(self.widgets)
+
+    def add(self, widget: Widget):
+        """Adds widget using variable"""
+        self.widgets.append(widget)
+        self._update_owner()
+
+    def remove(self, widget: Widget):
+        """Removes widget using variable"""
+        self.widgets = [item for item in self.widgets if item is not widget]
+        self._update_owner()
+
+    def _update_owner(self):
+        """Delayed callback uses first alive widget for timers and focus out"""
+        delayed = self.delayed
+        if delayed is None or not self.widgets or any(item is delayed.widget for item in self.widgets):
+            return
+        delayed.widget = self.widgets[0]
+
+
+_SHARED_VARIABLES: Dict[tuple, SharedVariable] = {}
+
+
+class SharedVariableBinding(Binding):
+    """
+    Holds shared variable for widget. Variable binding is destroyed with last widget.
+    Delayed callback is moved to next widget when its widget is removed
+    """
+
+    def __init__(self, shared: SharedVariable, widget: Widget):
+        super().__init__()
+        self._shared: SharedVariable = shared
+        self._widget: Widget = widget
+        self._bound: bool = False
+
+    def bind(self):
+        """Adds widget to shared variable. Variable binding is restored if it was destroyed"""
+        if self._bound:
+            return
+        self._bound = True
+        shared = self._shared
+        shared.add(self._widget)
+        if shared.count == 1:
+            _SHARED_VARIABLES.setdefault(shared.key, shared)
+            if shared.binding is not None:
+                shared.binding.bind()
+
+    def destroy(self):
+        """Removes widget from shared variable"""
+        if not self._bound:
+            return
+        self._bound = False
+        shared = self._shared
+        shared.remove(self._widget)
+        if shared.count == 0:
+            _SHARED_VARIABLES.pop(shared.key, None)
+            if shared.binding is not None:
+                shared.binding.destroy()
+
+
+def get_shared_variable_key(context: BindingContext) -> tuple:
+    """Returns key of parent widget, expression and objects used in expression"""
+    expression_body = split_binding_options(context.expression_body)[0]
+    names = sorted({
+        node.id
+        for node in ast.walk(ast.parse(expression_body.strip(), mode = 'eval'))
+        if isinstance(node, ast.Name)
+    })
+    node_globals = context.node.node_globals
+    master = getattr(context.node.instance, 'master', None)
+    return (id(master), context.expression_body, *(id(node_globals.get(name)) for name in names))
+
+
+def bind_shared_variable_and_expression(variable_type: Type[Variable], context: BindingContext) -> Binding:
+    """
+    Widgets bound to the same expression in the same parent widget use one variable.
+    Variable is bound to expression once
+    """
+    key = get_shared_variable_key(context)
+    shared = _SHARED_VARIABLES.get(key)
+    if shared is not None:
+        context.setter(context.node, context.xml_attr.name, shared.variable)
+        binding = SharedVariableBinding(shared, context.node.instance)
+        binding.bind()
+        return binding
+
+    shared = SharedVariable(key, variable_type())
+    shared.binding, shared.delayed = _bind_variable_and_expression(shared.variable, context)
+    binding = SharedVariableBinding(shared, context.node.instance)
+    binding.bind()
+    return binding
+
+
+@inject(binder = Binder)
+def use_shared_variables(binder: Binder = In):
+    """Radiobuttons and checkbuttons bound to the same expression in the same parent widget share one variable"""
+    binder.add_rule(
+        'twoways',
+        lambda ctx: bind_shared_variable_and_expression(BooleanVar, ctx),
+        lambda ctx: check_widget_and_property(Checkbutton, 'variable', ctx)
+    )
+    binder.add_rule(
+        'twoways',
+        lambda ctx: bind_shared_variable_and_expression(IntVar, ctx),
+        lambda ctx: check_widget_and_property(Radiobutton, 'variable', ctx)
+    )
 
 
 def check_widget_and_property(widget_type: Type[Widget], var_property: str, context: BindingContext) -> bool:
@@ -103,8 +416,9 @@ def bind_custom_variable_and_expression(context: BindingContext) -> TwoWaysBindi
     """
     Create two ways binding between variable and expression.
     Expression should be "[binding type]:{[variable to bind]}:{[expression to bind]}"
+    with optional binding options "[binding type]:{[variable to bind]}:{[expression to bind]}:{[options]}"
     """
-    (var_body, value_body) = context.expression_body.split('}:{')
+    (var_body, value_body) = context.expression_body.split('}:{', 1)
     variable: Variable = execute(Expression(var_body), context.node.node_globals)
     custom_context = BindingContext(context)
     custom_context.expression_body = value_body
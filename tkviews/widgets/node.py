@@ -1,22 +1,47 @@
 """Tkinter widgets nodes"""
 from functools import partial
 from tkinter import PanedWindow, Tk, Widget
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from pyviews.core.rendering import InstanceNode, NodeGlobals
+from injectool import DependencyError, add_singleton, dependency, resolve
+from pyviews.core.expression import is_expression
+from pyviews.core.rendering import InstanceNode, NodeGlobals, Setter
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.pipes import apply_attribute, apply_attributes, render_children
 from pyviews.rendering.pipeline import RenderingPipeline, create_instance, get_type
 
-from tkviews.core import TkRenderingContext
+from tkviews.core import BatchTkapp, ChildGlobals, ChildrenRendering, FusedPipeline, TkRenderingContext, \
+    add_pipe_condition, run_deferred
+
+
+@dependency
+def create_tk() -> Tk:
+    """Creates tkinter root"""
+    return Tk()
+
+
+def use_batching(max_size: int = 1000):
+    """Widgets options set by bindings are collected and applied by one interpreter call on idle"""
+    try:
+        tk_factory = resolve(create_tk)
+    except DependencyError:
+        tk_factory = create_tk.__wrapped__
+    add_singleton(create_tk, lambda: _use_batch(tk_factory(), max_size))
+
+
+def _use_batch(root: Tk, max_size: int) -> Tk:
+    root.tk = BatchTkapp(root.tk, max_size)
+    return root
 
 
 class Root(InstanceNode):
     """Wrapper under tkinter Root"""
 
     def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
-        super().__init__(Tk(), xml_node, node_globals)
+        super().__init__(create_tk(), xml_node, node_globals)
         self._icon = None
+        self._render_budget: Optional[float] = None
+        self.children_rendering: Optional[ChildrenRendering] = None
 
     @property
     def state(self):
@@ -37,6 +62,15 @@ class Root(InstanceNode):
         self._icon = value
         self.instance.iconbitmap(default = value)
 
+    @property
+    def render_budget(self) -> Optional[float]:
+        """Time in milliseconds to render children in one event loop iteration"""
+        return self._render_budget
+
+    @render_budget.setter
+    def render_budget(self, value: Optional[float]):
+        self._render_budget = None if value is None else float(value)
+
     def bind(self, event, command):
         """Calls widget bind"""
         self.instance.bind(event, command)
@@ -61,6 +95,17 @@ class WidgetNode(InstanceNode):
 
     def __init__(self, widget: Widget, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
         super().__init__(widget, xml_node, node_globals = node_globals)
+        self._render_budget: Optional[float] = None
+        self.children_rendering: Optional[ChildrenRendering] = None
+
+    @property
+    def render_budget(self) -> Optional[float]:
+        """Time in milliseconds to render children in one event loop iteration"""
+        return self._render_budget
+
+    @render_budget.setter
+    def render_budget(self, value: Optional[float]):
+        self._render_budget = None if value is None else float(value)
 
     def bind(self, event, command):
         """Calls widget bind"""
@@ -71,9 +116,23 @@ class WidgetNode(InstanceNode):
         self.instance.bind_all(event, command)
 
 
-def get_widget_pipeline() -> RenderingPipeline:
-    """Returns setup for widget"""
-    return RenderingPipeline(pipes=[
+def get_widget_pipeline(constructor_options: bool = False, fused: bool = False) -> RenderingPipeline:
+    """
+    Returns setup for widget.
+    If constructor_options is True, static widget options are passed to widget constructor.
+    If fused is True, pipes that do nothing for template node and master type are dropped
+    """
+    pipeline_type = FusedPipeline if fused else RenderingPipeline
+    if constructor_options:
+        return pipeline_type(pipes=[
+            setup_widget_setter,
+            setup_widget_destroy,
+            apply_widget_attributes,
+            apply_text,
+            add_to_panedwindow,
+            render_widget_children
+        ], create_node=_create_widget_node_with_options, name='widget pipeline') # yapf: disable
+    return pipeline_type(pipes=[
         setup_widget_setter,
         setup_widget_destroy,
         apply_attributes,
@@ -90,14 +149,66 @@ def setup_widget_setter(node: WidgetNode, _: TkRenderingContext):
 
 def _widget_node_setter(node: WidgetNode, key: str, value):
     """Applies passed attribute"""
-    if key == 'ttkstyle':
-        pass
+    route_key = (type(node), type(node.instance), key)
+    try:
+        route = _ROUTES[route_key]
+    except KeyError:
+        route = _ROUTES[route_key] = get_setter_route(node, key)
+    route(node, key, value)
+
+
+def set_node_attribute(node: WidgetNode, key: str, value: Any):
+    """Setter route: sets node attribute"""
+    setattr(node, key, value)
+
+
+def set_widget_attribute(node: WidgetNode, key: str, value: Any):
+    """Setter route: sets widget attribute"""
+    setattr(node.instance, key, value)
+
+
+def configure_widget(node: WidgetNode, key: str, value: Any):
+    """Setter route: calls widget configure"""
+    run_deferred(node.instance, node.instance.configure, view_info = node.xml_node.view_info, **{key: value})
+
+
+_ROUTES: Dict[Tuple[type, type, str], Setter] = {}
+_CUSTOM_ROUTES: List[Tuple[str, type, type, Setter]] = []
+
+
+def add_setter_route(key: str, route: Setter, node_type: type = WidgetNode, widget_type: type = object):
+    """Uses passed route to set attribute with key for node and widget of passed types"""
+    _CUSTOM_ROUTES.insert(0, (key, node_type, widget_type, route))
+    _ROUTES.clear()
+
+
+def remove_setter_route(key: str, route: Setter, node_type: type = WidgetNode, widget_type: type = object):
+    """Removes route added with add_setter_route"""
+    _CUSTOM_ROUTES[:] = [item for item in _CUSTOM_ROUTES if item != (key, node_type, widget_type, route)]
+    _ROUTES.clear()
+
+
+def get_setter_route(node: WidgetNode, key: str) -> Setter:
+    """Returns setter route used to set attribute with key"""
+    custom_route = _find_custom_route(type(node), type(node.instance), key)
+    if custom_route:
+        return custom_route
     if hasattr(node, key):
-        setattr(node, key, value)
-    elif hasattr(node.instance, key):
-        setattr(node.instance, key, value)
-    else:
-        node.instance.configure(**{key: value})
+        return set_node_attribute
+    if hasattr(node.instance, key):
+        return set_widget_attribute
+    return configure_widget
+
+
+def _find_custom_route(node_type: type, widget_type: type, key: str) -> Optional[Setter]:
+    try:
+        return next(
+            route for route_key, route_node_type, route_widget_type, route in _CUSTOM_ROUTES
+            if route_key == key and issubclass(node_type, route_node_type)
+            and issubclass(widget_type, route_widget_type)
+        )
+    except StopIteration:
+        return None
 
 
 def setup_widget_destroy(node: WidgetNode, _: TkRenderingContext):
@@ -106,22 +217,30 @@ def setup_widget_destroy(node: WidgetNode, _: TkRenderingContext):
 
 
 def _on_widget_destroy(node: WidgetNode):
+    if node.children_rendering is not None:
+        node.children_rendering.cancel()
     node.instance.destroy()
 
 
 def render_widget_children(node: WidgetNode, context: TkRenderingContext):
     """Render step. Renders widget children"""
-    render_children(node, context, _get_child_context)
+    if node.render_budget is None:
+        render_children(node, context, _get_child_context)
+    else:
+        node.children_rendering = ChildrenRendering(
+            node, context, _get_child_context, node.instance, node.render_budget
+        )
+        node.children_rendering.start()
 
 
 def _get_child_context(xml_node: XmlNode, node: WidgetNode, _: TkRenderingContext):
     """Renders child widgets"""
-    child_context = TkRenderingContext()
-    child_context.xml_node = xml_node
-    child_context.parent_node = node
-    child_context.master = node.instance
-    child_context.node_globals = NodeGlobals(node.node_globals)
-    return child_context
+    return TkRenderingContext({
+        'parent_node': node,
+        'master': node.instance,
+        'node_globals': ChildGlobals(node.node_globals),
+        'xml_node': xml_node
+    })
 
 
 def _create_widget_node(context: TkRenderingContext):
@@ -130,6 +249,37 @@ def _create_widget_node(context: TkRenderingContext):
     return create_instance(WidgetNode, {'widget': inst, **context})
 
 
+def _create_widget_node_with_options(context: TkRenderingContext):
+    inst_type = get_type(context.xml_node)
+    options = {
+        attr.name: attr.value for attr in context.xml_node.attrs if is_widget_option(WidgetNode, inst_type, attr)
+    }
+    inst = create_instance(partial(inst_type, **options), context)
+    return create_instance(WidgetNode, {'widget': inst, **context})
+
+
+
+
+def is_widget_option(node_type: Type[WidgetNode], widget_type: Type[Widget], xml_attr: XmlAttr) -> bool:
+    """Returns true if attribute is static widget option that can be passed to widget constructor"""
+    if xml_attr.namespace is not None:
+        return False
+    if is_expression(xml_attr.value.strip() if xml_attr.value else ''):
+        return False
+    custom_route = _find_custom_route(node_type, widget_type, xml_attr.name)
+    if custom_route:
+        return custom_route is configure_widget
+    return not hasattr(node_type, xml_attr.name) and not hasattr(widget_type, xml_attr.name)
+
+
+def apply_widget_attributes(node: WidgetNode, _: TkRenderingContext):
+    """Applies xml attributes that are not passed to widget constructor"""
+    node_type, widget_type = type(node), type(node.instance)
+    for attr in node.xml_node.attrs:
+        if not is_widget_option(node_type, widget_type, attr):
+            apply_attribute(node, attr)
+
+
 def apply_text(node: WidgetNode, _: TkRenderingContext):
     """Applies xml node content to WidgetNode"""
     if node.xml_node.text is None or not node.xml_node.text.strip():
@@ -142,3 +292,17 @@ def add_to_panedwindow(node: WidgetNode, context: TkRenderingContext):
     """Sets up setter"""
     if isinstance(context.master, PanedWindow):
         context.master.add(node.instance)
+
+
+def _has_text(xml_node: XmlNode, _: type) -> bool:
+    return xml_node.text is not None and bool(xml_node.text.strip())
+
+
+def _is_panedwindow(_: XmlNode, master_type: type) -> bool:
+    return issubclass(master_type, PanedWindow)
+
+
+add_pipe_condition(apply_widget_attributes, lambda xml_node, _: bool(xml_node.attrs))
+add_pipe_condition(apply_text, _has_text)
+add_pipe_condition(add_to_panedwindow, _is_panedwindow)
+add_pipe_condition(render_widget_children, lambda xml_node, _: bool(xml_node.children))
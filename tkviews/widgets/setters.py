@@ -1,10 +1,16 @@
 """Common setters for widgets nodes"""
 
+import sys
+import tkinter
+from functools import partial
 from tkinter import Event
 
 from pyviews.core.error import PyViewsError, ViewInfo, error_handling
 
-from tkviews.widgets.node import WidgetNode
+from tkviews.core.batch import run_deferred
+from tkviews.core.callbacks import CallbackInfo, run_callback
+from tkviews.core.jobs import JobOptions, get_job_options, get_job_runner
+from tkviews.widgets.node import WidgetNode, add_setter_route, configure_widget, remove_setter_route
 
 
 class CallbackError(PyViewsError):
@@ -17,13 +23,44 @@ def bind(node: WidgetNode, event_name, command):
     node.bind(f'<{event_name}>', command)
 
 
-def _get_handled_command(command, view_info, event):
-    return lambda *args, **kwargs: _call_command(command, view_info, event, args, kwargs)
+def _get_handled_command(command, view_info, event, passes_event = True):
+    options = get_job_options(command)
+    if options is None:
+        return lambda *args, **kwargs: _call_command(command, view_info, event, args, kwargs)
+    _check_job(command, options, view_info, event, passes_event)
+    return lambda *args, **kwargs: _run_job(command, view_info, event, args, kwargs)
 
 
 def _call_command(command, view_info, event, args, kwargs):
     with error_handling(CallbackError, lambda e: _add_callback_info(event, view_info, e)):
-        command(*args, **kwargs)
+        run_callback(CallbackInfo('command', event, view_info), command, *args, **kwargs)
+
+
+def _check_job(command, options: JobOptions, view_info: ViewInfo, event, passes_event: bool):
+    if options.executor != 'process' or not (passes_event or hasattr(command, '__self__')):
+        return
+    error = CallbackError('Process pool handler should be function without event argument, '
+                          'bound methods and tkinter events can not be pickled')
+    _add_callback_info(event, view_info, error)
+    raise error
+
+
+def _run_job(command, view_info, event, args, kwargs):
+    with error_handling(CallbackError, lambda e: _add_callback_info(event, view_info, e)):
+        on_error = partial(_report_job_error, view_info, event)
+        run_callback(CallbackInfo('command', event, view_info), get_job_runner().run, command, args, kwargs, on_error)
+
+
+def _report_job_error(view_info: ViewInfo, event, error: BaseException):
+    try:
+        with error_handling(CallbackError, lambda e: _add_callback_info(event, view_info, e)):
+            raise error
+    except PyViewsError:
+        root = getattr(tkinter, '_default_root', None)
+        if root is None:
+            sys.excepthook(*sys.exc_info())
+        else:
+            root.report_callback_exception(*sys.exc_info())
 
 
 def _add_callback_info(event: Event, view_info: ViewInfo, error: PyViewsError):
@@ -39,4 +76,17 @@ def bind_all(node: WidgetNode, event_name, command):
 
 def config(node: WidgetNode, key, value):
     """Calls widget's config method"""
-    node.instance.config(**{key: value})
+    run_deferred(node.instance, node.instance.config, view_info = node.xml_node.view_info, **{key: value})
+
+
+def config_command(node: WidgetNode, key, value):
+    """Setter route: coroutine and job handlers passed to command option are run by job runner"""
+    if callable(value) and get_job_options(value) is not None:
+        value = _get_handled_command(value, node.xml_node.view_info, key, passes_event = False)
+    configure_widget(node, key, value)
+
+
+def use_job_commands():
+    """Coroutine and job handlers passed to widgets command option are run by job runner"""
+    remove_setter_route('command', config_command)
+    add_setter_route('command', config_command)
@@ -2,16 +2,18 @@ from tkinter import Widget
 from typing import Type
 from unittest.mock import Mock, call
 
-from pytest import mark, fixture
+from pytest import mark, fixture, raises
 from pyviews.binding.binder import BindingContext
 from pyviews.binding.twoways import TwoWaysBinding
-from pyviews.core.binding import BindableEntity
+from pyviews.core.binding import BindableEntity, BindingError
 from pyviews.core.rendering import Node, NodeGlobals
 from pyviews.core.xml import XmlAttr
 from pyviews.pipes import call_set_attr
 
-from tkviews.widgets.binding import VariableBinding, check_widget_and_property, \
-    bind_variable_and_expression, bind_custom_variable_and_expression
+from tkviews.core.expression import compile_expression, get_expression_cache
+from tkviews.widgets.binding import VariableBinding, VariableSync, DelayedCallback, check_widget_and_property, \
+    bind_variable_and_expression, bind_custom_variable_and_expression, split_binding_options, \
+    bind_shared_variable_and_expression
 from tkviews.widgets.node import WidgetNode
 
 
@@ -72,8 +74,173 @@ class VariableBindingTest:
         assert not callback.called
 
 
-class Entry(Widget):
+class VariableSyncTests:
+    """VariableSync tests"""
+
+    @staticmethod
+    def test_skips_equal_value():
+        """should set variable only if value is changed"""
+        var = Mock()
+        sync = VariableSync(var)
+
+        sync.set('value')
+        sync.set('value')
+
+        assert var.set.call_args_list == [call('value')]
+
+    @staticmethod
+    def test_reset():
+        """should set variable after reset"""
+        var = Mock()
+        sync = VariableSync(var)
+
+        sync.set('value')
+        sync.reset()
+        sync.set('value')
+
+        assert var.set.call_count == 2
+
+    @staticmethod
+    def test_skips_echo():
+        """should not call binding callback for variable change made by sync"""
+        var = TestVariable()
+        callback = Mock()
+        sync = VariableSync(var)
+        VariableBinding(callback, var, sync).bind()
+
+        sync.set('value')
+
+        assert not callback.called
+
+    @staticmethod
+    def test_skips_same_variable_value():
+        """should not call binding callback if variable value is equal to synchronized one"""
+        var = TestVariable()
+        callback = Mock()
+        sync = VariableSync(var)
+        VariableBinding(callback, var, sync).bind()
+
+        var.set('value')
+        var.set('value')
+
+        assert callback.call_args_list == [call('value')]
+
+
+class TimerWidget:
+
+    def __init__(self):
+        self.timers = {}
+        self.bindings = {}
+
+    def after(self, delay, callback):
+        after_id = f'after#{len(self.timers)}'
+        self.timers[after_id] = (delay, callback)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def bind(self, event, callback, _ = None):
+        self.bindings[event] = callback
+
+    def run_timers(self):
+        timers, self.timers = self.timers, {}
+        for _, callback in timers.values():
+            callback()
+
+
+@fixture
+def delayed_fixture(request):
+    request.cls.widget = TimerWidget()
+    request.cls.callback = Mock()
+
+
+@mark.usefixtures('delayed_fixture')
+class DelayedCallbackTests:
+    """DelayedCallback tests"""
+
+    widget: TimerWidget
+    callback: Mock
+
+    def test_debounce(self):
+        """should pass last value after debounce interval"""
+        delayed = DelayedCallback(self.callback, self.widget, debounce = 300)
+        delayed.bind()
+
+        for value in range(5):
+            delayed(value)
+
+        assert not self.callback.called
+        assert [delay for delay, _ in self.widget.timers.values()] == [300]
+
+        self.widget.run_timers()
+
+        assert self.callback.call_args_list == [call(4)]
+
+    def test_throttle(self):
+        """should pass first value immediately and last value after throttle interval"""
+        delayed = DelayedCallback(self.callback, self.widget, throttle = 100)
+        delayed.bind()
+
+        for value in range(5):
+            delayed(value)
+        self.widget.run_timers()
+        self.widget.run_timers()
+
+        assert self.callback.call_args_list == [call(0), call(4)]
+        assert not self.widget.timers
+
+    def test_focusout(self):
+        """should pass last value on focus out"""
+        delayed = DelayedCallback(self.callback, self.widget, focusout = True)
+        delayed.bind()
+
+        delayed(1)
+        delayed(2)
+
+        assert not self.callback.called
+
+        self.widget.bindings['<FocusOut>']()
+
+        assert self.callback.call_args_list == [call(2)]
+
+    def test_destroy(self):
+        """should pass pending value on destroy"""
+        delayed = DelayedCallback(self.callback, self.widget, debounce = 300)
+        delayed.bind()
+
+        delayed(1)
+        delayed.destroy()
+
+        assert self.callback.call_args_list == [call(1)]
+        assert not self.widget.timers
+
+    def test_discard(self):
+        """should drop pending value"""
+        delayed = DelayedCallback(self.callback, self.widget, debounce = 300)
+        delayed.bind()
+
+        delayed(1)
+        delayed.discard()
+        self.widget.run_timers()
+        delayed.destroy()
+
+        assert not self.callback.called
+        assert not self.widget.timers
+
+
+@mark.parametrize('body, expected', [
+    ('vm.value', ('vm.value', None)),
+    ('vm.value}:{debounce=300', ('vm.value', 'debounce=300'))
+])  # yapf: disable
+def test_split_binding_options(body, expected):
+    """should split expression and options"""
+    assert split_binding_options(body) == expected
+
+
+class Entry(TimerWidget, Widget):
     def __init__(self):
+        TimerWidget.__init__(self)
         self.variable = None
 
 
@@ -132,6 +299,17 @@ class BindVariableAndExpressionTests:
 
         assert self.widget.variable is var
 
+    def test_uses_expression_cache(self):
+        """should use cached expression of xml attribute value"""
+        self.context.xml_attr = XmlAttr('variable', '{{vm.value}}')
+        cache = get_expression_cache()
+        compile_expression('{{vm.value}}')
+        hits = cache.hits
+
+        bind_variable_and_expression(TestVariable, self.context)
+
+        assert cache.hits == hits + 1
+
     @mark.parametrize('init_value, new_value', [
         (1, 2),
         (2, 2),
@@ -160,6 +338,54 @@ class BindVariableAndExpressionTests:
 
         assert self.vm.value == new_value
 
+    def test_debounce_option(self):
+        """should pass variable value to expression after debounce interval"""
+        self.context.expression_body = 'vm.value}:{debounce=300'
+        bind_variable_and_expression(TestVariable, self.context)
+
+        self.widget.variable.set('value')
+
+        assert self.vm.value is None
+
+        self.widget.run_timers()
+
+        assert self.vm.value == 'value'
+
+    def test_model_change_discards_pending_value(self):
+        """should drop pending variable value if view model is changed in debounce interval"""
+        self.context.expression_body = 'vm.value}:{debounce=300'
+        bind_variable_and_expression(TestVariable, self.context)
+        variable = self.widget.variable
+
+        variable._val = 'typed'
+        variable._callback()
+        self.vm.value = 'cleared'
+        self.widget.run_timers()
+
+        assert self.vm.value == 'cleared'
+        assert variable.get() == 'cleared'
+
+    def test_unknown_option(self):
+        """should raise error for unknown option"""
+        self.context.expression_body = 'vm.value}:{delay=300'
+
+        with raises(BindingError):
+            bind_variable_and_expression(TestVariable, self.context)
+
+    def test_does_not_echo_variable_change(self):
+        """should write model once and not set variable back on variable change"""
+        bind_variable_and_expression(TestVariable, self.context)
+        variable = self.widget.variable
+        variable.set = Mock(wraps = variable.set)
+        writes = []
+        self.vm.observe('value', lambda value, _: writes.append(value))
+
+        variable._val = 'typed'
+        variable._callback()
+
+        assert writes == ['typed']
+        assert not variable.set.called
+
 
 class CheckWidgetAndPropertyTests:
     """check_widget_and_property() tests"""
@@ -257,3 +483,139 @@ class BindCustomVariableAndExpressionTests:
         self.variable.set(new_value)
 
         assert self.vm.value == new_value
+
+    def test_options(self):
+        """should use options from third part of expression"""
+        self.context.expression_body = self.context.expression_body + '}:{focusout=True'
+        bind_custom_variable_and_expression(self.context)
+
+        self.variable.set('value')
+
+        assert self.vm.value is None
+
+        self.widget.bindings['<FocusOut>']()
+
+        assert self.vm.value == 'value'
+
+
+@fixture
+def shared_var_fixture(request):
+    view_model = TestViewModel()
+    node_globals = NodeGlobals({'vm': view_model})
+    request.cls.vm = view_model
+    request.cls.widgets = []
+    request.cls.contexts = []
+    for _ in range(3):
+        widget = Entry()
+        context = BindingContext()
+        context.node = WidgetNode(widget, Mock(), NodeGlobals(node_globals))
+        context.xml_attr = XmlAttr('variable')
+        context.setter = call_set_attr
+        context.expression_body = 'vm.value'
+        request.cls.widgets.append(widget)
+        request.cls.contexts.append(context)
+
+
+@mark.usefixtures('shared_var_fixture')
+class BindSharedVariableAndExpressionTests:
+    """bind_shared_variable_and_expression() tests"""
+
+    vm: TestViewModel
+    widgets: list
+    contexts: list
+
+    def _bind_all(self) -> list:
+        return [bind_shared_variable_and_expression(TestVariable, context) for context in self.contexts]
+
+    def test_shares_variable(self):
+        """should set one variable to widgets bound to the same expression"""
+        self._bind_all()
+
+        variable = self.widgets[0].variable
+        assert isinstance(variable, TestVariable)
+        assert all(widget.variable is variable for widget in self.widgets)
+
+    def test_different_objects(self):
+        """should create variable for every object used in expression"""
+        other = TestViewModel()
+        self.contexts[1].node.node_globals['vm'] = other
+
+        self._bind_all()
+
+        assert self.widgets[0].variable is self.widgets[2].variable
+        assert self.widgets[0].variable is not self.widgets[1].variable
+
+    def test_binds_variable(self):
+        """should bind shared variable and expression"""
+        self._bind_all()
+        variable = self.widgets[0].variable
+
+        self.vm.value = 2
+        variable_value = variable.get()
+        variable.set(3)
+
+        assert variable_value == 2
+        assert self.vm.value == 3
+
+    def test_destroy(self):
+        """should destroy variable binding with last widget binding"""
+        bindings = self._bind_all()
+        variable = self.widgets[0].variable
+
+        for binding in bindings[:-1]:
+            binding.destroy()
+        self.vm.value = 2
+        value_before_last = variable.get()
+        bindings[-1].destroy()
+        self.vm.value = 3
+
+        assert value_before_last == 2
+        assert variable.get() == 2
+
+    def test_rebind(self):
+        """should restore variable binding when bindings are bound after destroy"""
+        bindings = self._bind_all()
+        variable = self.widgets[0].variable
+        for binding in bindings:
+            binding.destroy()
+
+        for binding in bindings:
+            binding.bind()
+        self.vm.value = 5
+        variable_value = variable.get()
+        variable.set(7)
+        bind_shared_variable_and_expression(TestVariable, self.contexts[2])
+
+        assert variable_value == 5
+        assert self.vm.value == 7
+        assert self.widgets[2].variable is variable
+
+    def test_destroy_first_widget(self):
+        """should move delayed callback to next widget when first widget is destroyed"""
+        for context in self.contexts:
+            context.expression_body = 'vm.value}:{debounce=300, focusout=True'
+        bindings = self._bind_all()
+        variable = self.widgets[0].variable
+
+        variable.set(1)
+        bindings[0].destroy()
+        variable.set(2)
+
+        assert not self.widgets[0].timers
+        assert [delay for delay, _ in self.widgets[1].timers.values()] == [300]
+        assert self.vm.value is None
+
+        self.widgets[1].bindings['<FocusOut>']()
+
+        assert self.vm.value == 2
+        assert not self.widgets[1].timers
+
+    def test_new_variable_after_destroy(self):
+        """should create new variable when previous one is released"""
+        for binding in self._bind_all():
+            binding.destroy()
+        variable = self.widgets[0].variable
+
+        bind_shared_variable_and_expression(TestVariable, self.contexts[0])
+
+        assert self.widgets[0].variable is not variable
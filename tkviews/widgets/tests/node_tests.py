@@ -3,12 +3,17 @@ from typing import cast
 from unittest.mock import Mock, call, patch
 
 from pytest import fixture, mark
+from injectool import add_singleton
+from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.rendering.pipeline import RenderingPipeline
 
-from tkviews.core import TkRenderingContext
+from tkviews.core import BatchTkapp, TkRenderingContext
+from tkviews.headless import FakeTk
 from tkviews.widgets import node
-from tkviews.widgets.node import WidgetNode, Root, get_widget_pipeline
-from tkviews.widgets.node import setup_widget_setter, setup_widget_destroy, apply_text
+from tkviews.widgets.node import WidgetNode, Root, get_widget_pipeline, create_tk, use_batching
+from tkviews.widgets.node import setup_widget_setter, setup_widget_destroy, apply_text, render_widget_children, \
+    apply_widget_attributes, is_widget_option, add_setter_route, get_setter_route, set_node_attribute, \
+    set_widget_attribute, configure_widget, remove_setter_route
 
 
 @fixture
@@ -119,6 +124,45 @@ class WidgetNodeTests:
         assert self.node.instance.bind_all.call_args == call(event, command)
 
 
+@mark.usefixtures('container_fixture')
+class UseBatchingTests:
+    """use_batching tests"""
+
+    @staticmethod
+    def test_root_interpreter():
+        """should wrap root interpreter with batch"""
+        add_singleton(create_tk, FakeTk)
+        use_batching()
+
+        root = Root(Mock())
+
+        assert isinstance(root.instance.tk, BatchTkapp)
+        root.instance.destroy()
+
+    @staticmethod
+    def test_batches_widgets_options():
+        """should set widgets options with one interpreter call"""
+        add_singleton(create_tk, FakeTk)
+        use_batching()
+        root = Root(Mock())
+        tkapp = root.instance.tk.tkapp
+        widget_nodes = [
+            get_widget_pipeline().run(
+                TkRenderingContext({'xml_node': XmlNode('tkinter', 'Label'), 'master': root.instance})
+            ) for _ in range(10)
+        ]
+        round_trips = tkapp.round_trips
+
+        for widget_node in widget_nodes:
+            configure_widget(widget_node, 'text', 'two words')
+        root.instance.update()
+
+        assert tkapp.round_trips - round_trips <= 3
+        assert tkapp.calls['label'] == 10
+        assert all(widget.options['-text'] == 'two words' for widget in tkapp.widgets.values() if widget.path != '.')
+        root.instance.destroy()
+
+
 def test_get_widget_setup():
     """should return rendering pipeline"""
     actual = get_widget_pipeline()
@@ -127,6 +171,43 @@ def test_get_widget_setup():
     assert isinstance(actual, RenderingPipeline)
 
 
+class OptionsWidget:
+    class_key = None
+
+
+class IsWidgetOptionTests:
+    """is_widget_option() tests"""
+
+    @staticmethod
+    @mark.parametrize('xml_attr, expected', [
+        (XmlAttr('text', 'value'), True),
+        (XmlAttr('width', '10'), True),
+        (XmlAttr('text', '{1 + 1}'), False),
+        (XmlAttr('text', 'once:{1 + 1}'), False),
+        (XmlAttr('text', 'value', 'tkviews.config'), False),
+        (XmlAttr('bind', 'value'), False),
+        (XmlAttr('class_key', 'value'), False)
+    ]) # yapf: disable
+    def test_checks_attribute(xml_attr: XmlAttr, expected: bool):
+        """should return true for static attribute that is not node or widget attribute"""
+        assert is_widget_option(WidgetNode, OptionsWidget, xml_attr) == expected
+
+
+class ApplyWidgetAttributesTests:
+    """apply_widget_attributes() tests"""
+
+    @staticmethod
+    def test_skips_widget_options():
+        """should apply only attributes that are not passed to widget constructor"""
+        xml_node = Mock(attrs = [XmlAttr('text', 'value'), XmlAttr('class_key', 'value')])
+        test_node = WidgetNode(cast(Widget, OptionsWidget()), xml_node)
+        test_node.set_attr = Mock()
+
+        apply_widget_attributes(test_node, TkRenderingContext())
+
+        assert test_node.set_attr.call_args_list == [call('class_key', 'value')]
+
+
 @fixture
 def setter_fixture(request):
     inst = TestWidget()
@@ -166,6 +247,90 @@ class SetupWidgetSetterTests:
 
         assert self.inst.configure.call_args == call(**{key: value})
 
+    def test_uses_resolved_route(self):
+        """should resolve route once for node type, widget type and key"""
+        self.node.set_attr('cached_key', 1)
+        self.inst.cached_key = None
+
+        self.node.set_attr('cached_key', 2)
+
+        assert self.inst.configure.call_args == call(cached_key = 2)
+        assert self.inst.cached_key is None
+
+
+class RoutesWidget:
+    def __init__(self):
+        self.instance_key = None
+        self.configure = Mock()
+
+
+@fixture
+def routes_fixture():
+    custom_routes = list(node._CUSTOM_ROUTES)  # pylint: disable=protected-access
+    yield
+    node._CUSTOM_ROUTES[:] = custom_routes  # pylint: disable=protected-access
+    node._ROUTES.clear()  # pylint: disable=protected-access
+
+
+@mark.usefixtures('routes_fixture')
+class GetSetterRouteTests:
+    """get_setter_route() tests"""
+
+    @staticmethod
+    @mark.parametrize('key, expected', [
+        ('node_key', set_node_attribute),
+        ('instance_key', set_widget_attribute),
+        ('option_key', configure_widget)
+    ]) # yapf: disable
+    def test_returns_route(key, expected):
+        """should return route for node attribute, widget attribute or widget option"""
+        test_node = TestNode(cast(Widget, RoutesWidget()))
+
+        assert get_setter_route(test_node, key) == expected
+
+    @staticmethod
+    def test_returns_custom_route():
+        """should return registered route for node and widget types"""
+        route = Mock()
+        add_setter_route('instance_key', route, widget_type = RoutesWidget)
+
+        actual = get_setter_route(TestNode(cast(Widget, RoutesWidget())), 'instance_key')
+        other_actual = get_setter_route(TestNode(cast(Widget, TestWidget())), 'instance_key')
+
+        assert actual == route
+        assert other_actual == set_widget_attribute
+
+    @staticmethod
+    def test_custom_route_is_used_by_setter():
+        """widget node setter should use registered route"""
+        class CustomRouteWidget(RoutesWidget):
+            pass
+
+        route = Mock()
+        test_node = TestNode(cast(Widget, CustomRouteWidget()))
+        setup_widget_setter(test_node, TkRenderingContext())
+        test_node.set_attr('option_key', 1)
+
+        add_setter_route('option_key', route, widget_type = CustomRouteWidget)
+        test_node.set_attr('option_key', 2)
+
+        assert route.call_args == call(test_node, 'option_key', 2)
+
+    @staticmethod
+    def test_removes_custom_route():
+        """should not use removed route"""
+        route = Mock()
+        add_setter_route('instance_key', route, widget_type = RoutesWidget)
+        test_node = TestNode(cast(Widget, RoutesWidget()))
+        setup_widget_setter(test_node, TkRenderingContext())
+        test_node.set_attr('instance_key', 1)
+
+        remove_setter_route('instance_key', route, widget_type = RoutesWidget)
+        test_node.set_attr('instance_key', 2)
+
+        assert route.call_args_list == [call(test_node, 'instance_key', 1)]
+        assert get_setter_route(test_node, 'instance_key') is set_widget_attribute
+
 
 def test_setup_widget_destroy():
     """should call widget.destroy() on node destroy"""
@@ -178,6 +343,53 @@ def test_setup_widget_destroy():
     assert inst.destroy.called
 
 
+def test_widget_destroy_cancels_children_rendering():
+    """should cancel children rendering on node destroy"""
+    test_node = TestNode(cast(Widget, TestWidget()))
+    test_node.children_rendering = Mock()
+
+    setup_widget_destroy(test_node, TkRenderingContext())
+    test_node.destroy()
+
+    assert test_node.children_rendering.cancel.called
+
+
+@fixture
+def render_children_fixture(request):
+    with patch(node.__name__ + '.render_children') as render_children_mock:
+        with patch(node.__name__ + '.ChildrenRendering') as children_rendering_mock:
+            request.cls.render_children = render_children_mock
+            request.cls.children_rendering = children_rendering_mock
+            request.cls.node = TestNode(Mock())
+            yield
+
+
+@mark.usefixtures('render_children_fixture')
+class RenderWidgetChildrenTests:
+    """render_widget_children() tests"""
+
+    node: TestNode
+    render_children: Mock
+    children_rendering: Mock
+
+    def test_renders_children(self):
+        """should render all children if render budget is not set"""
+        render_widget_children(self.node, TkRenderingContext())
+
+        assert self.render_children.called
+        assert not self.children_rendering.called
+
+    def test_renders_children_incrementally(self):
+        """should render children in slices if render budget is set"""
+        self.node.render_budget = '10'
+
+        render_widget_children(self.node, TkRenderingContext())
+
+        assert not self.render_children.called
+        assert self.children_rendering.call_args[0][-1] == 10.0
+        assert self.node.children_rendering.start.called
+
+
 @fixture
 def apply_text_fixture(request):
     test_node = TestNode(Mock(text=''))
@@ -1,8 +1,22 @@
-from unittest.mock import Mock, call
+import asyncio
+from unittest.mock import Mock, call, patch
 
 from pytest import mark, raises
 
-from tkviews.widgets.setters import bind, bind_all, config, CallbackError
+from tkviews.core.jobs import job
+from tkviews.widgets import setters
+from tkviews.widgets.setters import bind, bind_all, config, config_command, use_job_commands, CallbackError
+
+
+@job(executor = 'process')
+def export():
+    """Process pool handler"""
+
+
+class ProcessViewModel:
+    @job(executor = 'process')
+    def export(self):
+        pass
 
 
 class BindTests:
@@ -28,6 +42,55 @@ class BindTests:
 
             bind(Mock(bind=node_bind), 'event', callback)
 
+    @staticmethod
+    @mark.usefixtures('container_fixture')
+    def test_runs_coroutine():
+        """should run coroutine handler in event loop"""
+        handler = Mock()
+
+        async def callback(*args):
+            await asyncio.sleep(0)
+            handler(*args)
+
+        async def run():
+            node = Mock()
+            bind(node, 'event', callback)
+            node.bind.call_args[0][1]('event')
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        assert handler.call_args == call('event')
+
+    @staticmethod
+    @mark.usefixtures('container_fixture')
+    def test_reports_coroutine_error():
+        """should report coroutine error as CallbackError with event info"""
+        root = Mock()
+
+        async def callback():
+            raise ValueError()
+
+        async def run():
+            node = Mock()
+            bind(node, 'event', callback)
+            node.bind.call_args[0][1]()
+            await asyncio.sleep(0.01)
+
+        with patch('tkinter._default_root', root, create = True):
+            asyncio.run(run())
+
+        error = root.report_callback_exception.call_args[0][1]
+        assert isinstance(error, CallbackError)
+        assert isinstance(error.cause_error, ValueError)
+
+
+@mark.parametrize('handler', [export, ProcessViewModel().export])
+def test_bind_rejects_process_job(handler):
+    """bind() should raise CallbackError for process pool handler, tkinter event can not be pickled"""
+    with raises(CallbackError):
+        bind(Mock(), 'event', handler)
+
 
 def test_bind_all():
     """bind_all() should call bind_all of instance"""
@@ -49,3 +112,54 @@ def test_config(key, value):
     config(node, key, value)
 
     assert node.instance.config.call_args == call(**{key: value})
+
+
+def test_config_command():
+    """config_command() should wrap coroutine handler"""
+    node = Mock(instance = Mock(spec = ['configure']))
+
+    async def callback():
+        pass
+
+    config_command(node, 'command', callback)
+
+    command = node.instance.configure.call_args[1]['command']
+    assert command is not callback
+    assert callable(command)
+
+
+def test_config_command_passes_function():
+    """config_command() should pass other handlers as is"""
+    node = Mock(instance = Mock(spec = ['configure']))
+    callback = Mock()
+
+    config_command(node, 'command', callback)
+
+    assert node.instance.configure.call_args == call(command = callback)
+
+
+def test_config_command_rejects_bound_process_job():
+    """config_command() should raise CallbackError for process pool method, it can not be pickled"""
+    node = Mock(instance = Mock(spec = ['configure']))
+
+    with raises(CallbackError):
+        config_command(node, 'command', ProcessViewModel().export)
+
+
+def test_config_command_process_job():
+    """config_command() should wrap process pool function"""
+    node = Mock(instance = Mock(spec = ['configure']))
+
+    config_command(node, 'command', export)
+
+    assert node.instance.configure.call_args[1]['command'] is not export
+
+
+def test_use_job_commands():
+    """use_job_commands() should add config_command route for command once"""
+    with patch(setters.__name__ + '.add_setter_route') as add_setter_route, \
+            patch(setters.__name__ + '.remove_setter_route') as remove_setter_route:
+        use_job_commands()
+
+    assert remove_setter_route.call_args == call('command', config_command)
+    assert add_setter_route.call_args == call('command', config_command)
@@ -0,0 +1,129 @@
+from tkinter import IntVar, StringVar, Tcl
+from unittest.mock import Mock, call
+
+from pytest import fixture, mark
+
+from tkviews.widgets.binding import VariableBinding
+from tkviews.widgets.traces import get_variable_trace
+
+
+@fixture
+def trace_fixture(request):
+    interpreter = Tcl()
+    request.cls.interpreter = interpreter
+    request.cls.var = StringVar(interpreter)
+    request.cls.trace = get_variable_trace(request.cls.var)
+
+
+def get_traces_count(var: StringVar) -> int:
+    return len(var.trace_info())
+
+
+@mark.usefixtures('trace_fixture')
+class VariableTraceTests:
+    """VariableTrace tests"""
+
+    def test_one_trace(self):
+        """should add one Tcl trace for all callbacks"""
+        self.trace.add(Mock())
+        self.trace.add(Mock())
+
+        assert get_traces_count(self.var) == 1
+
+    def test_dispatch(self):
+        """should call all callbacks on variable write"""
+        callbacks = [Mock(), Mock()]
+        for callback in callbacks:
+            self.trace.add(callback)
+
+        self.var.set('value')
+
+        assert all(callback.call_args == call() for callback in callbacks)
+
+    def test_get(self):
+        """should read variable once per write"""
+        values = []
+        self.trace.add(lambda: values.append(self.trace.get()))
+        self.trace.add(lambda: values.append(self.trace.get()))
+        self.var.get = Mock(return_value = 'value')
+
+        self.var.set('value')
+
+        assert values == ['value', 'value']
+        assert self.var.get.call_count == 1
+
+    def test_remove(self):
+        """should not call removed callback"""
+        callback, removed = Mock(), Mock()
+        self.trace.add(callback)
+        key = self.trace.add(removed)
+
+        self.trace.remove(key)
+        self.var.set('value')
+
+        assert callback.called
+        assert not removed.called
+        assert get_traces_count(self.var) == 1
+
+    def test_remove_last(self):
+        """should remove Tcl trace with last callback"""
+        keys = [self.trace.add(Mock()), self.trace.add(Mock())]
+
+        for key in keys:
+            self.trace.remove(key)
+
+        assert get_traces_count(self.var) == 0
+        assert get_variable_trace(self.var) is not self.trace
+
+    def test_remove_while_dispatching(self):
+        """should not call callback removed by previous callback"""
+        removed = Mock()
+        keys = []
+        self.trace.add(lambda: self.trace.remove(keys[0]))
+        keys.append(self.trace.add(removed))
+
+        self.var.set('value')
+
+        assert not removed.called
+
+
+@mark.usefixtures('trace_fixture')
+class SharedVariableBindingTests:
+    """VariableBinding shared trace tests"""
+
+    def test_bindings_share_trace(self):
+        """should use one Tcl trace for bindings of one variable"""
+        callbacks = [Mock(), Mock()]
+        bindings = [VariableBinding(callback, self.var) for callback in callbacks]
+        for binding in bindings:
+            binding.bind()
+
+        self.var.set('value')
+
+        assert get_traces_count(self.var) == 1
+        assert all(callback.call_args == call('value') for callback in callbacks)
+
+    def test_last_destroy(self):
+        """should remove Tcl trace when last binding is destroyed"""
+        bindings = [VariableBinding(Mock(), self.var), VariableBinding(Mock(), self.var)]
+        for binding in bindings:
+            binding.bind()
+
+        bindings[0].destroy()
+        traces_after_first = get_traces_count(self.var)
+        bindings[1].destroy()
+
+        assert traces_after_first == 1
+        assert get_traces_count(self.var) == 0
+
+    def test_variables_of_other_type(self):
+        """should pass value of own variable type to bindings of variables with the same name"""
+        int_var = IntVar(self.interpreter, name = str(self.var))
+        string_callback, int_callback = Mock(), Mock()
+        VariableBinding(string_callback, self.var).bind()
+        VariableBinding(int_callback, int_var).bind()
+
+        self.var.set('5')
+
+        assert string_callback.call_args == call('5')
+        assert int_callback.call_args == call(5)
@@ -0,0 +1,72 @@
+"""Shared write traces of tkinter variables"""
+
+from itertools import count
+from tkinter import Variable
+from typing import Any, Callable, Dict, Tuple
+
+_UNREAD = object()
+
+
+class VariableTrace:
+    """One write trace of tkinter variable that calls all subscribed callbacks. Variables of other type use own trace"""
+
+    def __init__(self, var: Variable):
+        self.var: Variable = var
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._keys = count()
+        self._trace_id = None
+        self._value: Any = _UNREAD
+
+    @property
+    def count(self) -> int:
+        """Count of subscribed callbacks"""
+        return len(self._callbacks)
+
+    def add(self, callback: Callable[[], None]) -> int:
+        """Subscribes callback to variable writes and returns key to remove it"""
+        key = next(self._keys)
+        self._callbacks[key] = callback
+        if self._trace_id is None:
+            self._trace_id = self.var.trace_add('write', self._dispatch)
+        return key
+
+    def remove(self, key: int):
+        """Removes callback. Trace is removed with last callback"""
+        self._callbacks.pop(key, None)
+        if self._callbacks or self._trace_id is None:
+            return
+        self.var.trace_remove('write', self._trace_id)
+        self._trace_id = None
+        _TRACES.pop(_get_key(self.var), None)
+
+    def get(self) -> Any:
+        """Returns variable value. Value is read once for all callbacks of one write"""
+        if self._value is _UNREAD:
+            self._value = self.var.get()
+        return self._value
+
+    def _dispatch(self, *_):
+        self._value = _UNREAD
+        try:
+            for key, callback in list(self._callbacks.items()):
+                if key in self._callbacks:
+                    callback()
+        finally:
+            self._value = _UNREAD
+
+
+_TRACES: Dict[Tuple[int, str, type], VariableTrace] = {}
+
+
+def _get_key(var: Variable) -> Tuple[int, str, type]:
+    return id(getattr(var, '_tk', None)), str(var), type(var)
+
+
+def get_variable_trace(var: Variable) -> VariableTrace:
+    """Returns trace shared by variables of the same type and name"""
+    key = _get_key(var)
+    try:
+        return _TRACES[key]
+    except KeyError:
+        trace = _TRACES[key] = VariableTrace(var)
+        return trace